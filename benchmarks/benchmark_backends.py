@@ -0,0 +1,79 @@
+"""Benchmark of the model backends of model_training.
+
+Compares fit time, prediction throughput, serialized model size and
+hold-out accuracy of every backend. The Titanic training set is replicated
+to simulate larger tables.
+
+Usage:
+    python benchmarks/benchmark_backends.py [replication factor]
+"""
+
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import config  # noqa: E402
+from data_preprocessing import load_data  # noqa: E402
+from model_evaluation import generate_predictions  # noqa: E402
+from model_training import MODEL_BACKENDS, get_backend, train_model  # noqa: E402
+
+FEATURES = config.FEATURES + ["Embarked"]
+
+
+def split_data(data: pd.DataFrame, replication: int):
+    """Split the data in train/hold-out parts and replicate the train part."""
+    rng = np.random.RandomState(0)
+    holdout_mask = rng.rand(len(data)) < 0.25
+    train_part = pd.concat([data[~holdout_mask]] * replication, ignore_index=True)
+    return train_part, data[holdout_mask].reset_index(drop=True)
+
+
+def benchmark_backend(backend: str, train_part: pd.DataFrame, holdout: pd.DataFrame):
+    """Run the benchmark for one backend and return its measurements."""
+    model_params = dict(config.MODEL_PARAMS[backend])
+    X_train, y_train, X_test = get_backend(backend)["preprocess"](
+        train_part, holdout, FEATURES, config.TARGET, config.CATEGORICAL_FEATURES
+    )
+    # Categories missing from the hold-out rows are absent from one-hot columns
+    X_test = X_test.reindex(columns=X_train.columns, fill_value=0)
+
+    start = time.perf_counter()
+    model = train_model(X_train, y_train, model_params, backend)
+    fit_time = time.perf_counter() - start
+
+    X_large = pd.concat([X_test] * max(1, 100_000 // len(X_test)), ignore_index=True)
+    start = time.perf_counter()
+    generate_predictions(model, X_large)
+    predict_time = time.perf_counter() - start
+
+    predictions = generate_predictions(model, X_test)
+    return {
+        "backend": backend,
+        "fit_s": fit_time,
+        "predict_rows_per_s": len(X_large) / predict_time,
+        "model_kb": len(pickle.dumps(model)) / 1024,
+        "accuracy": float(np.mean(predictions == holdout[config.TARGET])),
+    }
+
+
+def main():
+    """Run the benchmark for every backend and print a summary table."""
+    replication = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    train_data, _ = load_data(config.TRAIN_DATA_PATH, config.TEST_DATA_PATH)
+    train_part, holdout = split_data(train_data, replication)
+    print(f"Training rows: {len(train_part)} - hold-out rows: {len(holdout)}")
+
+    results = pd.DataFrame(
+        [benchmark_backend(name, train_part, holdout) for name in MODEL_BACKENDS]
+    )
+    print(results.to_string(index=False, float_format=lambda x: f"{x:,.3f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark of dense and sparse one-hot encoding at increasing cardinality.
+
+Adds a synthetic high-cardinality column (Zipf distributed, like Ticket or
+Cabin) to the replicated Titanic training set, then compares the dense
+pd.get_dummies path with the sparse CSR path of data_preprocessing: encoding
+time, matrix memory, training time and prediction time.
+
+Usage:
+    python benchmarks/benchmark_sparse_encoding.py [number of rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import config  # noqa: E402
+from data_preprocessing import load_data, preprocess_features_sparse  # noqa: E402
+from model_evaluation import generate_predictions  # noqa: E402
+from model_training import train_random_forest  # noqa: E402
+
+CARDINALITIES = [10, 100, 1_000, 3_000]
+MODEL_PARAMS = {"n_estimators": 10, "max_depth": 5, "random_state": 1}
+FEATURES = config.FEATURES + ["Code"]
+
+
+def make_data(train_data: pd.DataFrame, n_rows: int, cardinality: int):
+    """Replicate the training set and add a column with the given cardinality."""
+    rng = np.random.RandomState(0)
+    data = train_data.sample(n_rows, replace=True, random_state=0)
+    codes = np.minimum(rng.zipf(1.3, size=n_rows), cardinality)
+    data["Code"] = pd.Series(codes, index=data.index).map(lambda code: f"T{code}")
+    return data.reset_index(drop=True)
+
+
+def timed(function, *args):
+    """Call a function and return its result and duration in seconds."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_dense(data: pd.DataFrame) -> dict:
+    """Benchmark the dense get_dummies encoding."""
+    X, encode_time = timed(pd.get_dummies, data[FEATURES])
+    y = data[config.TARGET]
+    model, fit_time = timed(train_random_forest, X, y, MODEL_PARAMS)
+    _, predict_time = timed(generate_predictions, model, X)
+    return {
+        "encoding": "dense",
+        "columns": X.shape[1],
+        "matrix_mb": X.memory_usage(index=False).sum() / 1e6,
+        "encode_s": encode_time,
+        "fit_s": fit_time,
+        "predict_s": predict_time,
+    }
+
+
+def benchmark_sparse(data: pd.DataFrame) -> dict:
+    """Benchmark the sparse CSR encoding (rare categories hashed)."""
+    (X, y, _, _), encode_time = timed(
+        preprocess_features_sparse, data, data.head(0), FEATURES, config.TARGET, 5, 32
+    )
+    model, fit_time = timed(train_random_forest, X, y, MODEL_PARAMS)
+    _, predict_time = timed(generate_predictions, model, X)
+    return {
+        "encoding": "sparse",
+        "columns": X.shape[1],
+        "matrix_mb": (X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 1e6,
+        "encode_s": encode_time,
+        "fit_s": fit_time,
+        "predict_s": predict_time,
+    }
+
+
+def main():
+    """Run the benchmark for every cardinality and print a summary table."""
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    train_data, _ = load_data(config.TRAIN_DATA_PATH, config.TEST_DATA_PATH)
+
+    results = []
+    for cardinality in CARDINALITIES:
+        data = make_data(train_data, n_rows, cardinality)
+        for benchmark in (benchmark_dense, benchmark_sparse):
+            results.append({"cardinality": cardinality, **benchmark(data)})
+
+    print(f"Rows: {n_rows}")
+    print(
+        pd.DataFrame(results).to_string(index=False, float_format=lambda x: f"{x:.3f}")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark of the validation and imputation overhead when loading data.
+
+Replicates the Titanic training set into a larger CSV file and compares the
+time spent validating and imputing each chunk with the time spent reading it.
+
+Usage:
+    python benchmarks/benchmark_validation.py [replication factor]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import config  # noqa: E402
+from data_validation import (  # noqa: E402
+    fit_imputation,
+    load_validated_csv,
+    validation_overhead,
+)
+
+
+def main():
+    """Run the benchmark and print the validation overhead."""
+    replication = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    train_data = pd.read_csv(config.TRAIN_DATA_PATH)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = Path(temp_dir) / "train.csv"
+        pd.concat([train_data] * replication, ignore_index=True).to_csv(
+            csv_path, index=False
+        )
+
+        data, _ = load_validated_csv(csv_path, config.DATA_SCHEMA)
+        imputation = fit_imputation(data)
+        for label, fill_values in (("validation", None), ("+ imputation", imputation)):
+            _, report = load_validated_csv(
+                csv_path, config.DATA_SCHEMA, fill_values, config.LOAD_CHUNK_SIZE
+            )
+            print(
+                f"{label:>12}: {len(data)} rows, {len(report)} chunks, "
+                f"load {report['load_seconds'].sum():.3f}s, "
+                f"validation {report['validation_seconds'].sum():.3f}s, "
+                f"overhead {validation_overhead(report):.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,12 @@ setup(
     install_requires=[
         "numpy>=1.21.0",
         "pandas>=1.3.0",
+        "scipy>=1.5.0",
         "scikit-learn>=1.0.0",
+        "threadpoolctl>=2.0.0",
     ],
     extras_require={
+        "arrow": ["pyarrow>=7.0.0"],
         "dev": [
             "flake8>=4.0.0",
             "black>=22.0.0",
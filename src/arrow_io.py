@@ -0,0 +1,307 @@
+"""Arrow IPC input and output for scoring.
+
+Passengers are read as Arrow record batches (IPC stream or file/Feather v2
+format) from a file, from stdin ("-") or from a local socket
+("unix:/path/to.sock"). Numeric columns are viewed as NumPy arrays without
+copies and string columns are dictionary-encoded, so the model input matrix
+is built directly from Arrow buffers. Predictions are returned as Arrow
+record batches reusing the PassengerId buffer.
+
+Requires the optional pyarrow dependency (pip install pyarrow).
+
+Usage:
+    python src/arrow_io.py model.joblib passengers.arrow predictions.arrow
+    producer | python src/arrow_io.py model.joblib - - | consumer
+"""
+
+import contextlib
+import socket
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+
+from data_validation import get_imputation
+from model_evaluation import generate_predictions
+from model_training import load_model
+
+SOCKET_PREFIX = "unix:"
+
+Source = Union[str, Path, BinaryIO]
+
+
+def _require_pyarrow() -> None:
+    """Raise an explicit error if pyarrow is not installed."""
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow IPC support: pip install pyarrow"
+        )
+
+
+def _open_stream(target: Source, mode: str, stack: contextlib.ExitStack) -> Any:
+    """Open a file, stdin/stdout ("-") or unix socket as a binary stream."""
+    if not isinstance(target, (str, Path)):
+        return target
+    target = str(target)
+
+    if target == "-":
+        return sys.stdin.buffer if mode == "rb" else sys.stdout.buffer
+    if target.startswith(SOCKET_PREFIX):
+        connection = stack.enter_context(socket.socket(socket.AF_UNIX))
+        connection.connect(target.split(":", 1)[1])
+        return stack.enter_context(connection.makefile(mode))
+    if mode == "rb":
+        # Memory mapping lets Arrow reference the file pages without copies
+        return stack.enter_context(pa.memory_map(target, "r"))
+    return stack.enter_context(pa.OSFile(target, "wb"))
+
+
+def read_arrow(source: Source) -> Iterator["pa.RecordBatch"]:
+    """
+    Read record batches from an Arrow IPC file, stream, stdin or socket.
+
+    Args:
+        source: File path, "-" for stdin, "unix:<path>" for a local socket,
+            or an open binary stream
+
+    Yields:
+        Record batches, in order
+
+    Raises:
+        FileNotFoundError: If the source file is not found
+    """
+    _require_pyarrow()
+    if isinstance(source, (str, Path)) and str(source) != "-":
+        if not str(source).startswith(SOCKET_PREFIX) and not Path(source).exists():
+            raise FileNotFoundError(f"Arrow file not found: {source}")
+
+    with contextlib.ExitStack() as stack:
+        stream = _open_stream(source, "rb", stack)
+        if isinstance(stream, pa.MemoryMappedFile):
+            try:
+                reader = pa.ipc.open_file(stream)
+            except pa.ArrowInvalid:
+                stream.seek(0)
+            else:
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+                return
+
+        yield from pa.ipc.open_stream(stream)
+
+
+def column_to_numpy(column: "pa.Array") -> np.ndarray:
+    """
+    View a numeric Arrow column as a NumPy array.
+
+    Columns without nulls are not copied; nulls become NaN (with a copy).
+
+    Args:
+        column: Numeric Arrow array
+
+    Returns:
+        NumPy array
+    """
+    if column.null_count == 0:
+        return column.to_numpy(zero_copy_only=True)
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _feature_sources(
+    feature_names: List[str], column_names: List[str]
+) -> List[Tuple[str, Any]]:
+    """
+    Map each encoded feature name to (column, category or None).
+
+    Raises:
+        ValueError: If a feature is neither a column nor a one-hot category
+            of a column of the data
+    """
+    sources = []
+    missing = []
+    for name in feature_names:
+        if name in column_names:
+            sources.append((name, None))
+            continue
+        for column in column_names:
+            prefix = f"{column}_"
+            if name.startswith(prefix):
+                sources.append((column, name.replace(prefix, "", 1)))
+                break
+        else:
+            missing.append(name)
+
+    if missing:
+        raise ValueError(f"Features not found in Arrow data: {missing}")
+
+    return sources
+
+
+def encode_record_batch(
+    batch: "pa.RecordBatch",
+    feature_names: List[str],
+    imputation: Optional[Dict[str, Any]] = None,
+) -> np.ndarray:
+    """
+    Build the model input matrix from a record batch.
+
+    Numeric features are read from zero-copy NumPy views. One-hot features
+    ("<column>_<category>", as produced by preprocess_features) are computed
+    by comparing dictionary indices, without materializing strings. Nulls
+    of the columns in imputation are filled with its values, as by
+    data_validation.impute_missing.
+
+    Args:
+        batch: Record batch of raw passenger data
+        feature_names: Encoded feature names expected by the model
+        imputation: Fill values returned by fit_imputation (no imputation
+            if None)
+
+    Returns:
+        Matrix of shape (rows, features)
+
+    Raises:
+        ValueError: If a feature does not come from a column of the batch
+            (categories never seen in a column are 0)
+    """
+    column_names = batch.schema.names
+    imputation = imputation or {}
+    X = np.zeros((batch.num_rows, len(feature_names)), dtype=np.float32)
+    dictionaries = {}
+
+    for j, (column, category) in enumerate(
+        _feature_sources(feature_names, column_names)
+    ):
+        array = batch.column(column)
+        if category is None:
+            X[:, j] = column_to_numpy(array)
+            if column in imputation and array.null_count:
+                X[np.isnan(X[:, j]), j] = imputation[column]
+            continue
+
+        if column not in dictionaries:
+            if not pa.types.is_dictionary(array.type):
+                array = pc.dictionary_encode(array)
+            indices = array.indices.fill_null(-1)
+            values = [str(value) for value in array.dictionary.to_pylist()]
+            dictionaries[column] = (column_to_numpy(indices), values)
+
+        indices, values = dictionaries[column]
+        if category in values:
+            X[:, j] = indices == values.index(category)
+        if column in imputation and str(imputation[column]) == category:
+            X[indices == -1, j] = 1
+
+    return X
+
+
+def predictions_to_record_batch(
+    passenger_ids: "pa.Array", predictions: np.ndarray
+) -> "pa.RecordBatch":
+    """
+    Wrap predictions in an Arrow record batch.
+
+    Args:
+        passenger_ids: PassengerId column of the scored batch (reused as is)
+        predictions: Model predictions
+
+    Returns:
+        Record batch with PassengerId and Survived columns
+    """
+    _require_pyarrow()
+    return pa.RecordBatch.from_arrays(
+        [passenger_ids, pa.array(np.asarray(predictions))],
+        names=["PassengerId", "Survived"],
+    )
+
+
+def write_arrow(batches: Iterator["pa.RecordBatch"], sink: Source) -> int:
+    """
+    Write record batches to an Arrow IPC file, stream, stdout or socket.
+
+    Files are written in the IPC file format (readable as Feather v2),
+    stdout and sockets in the IPC stream format.
+
+    Args:
+        batches: Record batches sharing one schema
+        sink: File path, "-" for stdout, "unix:<path>" for a local socket,
+            or an open binary stream
+
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    is_file = isinstance(sink, (str, Path)) and str(sink) != "-"
+    is_file = is_file and not str(sink).startswith(SOCKET_PREFIX)
+
+    n_rows = 0
+    with contextlib.ExitStack() as stack:
+        stream = _open_stream(sink, "wb", stack)
+        writer = None
+        for batch in batches:
+            if writer is None:
+                new_writer = pa.ipc.new_file if is_file else pa.ipc.new_stream
+                writer = stack.enter_context(new_writer(stream, batch.schema))
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+
+    return n_rows
+
+
+def score_record_batches(
+    model: Any, batches: Iterator["pa.RecordBatch"]
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Score record batches of raw passenger data.
+
+    Missing values are filled with the values stored on the model by
+    data_validation.store_imputation, if any.
+
+    Args:
+        model: Trained model with feature_names_in_ (one-hot features)
+        batches: Record batches with a PassengerId column
+
+    Yields:
+        Record batches of predictions, one per input batch
+    """
+    feature_names = list(model.feature_names_in_)
+    imputation = get_imputation(model)
+    for batch in batches:
+        X = pd.DataFrame(
+            encode_record_batch(batch, feature_names, imputation),
+            columns=feature_names,
+            copy=False,
+        )
+        predictions = generate_predictions(model, X)
+        yield predictions_to_record_batch(batch.column("PassengerId"), predictions)
+
+
+def score_arrow(model: Any, source: Source, sink: Source) -> int:
+    """
+    Score passengers read from an Arrow source and write the predictions.
+
+    Args:
+        model: Trained model with feature_names_in_ (one-hot features)
+        source: Input (see read_arrow)
+        sink: Output (see write_arrow)
+
+    Returns:
+        Number of passengers scored
+    """
+    return write_arrow(score_record_batches(model, read_arrow(source)), sink)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4:
+        sys.exit("Usage: python src/arrow_io.py MODEL INPUT OUTPUT")
+    n_scored = score_arrow(load_model(Path(sys.argv[1])), sys.argv[2], sys.argv[3])
+    print(f"Passengers scored: {n_scored}", file=sys.stderr)
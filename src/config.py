@@ -16,11 +16,104 @@ OUTPUT_DIR = PROJECT_ROOT / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 SUBMISSION_PATH = OUTPUT_DIR / "submission.csv"
 
+# Expected columns of the raw datasets, checked when loading
+DATA_SCHEMA = {
+    "PassengerId": {"type": "numeric", "min": 1},
+    "Survived": {"type": "numeric", "allowed": [0, 1], "required": False},
+    "Pclass": {"type": "numeric", "allowed": [1, 2, 3]},
+    "Sex": {"type": "category", "allowed": ["male", "female"]},
+    "Age": {"type": "numeric", "min": 0, "max": 100},
+    "SibSp": {"type": "numeric", "min": 0, "max": 20},
+    "Parch": {"type": "numeric", "min": 0, "max": 20},
+    "Fare": {"type": "numeric", "min": 0},
+    "Embarked": {"type": "category", "allowed": ["C", "Q", "S"]},
+}
+LOAD_CHUNK_SIZE = 100_000
+VALIDATION_REPORT_PATH = OUTPUT_DIR / "validation_report.csv"
+
 # Model parameters
 RANDOM_FOREST_PARAMS = {"n_estimators": 100, "max_depth": 5, "random_state": 1}
 
+# Features encoded as categories by backends with native categorical support
+CATEGORICAL_FEATURES = ["Sex", "Embarked", "Title", "Deck"]
+
+# Gradient boosting parameters (categorical columns are handled natively)
+HIST_GRADIENT_BOOSTING_PARAMS = {
+    "max_iter": 100,
+    "max_depth": 5,
+    "learning_rate": 0.1,
+    "random_state": 1,
+    "categorical_features": CATEGORICAL_FEATURES,
+}
+
+# Model backend: "random_forest" or "hist_gradient_boosting"
+MODEL_BACKEND = "random_forest"
+MODEL_PARAMS = {
+    "random_forest": RANDOM_FOREST_PARAMS,
+    "hist_gradient_boosting": HIST_GRADIENT_BOOSTING_PARAMS,
+}
+
+# Training mode of the random_forest backend: "in_memory", "distributed"
+# (sub-forests trained by workers and merged, see distributed_training.py) or
+# "out_of_core" (trees trained from a memory-mapped matrix, see
+# out_of_core_training.py)
+TRAINING_MODE = "in_memory"
+
+# Distributed training (directory shared by the driver and the workers). With
+# DISTRIBUTED_LOCAL_WORKERS = False, main.py only writes the worker tasks and
+# waits up to DISTRIBUTED_TIMEOUT seconds for workers started on other machines.
+DISTRIBUTED_WORK_DIR = OUTPUT_DIR / "distributed"
+DISTRIBUTED_N_WORKERS = 4
+DISTRIBUTED_LOCAL_WORKERS = True
+DISTRIBUTED_TIMEOUT = 3600
+
+# Out-of-core training (memory-mapped training matrix), each tree being fitted
+# on TRAINING_MATRIX_MAX_SAMPLES rows (count or fraction)
+TRAINING_MATRIX_DIR = OUTPUT_DIR / "training_matrix"
+TRAINING_MATRIX_MAX_SAMPLES = 0.5
+
+# Model evaluation (cross-validation is used when no out-of-bag predictions)
+CV_FOLDS = 5
+METRICS_CACHE_DIR = OUTPUT_DIR / "metrics_cache"
+
 # Features to use for training
 FEATURES = ["Pclass", "Sex", "SibSp", "Parch"]
 
+# Engineered features added to FEATURES (see feature_engineering.py), e.g.
+# ["Title", "Deck", "AgeBin", "FareBin", "FamilySize", "IsAlone"]
+ENGINEERED_FEATURES = []
+FEATURE_CACHE_DIR = OUTPUT_DIR / "feature_cache"
+
 # Target variable
 TARGET = "Survived"
+
+# Number of training rows (sampled) explained to report the contribution
+# importance of models that can be explained (see tree_explanations.py);
+# None or 0 skips it
+CONTRIBUTION_IMPORTANCE_ROWS = 1_000
+
+# Shadow scoring: challengers compared with the configured champion model
+SHADOW_CHALLENGERS = {
+    "challenger": {
+        "features": FEATURES + ["Embarked"],
+        "params": {"n_estimators": 200, "max_depth": 7, "random_state": 1},
+    },
+}
+SHADOW_REPORT_PATH = OUTPUT_DIR / "shadow_report.csv"
+
+# Model registry: saved models by key and version, with a bounded in-memory cache
+MODEL_REGISTRY_DIR = OUTPUT_DIR / "model_registry"
+MODEL_REGISTRY_MAX_BYTES = 512 * 1024 * 1024
+
+# Resources: jobs, threads, batch and chunk sizes are derived from the cgroup
+# CPU quota and memory limit (see resources.py), with PREDICTION_BATCH_SIZE and
+# LOAD_CHUNK_SIZE as upper bounds. A value set here overrides the derived one;
+# TITANIC_N_JOBS, TITANIC_THREADS, TITANIC_BATCH_SIZE and TITANIC_CHUNK_SIZE
+# environment variables override both.
+RESOURCE_OVERRIDES = {
+    "n_jobs": None,
+    "threads": None,
+    "batch_size": None,
+    "chunk_size": None,
+}
+PREDICTION_BATCH_SIZE = 100_000
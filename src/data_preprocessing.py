@@ -1,9 +1,11 @@
 """Data preprocessing module for Titanic dataset."""
 
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
 
 def load_data(train_path: Path, test_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -58,6 +60,193 @@ def preprocess_features(
     return X_train, y_train, X_test
 
 
+def encode_categorical_features(
+    train_data: pd.DataFrame,
+    test_data: pd.DataFrame,
+    features: list,
+    target: str,
+    categorical_features: list,
+) -> Tuple[pd.DataFrame, pd.Series, pd.DataFrame]:
+    """
+    Preprocess features for models with native categorical support.
+
+    Categorical columns are replaced by integer codes (one column per
+    feature) instead of being one-hot encoded. The categories are learned
+    on the training data; missing and unseen values are encoded as NaN.
+
+    Args:
+        train_data: Training dataset
+        test_data: Test dataset
+        features: List of feature column names to use
+        target: Name of the target column
+        categorical_features: Feature column names to encode as categories
+
+    Returns:
+        Tuple containing (X_train, y_train, X_test):
+            - X_train: Processed training features
+            - y_train: Training target variable
+            - X_test: Processed test features
+    """
+    y_train = train_data[target]
+
+    X_train = train_data[features].copy()
+    X_test = test_data[features].copy()
+
+    for column in features:
+        if column not in categorical_features:
+            continue
+        categories = pd.Index(X_train[column].dropna().unique()).sort_values()
+        for X in (X_train, X_test):
+            codes = categories.get_indexer(X[column]).astype(np.float64)
+            codes[codes < 0] = np.nan
+            X[column] = codes
+
+    return X_train, y_train, X_test
+
+
+def fit_sparse_encoder(
+    train_data: pd.DataFrame,
+    features: list,
+    min_frequency: int = 1,
+    n_hash_buckets: int = 0,
+) -> Dict[str, Any]:
+    """
+    Learn a sparse one-hot encoding of the features on the training data.
+
+    Numeric features are kept as one column. Categorical features get one
+    column per category seen at least min_frequency times in the training
+    data; rarer and unseen categories are hashed into n_hash_buckets extra
+    columns (or ignored if n_hash_buckets is 0).
+
+    Args:
+        train_data: Training dataset
+        features: List of feature column names to use
+        min_frequency: Minimum count for a category to get its own column
+        n_hash_buckets: Number of hashed columns per categorical feature
+
+    Returns:
+        Encoder to use with transform_sparse
+    """
+    columns = []
+    feature_names = []
+    for column in features:
+        values = train_data[column]
+        spec = {"name": column, "offset": len(feature_names)}
+        if pd.api.types.is_numeric_dtype(values):
+            spec["categories"] = None
+            feature_names.append(column)
+        else:
+            counts = values.value_counts()
+            categories = pd.Index(counts[counts >= min_frequency].index).sort_values()
+            spec["categories"] = list(categories)
+            feature_names.extend(f"{column}_{category}" for category in categories)
+            feature_names.extend(f"{column}_hash{i}" for i in range(n_hash_buckets))
+        columns.append(spec)
+
+    return {
+        "columns": columns,
+        "feature_names": feature_names,
+        "n_hash_buckets": n_hash_buckets,
+    }
+
+
+def transform_sparse(data: pd.DataFrame, encoder: Dict[str, Any]) -> sparse.csr_matrix:
+    """
+    Encode features as a sparse CSR matrix, without building dense columns.
+
+    Args:
+        data: Dataset to encode
+        encoder: Encoder returned by fit_sparse_encoder
+
+    Returns:
+        CSR matrix with one row per passenger and one column per feature name
+
+    Raises:
+        ValueError: If a numeric feature has missing values (they cannot be
+            stored in a sparse matrix used for training or prediction)
+    """
+    n_rows = len(data)
+    n_hash_buckets = encoder["n_hash_buckets"]
+    all_rows = np.arange(n_rows)
+    rows, cols, values = [], [], []
+
+    for spec in encoder["columns"]:
+        column = data[spec["name"]]
+
+        if spec["categories"] is None:
+            numbers = column.to_numpy(dtype=np.float32)
+            if np.isnan(numbers).any():
+                raise ValueError(
+                    f"Missing values in numeric feature {spec['name']}: impute "
+                    "them first (see data_validation.impute_missing)"
+                )
+            keep = numbers != 0
+            rows.append(all_rows[keep])
+            cols.append(np.full(int(keep.sum()), spec["offset"]))
+            values.append(numbers[keep])
+            continue
+
+        codes = pd.Index(spec["categories"]).get_indexer(column)
+        keep = codes >= 0
+        if n_hash_buckets:
+            hashed = ~keep & column.notna().to_numpy()
+            labels = column[hashed].astype(str).to_numpy(dtype=object)
+            buckets = pd.util.hash_array(labels) % np.uint64(n_hash_buckets)
+            codes[hashed] = len(spec["categories"]) + buckets.astype(np.intp)
+            keep |= hashed
+
+        rows.append(all_rows[keep])
+        cols.append(spec["offset"] + codes[keep])
+        values.append(np.ones(int(keep.sum()), dtype=np.float32))
+
+    return sparse.csr_matrix(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n_rows, len(encoder["feature_names"])),
+        dtype=np.float32,
+    )
+
+
+def preprocess_features_sparse(
+    train_data: pd.DataFrame,
+    test_data: pd.DataFrame,
+    features: list,
+    target: str,
+    min_frequency: int = 1,
+    n_hash_buckets: int = 0,
+) -> Tuple[sparse.csr_matrix, pd.Series, sparse.csr_matrix, Dict[str, Any]]:
+    """
+    Preprocess features into sparse matrices for high-cardinality columns.
+
+    The matrices can be passed directly to train_random_forest and
+    generate_predictions; they are never densified.
+
+    Args:
+        train_data: Training dataset
+        test_data: Test dataset
+        features: List of feature column names to use
+        target: Name of the target column
+        min_frequency: Minimum count for a category to get its own column
+        n_hash_buckets: Number of hashed columns per categorical feature
+
+    Returns:
+        Tuple containing (X_train, y_train, X_test, encoder):
+            - X_train: Processed training features (CSR matrix)
+            - y_train: Training target variable
+            - X_test: Processed test features (CSR matrix)
+            - encoder: Encoder, with the column names in "feature_names"
+
+    Raises:
+        ValueError: If a numeric feature has missing values
+    """
+    y_train = train_data[target]
+
+    encoder = fit_sparse_encoder(train_data, features, min_frequency, n_hash_buckets)
+    X_train = transform_sparse(train_data, encoder)
+    X_test = transform_sparse(test_data, encoder)
+
+    return X_train, y_train, X_test, encoder
+
+
 def calculate_survival_rates(train_data: pd.DataFrame) -> dict:
     """
     Calculate survival rates by gender for exploratory analysis.
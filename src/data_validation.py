@@ -0,0 +1,260 @@
+"""Schema validation and missing value imputation for the Titanic dataset.
+
+CSV files are read in chunks. Each chunk is checked against a schema (types,
+ranges and allowed categories) with vectorized masks: invalid values are
+counted and replaced by NaN, then missing values are filled with statistics
+fitted on the training data. Every chunk adds one row to a compact report
+that also records the time spent loading and validating it.
+"""
+
+import itertools
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from feature_engineering import UNKNOWN_DECK
+
+# Value used to fill missing cabins (no statistic makes sense for them): the
+# deck derived from an imputed cabin is the same as from a missing one
+UNKNOWN_CABIN = UNKNOWN_DECK
+
+# Columns filled with a statistic of the training data
+IMPUTED_COLUMNS = ["Age", "Fare", "Embarked"]
+
+
+def validate_chunk(
+    chunk: pd.DataFrame, schema: Dict[str, Dict[str, Any]]
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    Check a chunk against a schema and replace invalid values by NaN.
+
+    Schema entries support the keys "type" ("numeric" or "category"),
+    "min", "max", "allowed" and "required" (default True).
+
+    Args:
+        chunk: Raw data chunk
+        schema: Expected columns and their constraints
+
+    Returns:
+        Tuple containing (chunk, counts):
+            - chunk: Copy of the chunk with invalid values set to NaN
+            - counts: Number of missing and invalid values per column
+
+    Raises:
+        ValueError: If a required column is absent
+    """
+    # Columns are replaced, never modified in place: a shallow copy is enough
+    chunk = chunk.copy(deep=False)
+    counts = {}
+
+    for column, rules in schema.items():
+        if column not in chunk.columns:
+            if rules.get("required", True):
+                raise ValueError(f"Missing required column: {column}")
+            continue
+
+        values = chunk[column]
+        missing = values.isna().to_numpy()
+        invalid = np.zeros(len(values), dtype=bool)
+
+        converted = False
+        if rules.get("type") == "numeric":
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values, errors="coerce")
+                invalid |= values.isna().to_numpy() & ~missing
+                converted = True
+            numbers = values.to_numpy(dtype=np.float64)
+            if "min" in rules:
+                invalid |= numbers < rules["min"]
+            if "max" in rules:
+                invalid |= numbers > rules["max"]
+
+        if "allowed" in rules:
+            invalid |= ~values.isin(rules["allowed"]).to_numpy() & ~missing
+
+        counts[f"{column}_missing"] = int(missing.sum())
+        counts[f"{column}_invalid"] = int(invalid.sum())
+        if converted or invalid.any():
+            chunk[column] = values.mask(invalid)
+
+    return chunk, counts
+
+
+def fit_imputation(train_data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Fit the values used to fill missing data on the training dataset.
+
+    Args:
+        train_data: Validated training dataset
+
+    Returns:
+        Dictionary of fill values for Age, Fare, Embarked and Cabin
+
+    Raises:
+        ValueError: If a column to impute has no value at all
+    """
+    for column in IMPUTED_COLUMNS:
+        if train_data[column].isna().all():
+            raise ValueError(f"Cannot fit imputation: no values in column {column}")
+
+    return {
+        "Age": float(train_data["Age"].median()),
+        "Fare": float(train_data["Fare"].median()),
+        "Embarked": str(train_data["Embarked"].mode().iloc[0]),
+        "Cabin": UNKNOWN_CABIN,
+    }
+
+
+def impute_missing(data: pd.DataFrame, imputation: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Fill missing values with the fitted fill values.
+
+    Args:
+        data: Dataset to fill
+        imputation: Fill values returned by fit_imputation
+
+    Returns:
+        Dataset without missing values in the imputed columns
+    """
+    fill_values = {
+        column: value
+        for column, value in imputation.items()
+        if column in data and data[column].isna().any()
+    }
+    if not fill_values:
+        return data
+    return data.fillna(fill_values)
+
+
+def store_imputation(model: Any, imputation: Dict[str, Any]) -> None:
+    """
+    Store the fill values of the training data on a trained model.
+
+    They are saved and loaded together with the model by save_model and
+    load_model, so that every scoring path fills missing values like the
+    training pipeline.
+
+    Args:
+        model: Trained model
+        imputation: Fill values returned by fit_imputation
+    """
+    model.imputation_ = imputation
+
+
+def get_imputation(model: Any) -> Optional[Dict[str, Any]]:
+    """
+    Get the fill values stored on a model.
+
+    Args:
+        model: Trained model
+
+    Returns:
+        The fill values, or None if the model was trained without them
+    """
+    return getattr(model, "imputation_", None)
+
+
+def iter_validated_csv(
+    csv_path: Path,
+    schema: Dict[str, Dict[str, Any]],
+    imputation: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 100_000,
+) -> Iterator[Tuple[pd.DataFrame, Dict[str, Any]]]:
+    """
+    Read a CSV file chunk by chunk, validating (and imputing) each chunk.
+
+    Only one chunk is held in memory at a time.
+
+    Args:
+        csv_path: Path to the CSV file
+        schema: Expected columns and their constraints
+        imputation: Fill values returned by fit_imputation (no imputation
+            if None)
+        chunk_size: Number of rows per chunk
+
+    Yields:
+        Tuples containing (chunk, report_row) where report_row has the row
+        count, missing/invalid counts per column, and load and validation
+        times in seconds of the chunk
+
+    Raises:
+        FileNotFoundError: If the CSV file is not found
+    """
+    try:
+        reader = pd.read_csv(csv_path, chunksize=chunk_size)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Data file not found: {e}")
+
+    with reader:
+        for index in itertools.count():
+            start = time.perf_counter()
+            chunk = next(reader, None)
+            load_seconds = time.perf_counter() - start
+            if chunk is None:
+                return
+
+            start = time.perf_counter()
+            chunk, counts = validate_chunk(chunk, schema)
+            if imputation is not None:
+                chunk = impute_missing(chunk, imputation)
+            validation_seconds = time.perf_counter() - start
+
+            yield chunk, {
+                "chunk": index,
+                "rows": len(chunk),
+                **counts,
+                "load_seconds": load_seconds,
+                "validation_seconds": validation_seconds,
+            }
+
+
+def load_validated_csv(
+    csv_path: Path,
+    schema: Dict[str, Dict[str, Any]],
+    imputation: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 100_000,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Load a CSV file chunk by chunk, validating (and imputing) each chunk.
+
+    Args:
+        csv_path: Path to the CSV file
+        schema: Expected columns and their constraints
+        imputation: Fill values returned by fit_imputation (no imputation
+            if None)
+        chunk_size: Number of rows per chunk
+
+    Returns:
+        Tuple containing (data, report) where report has one row per chunk
+        with the row count, missing/invalid counts per column, and load and
+        validation times in seconds
+
+    Raises:
+        FileNotFoundError: If the CSV file is not found
+    """
+    chunks = []
+    report = []
+    for chunk, report_row in iter_validated_csv(
+        csv_path, schema, imputation, chunk_size
+    ):
+        chunks.append(chunk)
+        report.append(report_row)
+
+    data = pd.concat(chunks, ignore_index=True)
+    return data, pd.DataFrame(report)
+
+
+def validation_overhead(report: pd.DataFrame) -> float:
+    """
+    Compute the validation time as a fraction of the load time.
+
+    Args:
+        report: Report returned by load_validated_csv
+
+    Returns:
+        Total validation time divided by total load time
+    """
+    return float(report["validation_seconds"].sum() / report["load_seconds"].sum())
@@ -0,0 +1,294 @@
+"""Sharded Random Forest training across worker processes or machines.
+
+The driver splits the requested number of trees between workers and writes
+one task file per worker in a work directory. Each worker trains a sub-forest
+on its own data shard (or on the full data, relying on bootstrap sampling)
+and saves it next to its task. The driver then merges the estimators of all
+sub-forests into a single RandomForestClassifier.
+
+Workers only communicate through the work directory, so they can run as
+local processes or on other machines sharing the same filesystem. The
+driver is the main pipeline with config.TRAINING_MODE = "distributed"; with
+config.DISTRIBUTED_LOCAL_WORKERS = False it writes the tasks and waits for
+workers started on other machines with:
+
+    python src/distributed_training.py output/distributed/task_0.json
+"""
+
+import copy
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+from model_training import load_model, save_model, train_random_forest
+
+
+def split_estimators(n_estimators: int, n_workers: int) -> List[int]:
+    """
+    Split a number of trees as evenly as possible between workers.
+
+    Args:
+        n_estimators: Total number of trees
+        n_workers: Number of workers
+
+    Returns:
+        List with the number of trees of each worker
+
+    Raises:
+        ValueError: If there are fewer trees than workers
+    """
+    if n_workers < 1:
+        raise ValueError("n_workers must be at least 1")
+    if n_estimators < n_workers:
+        raise ValueError(
+            f"Cannot split {n_estimators} trees between {n_workers} workers"
+        )
+
+    base, remainder = divmod(n_estimators, n_workers)
+    return [base + (1 if i < remainder else 0) for i in range(n_workers)]
+
+
+def prepare_shard_tasks(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    model_params: Dict[str, Any],
+    n_workers: int,
+    work_dir: Path,
+    shard_data: bool = False,
+) -> List[Path]:
+    """
+    Write the training data and one task file per worker.
+
+    Sub-forests saved in the work directory by a previous run are removed.
+
+    Args:
+        X_train: Training features (preprocessed)
+        y_train: Training target variable
+        model_params: Dictionary of Random Forest parameters
+        n_workers: Number of workers
+        work_dir: Directory shared by the driver and the workers
+        shard_data: If True, each worker gets a disjoint subset of the rows;
+            otherwise every worker sees all rows and relies on bootstrap
+
+    Returns:
+        List of task file paths, one per worker
+    """
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    n_trees = split_estimators(model_params.get("n_estimators", 100), n_workers)
+    random_state = model_params.get("random_state")
+    rng = np.random.RandomState(random_state)
+    seeds = rng.randint(np.iinfo(np.int32).max, size=n_workers)
+
+    if shard_data:
+        row_shards = np.array_split(rng.permutation(len(X_train)), n_workers)
+        data_paths = []
+        for i, rows in enumerate(row_shards):
+            data_path = work_dir / f"shard_{i}.pkl"
+            pd.to_pickle((X_train.iloc[rows], y_train.iloc[rows]), data_path)
+            data_paths.append(data_path)
+    else:
+        data_path = work_dir / "train.pkl"
+        pd.to_pickle((X_train, y_train), data_path)
+        data_paths = [data_path] * n_workers
+
+    task_paths = []
+    for i in range(n_workers):
+        params = dict(model_params, n_estimators=n_trees[i])
+        if random_state is not None:
+            params["random_state"] = int(seeds[i])
+
+        # A sub-forest left by a previous run must not be taken for a result
+        output_path = work_dir / f"forest_{i}.joblib"
+        output_path.unlink(missing_ok=True)
+
+        task = {
+            "data_path": str(data_paths[i]),
+            "model_params": params,
+            "output_path": str(output_path),
+        }
+        task_path = work_dir / f"task_{i}.json"
+        task_path.write_text(json.dumps(task, indent=2))
+        task_paths.append(task_path)
+
+    return task_paths
+
+
+def run_shard_task(task_path: Path) -> Path:
+    """
+    Train the sub-forest described by a task file (worker entry point).
+
+    Args:
+        task_path: Path to a task file written by prepare_shard_tasks
+
+    Returns:
+        Path of the saved sub-forest
+    """
+    task = json.loads(Path(task_path).read_text())
+    X_train, y_train = pd.read_pickle(task["data_path"])
+
+    model = train_random_forest(X_train, y_train, task["model_params"])
+
+    return save_model(model, Path(task["output_path"]))
+
+
+def collect_shard_models(task_paths: List[Path]) -> List[RandomForestClassifier]:
+    """
+    Load the sub-forests produced for a list of task files.
+
+    Args:
+        task_paths: Task file paths returned by prepare_shard_tasks
+
+    Returns:
+        List of trained sub-forests, in task order
+
+    Raises:
+        FileNotFoundError: If a worker has not produced its sub-forest
+    """
+    forests = []
+    for task_path in task_paths:
+        task = json.loads(Path(task_path).read_text())
+        forests.append(load_model(Path(task["output_path"])))
+
+    return forests
+
+
+def wait_for_shard_models(
+    task_paths: List[Path], timeout: float, poll_interval: float = 5.0
+) -> List[RandomForestClassifier]:
+    """
+    Wait until every worker has saved its sub-forest, then load them.
+
+    Args:
+        task_paths: Task file paths returned by prepare_shard_tasks
+        timeout: Maximum number of seconds to wait
+        poll_interval: Number of seconds between two checks of the outputs
+
+    Returns:
+        List of trained sub-forests, in task order
+
+    Raises:
+        TimeoutError: If some sub-forests are still missing after timeout
+    """
+    output_paths = [
+        Path(json.loads(Path(task_path).read_text())["output_path"])
+        for task_path in task_paths
+    ]
+    deadline = time.monotonic() + timeout
+    while True:
+        missing = [path for path in output_paths if not path.exists()]
+        if not missing:
+            return collect_shard_models(task_paths)
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Sub-forests not produced after {timeout} seconds: "
+                f"{[str(path) for path in missing]}"
+            )
+        time.sleep(min(poll_interval, max(0.0, deadline - time.monotonic())))
+
+
+def merge_forests(
+    forests: List[RandomForestClassifier], random_state: Optional[int] = None
+) -> RandomForestClassifier:
+    """
+    Merge several trained Random Forests into a single model.
+
+    Args:
+        forests: Trained sub-forests
+        random_state: Random seed to report on the merged model
+
+    Returns:
+        RandomForestClassifier holding the trees of every sub-forest
+
+    Raises:
+        ValueError: If the sub-forests were trained on different classes
+            or features
+    """
+    if not forests:
+        raise ValueError("At least one forest is required")
+
+    merged = copy.deepcopy(forests[0])
+    for forest in forests[1:]:
+        if not np.array_equal(forest.classes_, merged.classes_):
+            raise ValueError(
+                "Forests were trained on different classes: "
+                f"{list(merged.classes_)} != {list(forest.classes_)}"
+            )
+        if forest.n_features_in_ != merged.n_features_in_ or not np.array_equal(
+            getattr(forest, "feature_names_in_", None),
+            getattr(merged, "feature_names_in_", None),
+        ):
+            raise ValueError("Forests were trained on different features")
+        merged.estimators_ = merged.estimators_ + forest.estimators_
+
+    merged.n_estimators = len(merged.estimators_)
+    merged.random_state = random_state
+
+    # Out-of-bag estimates of a single shard do not describe the merged forest
+    for attribute in ("oob_score_", "oob_decision_function_"):
+        if hasattr(merged, attribute):
+            delattr(merged, attribute)
+    merged.oob_score = False
+
+    return merged
+
+
+def train_random_forest_distributed(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    model_params: Dict[str, Any],
+    n_workers: int,
+    work_dir: Path,
+    shard_data: bool = False,
+    local_workers: bool = True,
+    timeout: float = 3600.0,
+) -> RandomForestClassifier:
+    """
+    Train a Random Forest by running one sub-forest per worker.
+
+    Args:
+        X_train: Training features (preprocessed)
+        y_train: Training target variable
+        model_params: Dictionary of Random Forest parameters
+        n_workers: Number of workers
+        work_dir: Directory used to exchange data and sub-forests
+        shard_data: If True, each worker trains on a disjoint subset of rows
+        local_workers: If True, workers run as local processes; otherwise
+            they are started separately (e.g. on other machines) with the
+            printed commands
+        timeout: Maximum number of seconds to wait for separate workers
+
+    Returns:
+        Trained RandomForestClassifier with model_params["n_estimators"] trees
+
+    Raises:
+        TimeoutError: If separate workers do not finish within timeout
+    """
+    task_paths = prepare_shard_tasks(
+        X_train, y_train, model_params, n_workers, work_dir, shard_data
+    )
+
+    if local_workers:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(run_shard_task, task_paths))
+        forests = collect_shard_models(task_paths)
+    else:
+        print(f"  - Waiting for {n_workers} workers, to start with:")
+        for task_path in task_paths:
+            print(f"      python src/distributed_training.py {task_path}")
+        forests = wait_for_shard_models(task_paths, timeout)
+
+    return merge_forests(forests, random_state=model_params.get("random_state"))
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        print(f"Sub-forest saved to: {run_shard_task(Path(path))}")
@@ -0,0 +1,264 @@
+"""Feature engineering for the Titanic dataset.
+
+Derives the passenger title (from Name), the deck (from Cabin), age and fare
+bins and the family size with vectorized pandas/NumPy operations. The
+parameters learned on the training data (title and deck vocabularies, bin
+edges) are kept in a plain dictionary that can be stored on the model.
+
+Columns derived from strings (Title and Deck, extracted with regular
+expressions) are cached by feature parameters and input values, in memory
+and optionally as .npy files, so repeated runs and chunked scoring do not
+recompute them. Both caches are bounded in bytes and evict the least
+recently used columns. The numeric columns are cheaper to compute than to
+hash and are never cached.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Title spellings mapped to their common form before building the vocabulary
+TITLE_ALIASES = {"Mlle": "Miss", "Ms": "Miss", "Mme": "Mrs"}
+RARE_TITLE = "Rare"
+UNKNOWN_DECK = "U"
+
+# Maximum size of the derived columns kept in memory and on disk
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_COLUMN_CACHE: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+
+def _extract_titles(names: pd.Series) -> pd.Series:
+    """Extract the title between the comma and the dot of each name."""
+    # String dtype: a chunk where every value is missing is read as float
+    names = names.astype("string")
+    titles = names.str.extract(r",\s*([^.]+)\.", expand=False).str.strip()
+    return titles.replace(TITLE_ALIASES)
+
+
+def _extract_decks(cabins: pd.Series) -> pd.Series:
+    """Extract the deck letter of each cabin (UNKNOWN_DECK if missing)."""
+    return cabins.astype("string").str[0].fillna(UNKNOWN_DECK)
+
+
+def _bin_edges(values: pd.Series, n_bins: int) -> List[float]:
+    """Compute inner quantile edges splitting values into n_bins bins."""
+    quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+    edges = np.unique(np.nanquantile(values.to_numpy(dtype=np.float64), quantiles))
+    return [float(edge) for edge in edges]
+
+
+def fit_feature_engineering(
+    train_data: pd.DataFrame,
+    n_age_bins: int = 5,
+    n_fare_bins: int = 4,
+    min_category_count: int = 10,
+) -> Dict[str, Any]:
+    """
+    Learn the feature engineering parameters on the training data.
+
+    Args:
+        train_data: Training dataset
+        n_age_bins: Number of age bins (quantiles of the training ages)
+        n_fare_bins: Number of fare bins (quantiles of the training fares)
+        min_category_count: Titles and decks seen fewer times are grouped
+
+    Returns:
+        Dictionary of parameters (JSON serializable)
+    """
+    title_counts = _extract_titles(train_data["Name"]).value_counts()
+    deck_counts = _extract_decks(train_data["Cabin"]).value_counts()
+
+    titles = sorted(title_counts[title_counts >= min_category_count].index)
+    decks = sorted(
+        deck
+        for deck in deck_counts[deck_counts >= min_category_count].index
+        if deck != UNKNOWN_DECK
+    )
+
+    return {
+        "titles": titles + [RARE_TITLE],
+        "decks": decks + [UNKNOWN_DECK],
+        "age_bins": _bin_edges(train_data["Age"], n_age_bins),
+        "fare_bins": _bin_edges(train_data["Fare"], n_fare_bins),
+    }
+
+
+def _title_codes(data: pd.DataFrame, params: Dict[str, Any]) -> np.ndarray:
+    """Compute the title category code of each passenger."""
+    vocabulary = pd.Index(params["titles"])
+    codes = vocabulary.get_indexer(_extract_titles(data["Name"]))
+    codes[codes < 0] = vocabulary.get_loc(RARE_TITLE)
+    return codes.astype(np.int8)
+
+
+def _deck_codes(data: pd.DataFrame, params: Dict[str, Any]) -> np.ndarray:
+    """Compute the deck category code of each passenger."""
+    vocabulary = pd.Index(params["decks"])
+    codes = vocabulary.get_indexer(_extract_decks(data["Cabin"]))
+    codes[codes < 0] = vocabulary.get_loc(UNKNOWN_DECK)
+    return codes.astype(np.int8)
+
+
+def _bin_codes(values: pd.Series, edges: List[float]) -> np.ndarray:
+    """Compute the bin index of each value (-1 if missing)."""
+    values = values.to_numpy(dtype=np.float64)
+    codes = np.digitize(values, edges)
+    return np.where(np.isnan(values), -1, codes).astype(np.int8)
+
+
+def _age_bin_codes(data: pd.DataFrame, params: Dict[str, Any]) -> np.ndarray:
+    """Compute the age bin of each passenger."""
+    return _bin_codes(data["Age"], params["age_bins"])
+
+
+def _fare_bin_codes(data: pd.DataFrame, params: Dict[str, Any]) -> np.ndarray:
+    """Compute the fare bin of each passenger."""
+    return _bin_codes(data["Fare"], params["fare_bins"])
+
+
+def _family_size(data: pd.DataFrame, params: Dict[str, Any]) -> np.ndarray:
+    """Compute the family size (passenger included)."""
+    return (data["SibSp"].to_numpy() + data["Parch"].to_numpy() + 1).astype(np.int16)
+
+
+# Derived column -> (source columns, function computing the values)
+ENGINEERED_COLUMNS: Dict[str, tuple] = {
+    "Title": (["Name"], _title_codes),
+    "Deck": (["Cabin"], _deck_codes),
+    "AgeBin": (["Age"], _age_bin_codes),
+    "FareBin": (["Fare"], _fare_bin_codes),
+    "FamilySize": (["SibSp", "Parch"], _family_size),
+}
+
+# Categorical derived column -> parameter holding its categories
+CATEGORY_PARAMS = {"Title": "titles", "Deck": "decks"}
+
+# Derived columns worth caching (string processing)
+CACHED_COLUMNS = ["Title", "Deck"]
+
+
+def _prune_disk_cache(cache_dir: Path) -> None:
+    """Remove the least recently used cached columns above the size limit."""
+    files = []
+    for path in Path(cache_dir).glob("*.npy"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total_bytes <= DISK_CACHE_MAX_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        total_bytes -= size
+
+
+def _cached_column(
+    name: str,
+    source: pd.DataFrame,
+    params: Dict[str, Any],
+    compute: Callable[[pd.DataFrame, Dict[str, Any]], np.ndarray],
+    cache_dir: Optional[Path],
+) -> np.ndarray:
+    """Compute a derived column, or reuse it if its inputs were seen before."""
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode())
+    digest.update(pd.util.hash_pandas_object(source, index=False).to_numpy())
+    key = f"{name}-{digest.hexdigest()}"
+
+    if key in _COLUMN_CACHE:
+        _COLUMN_CACHE.move_to_end(key)
+        return _COLUMN_CACHE[key]
+
+    cache_path = Path(cache_dir) / f"{key}.npy" if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        values = np.load(cache_path)
+        # The modification time orders the files for eviction
+        os.utime(cache_path)
+    else:
+        values = compute(source, params)
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, values)
+            _prune_disk_cache(cache_path.parent)
+
+    _COLUMN_CACHE[key] = values
+    while sum(cached.nbytes for cached in _COLUMN_CACHE.values()) > CACHE_MAX_BYTES:
+        _COLUMN_CACHE.popitem(last=False)
+
+    return values
+
+
+def engineer_features(
+    data: pd.DataFrame, params: Dict[str, Any], cache_dir: Optional[Path] = None
+) -> pd.DataFrame:
+    """
+    Add the engineered feature columns to a dataset.
+
+    Title and Deck are categorical columns with the categories learned on
+    the training data, so that one-hot encoding gives the same columns for
+    every dataset. AgeBin and FareBin are bin indexes (-1 if missing).
+
+    Args:
+        data: Raw dataset (train, test or a chunk of either)
+        params: Parameters returned by fit_feature_engineering
+        cache_dir: Optional directory where Title and Deck are cached
+
+    Returns:
+        Copy of the dataset with Title, Deck, AgeBin, FareBin, FamilySize
+        and IsAlone columns
+    """
+    data = data.copy()
+
+    for name, (source_columns, compute) in ENGINEERED_COLUMNS.items():
+        if name in CACHED_COLUMNS:
+            values = _cached_column(
+                name, data[source_columns], params, compute, cache_dir
+            )
+        else:
+            values = compute(data[source_columns], params)
+        if name in CATEGORY_PARAMS:
+            categories = params[CATEGORY_PARAMS[name]]
+            data[name] = pd.Categorical.from_codes(values, categories)
+        else:
+            data[name] = values
+
+    data["IsAlone"] = (data["FamilySize"] == 1).astype(np.int8)
+
+    return data
+
+
+def store_feature_params(model: Any, params: Dict[str, Any]) -> None:
+    """
+    Store the feature engineering parameters on a trained model.
+
+    They are saved and loaded together with the model by save_model and
+    load_model.
+
+    Args:
+        model: Trained model
+        params: Parameters returned by fit_feature_engineering
+    """
+    model.feature_engineering_params_ = params
+
+
+def get_feature_params(model: Any) -> Optional[Dict[str, Any]]:
+    """
+    Get the feature engineering parameters stored on a model.
+
+    Args:
+        model: Trained model
+
+    Returns:
+        The parameters, or None if the model was trained without them
+    """
+    return getattr(model, "feature_engineering_params_", None)
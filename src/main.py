@@ -1,17 +1,37 @@
 """Main script to run the Titanic survival prediction pipeline."""
 
+import pandas as pd
+
 import config
-from data_preprocessing import (
-    calculate_survival_rates,
-    load_data,
-    preprocess_features,
+from data_preprocessing import calculate_survival_rates
+from data_validation import (
+    fit_imputation,
+    impute_missing,
+    load_validated_csv,
+    store_imputation,
+    validation_overhead,
+)
+from distributed_training import train_random_forest_distributed
+from feature_engineering import (
+    engineer_features,
+    fit_feature_engineering,
+    store_feature_params,
 )
 from model_evaluation import (
     create_submission_file,
     generate_predictions,
     print_prediction_summary,
 )
-from model_training import get_model_info, train_random_forest
+from model_training import get_backend, get_model_info, train_model
+from model_validation import evaluate_model
+from out_of_core_training import save_training_matrix, train_random_forest_out_of_core
+from resources import (
+    apply_thread_limits,
+    detect_resources,
+    print_resources,
+    tune_resources,
+)
+from tree_explanations import contribution_importance, store_contribution_importance
 
 
 def main():
@@ -20,14 +40,40 @@ def main():
     print("Titanic Survival Prediction Pipeline")
     print("=" * 50)
 
+    # Size parallelism and memory use for the CPU and memory limits
+    resources = detect_resources()
+    settings = tune_resources(
+        resources,
+        config.RESOURCE_OVERRIDES,
+        config.PREDICTION_BATCH_SIZE,
+        config.LOAD_CHUNK_SIZE,
+    )
+    apply_thread_limits(settings)
+    print("\nResources:")
+    print_resources(resources, settings)
+
     # Step 1: Load data
-    print("\n[1/5] Loading data...")
-    train_data, test_data = load_data(config.TRAIN_DATA_PATH, config.TEST_DATA_PATH)
+    print("\n[1/6] Loading data...")
+    train_data, train_report = load_validated_csv(
+        config.TRAIN_DATA_PATH, config.DATA_SCHEMA, chunk_size=settings["chunk_size"]
+    )
+    test_data, test_report = load_validated_csv(
+        config.TEST_DATA_PATH, config.DATA_SCHEMA, chunk_size=settings["chunk_size"]
+    )
+    imputation = fit_imputation(train_data)
+    validation_report = pd.concat(
+        [train_report.assign(dataset="train"), test_report.assign(dataset="test")],
+        ignore_index=True,
+    )
+    validation_report.to_csv(config.VALIDATION_REPORT_PATH, index=False)
+    invalid_values = int(validation_report.filter(like="_invalid").sum().sum())
     print(f"  - Training set: {len(train_data)} passengers")
     print(f"  - Test set: {len(test_data)} passengers")
+    print(f"  - Invalid values replaced: {invalid_values}")
+    print(f"  - Validation overhead: {validation_overhead(validation_report):.1%}")
 
     # Step 2: Exploratory analysis
-    print("\n[2/5] Exploratory analysis...")
+    print("\n[2/6] Exploratory analysis...")
     survival_rates = calculate_survival_rates(train_data)
     women_rate = survival_rates["women_survival_rate"]
     men_rate = survival_rates["men_survival_rate"]
@@ -35,24 +81,104 @@ def main():
     print(f"  - Men survival rate: {men_rate:.1%}")
 
     # Step 3: Preprocess features
-    print("\n[3/5] Preprocessing features...")
-    X_train, y_train, X_test = preprocess_features(
-        train_data, test_data, config.FEATURES, config.TARGET
+    print("\n[3/6] Preprocessing features...")
+    features = config.FEATURES + config.ENGINEERED_FEATURES
+    feature_params = None
+    if config.ENGINEERED_FEATURES:
+        feature_params = fit_feature_engineering(train_data)
+        train_data = engineer_features(
+            train_data, feature_params, config.FEATURE_CACHE_DIR
+        )
+        test_data = engineer_features(
+            test_data, feature_params, config.FEATURE_CACHE_DIR
+        )
+    # Imputed after feature engineering, so that missing ages get their own bin
+    train_data = impute_missing(train_data, imputation)
+    test_data = impute_missing(test_data, imputation)
+    backend = get_backend(config.MODEL_BACKEND)
+    X_train, y_train, X_test = backend["preprocess"](
+        train_data, test_data, features, config.TARGET, config.CATEGORICAL_FEATURES
     )
+    model_params = dict(config.MODEL_PARAMS[config.MODEL_BACKEND])
+    if backend["n_jobs"]:
+        model_params.setdefault("n_jobs", settings["n_jobs"])
     print(f"  - Features after encoding: {list(X_train.columns)}")
     print(f"  - Training samples: {len(X_train)}")
 
     # Step 4: Train model
-    print("\n[4/5] Training Random Forest model...")
-    model = train_random_forest(X_train, y_train, config.RANDOM_FOREST_PARAMS)
+    print(f"\n[4/6] Training {config.MODEL_BACKEND} model...")
+    if config.TRAINING_MODE not in backend["training_modes"]:
+        raise ValueError(
+            f"Training mode {config.TRAINING_MODE} is not supported by the "
+            f"{config.MODEL_BACKEND} backend "
+            f"(supported: {', '.join(backend['training_modes'])})"
+        )
+    if config.TRAINING_MODE == "in_memory":
+        model = train_model(X_train, y_train, model_params, config.MODEL_BACKEND)
+    elif config.TRAINING_MODE == "distributed":
+        n_workers = config.DISTRIBUTED_N_WORKERS
+        if "n_jobs" not in config.MODEL_PARAMS[config.MODEL_BACKEND]:
+            # Local workers share the CPUs; remote ones use all of theirs
+            if config.DISTRIBUTED_LOCAL_WORKERS:
+                model_params["n_jobs"] = max(1, settings["n_jobs"] // n_workers)
+            else:
+                model_params["n_jobs"] = -1
+        model = train_random_forest_distributed(
+            X_train,
+            y_train,
+            model_params,
+            n_workers,
+            config.DISTRIBUTED_WORK_DIR,
+            local_workers=config.DISTRIBUTED_LOCAL_WORKERS,
+            timeout=config.DISTRIBUTED_TIMEOUT,
+        )
+    elif config.TRAINING_MODE == "out_of_core":
+        save_training_matrix(
+            X_train, y_train, config.TRAINING_MATRIX_DIR, settings["chunk_size"]
+        )
+        model = train_random_forest_out_of_core(
+            config.TRAINING_MATRIX_DIR,
+            model_params,
+            config.TRAINING_MATRIX_MAX_SAMPLES,
+        )
+    else:
+        raise ValueError(f"Unknown training mode: {config.TRAINING_MODE}")
+    store_imputation(model, imputation)
+    if feature_params is not None:
+        store_feature_params(model, feature_params)
+    if backend["explain"] is not None and config.CONTRIBUTION_IMPORTANCE_ROWS:
+        # Explaining costs far more than predicting: use a bounded sample
+        n_rows = min(len(X_train), config.CONTRIBUTION_IMPORTANCE_ROWS)
+        X_sample = X_train.sample(n=n_rows, random_state=1)
+        contributions, _ = backend["explain"](model, X_sample)
+        store_contribution_importance(model, contribution_importance(contributions))
     model_info = get_model_info(model)
     print(f"  - Number of trees: {model_info['n_estimators']}")
     print(f"  - Max depth: {model_info['max_depth']}")
     print(f"  - Features used: {model_info['n_features']}")
+    if "contribution_importance" in model_info:
+        top_features = list(model_info["contribution_importance"].items())[:3]
+        top = ", ".join(f"{name} ({value:.3f})" for name, value in top_features)
+        print(f"  - Top contributions: {top}")
+
+    # Step 5: Evaluate model quality
+    print("\n[5/6] Evaluating model...")
+    metrics = evaluate_model(
+        model,
+        X_train,
+        y_train,
+        config.CV_FOLDS,
+        n_jobs=min(settings["n_jobs"], config.CV_FOLDS),
+        cache_dir=config.METRICS_CACHE_DIR,
+    )
+    print(f"  - Method: {metrics['method']}")
+    print(f"  - Accuracy: {metrics['accuracy']:.1%}")
+    print(f"  - Log-loss: {metrics['log_loss']:.4f}")
+    print(f"  - ROC AUC: {metrics['roc_auc']:.4f}")
 
-    # Step 5: Generate predictions and save submission
-    print("\n[5/5] Generating predictions...")
-    predictions = generate_predictions(model, X_test)
+    # Step 6: Generate predictions and save submission
+    print("\n[6/6] Generating predictions...")
+    predictions = generate_predictions(model, X_test, settings["batch_size"])
     create_submission_file(test_data, predictions, config.SUBMISSION_PATH)
     print_prediction_summary(predictions)
 
@@ -1,28 +1,69 @@
 """Model evaluation and prediction module."""
 
 from pathlib import Path
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.base import ClassifierMixin
+
+
+def _predict_in_batches(
+    predict: Callable, X_test: pd.DataFrame, batch_size: Optional[int]
+) -> np.ndarray:
+    """Call a prediction method on consecutive row batches."""
+    if batch_size is None or X_test.shape[0] <= batch_size:
+        return predict(X_test)
+
+    rows = X_test.iloc if isinstance(X_test, pd.DataFrame) else X_test
+    batches = []
+    for start in range(0, X_test.shape[0], batch_size):
+        stop = start + batch_size
+        batches.append(predict(rows[start:stop]))
+
+    return np.concatenate(batches)
 
 
 def generate_predictions(
-    model: RandomForestClassifier, X_test: pd.DataFrame
+    model: ClassifierMixin, X_test: pd.DataFrame, batch_size: Optional[int] = None
 ) -> pd.Series:
     """
     Generate predictions using the trained model.
 
     Args:
-        model: Trained RandomForestClassifier
-        X_test: Test features (preprocessed)
+        model: Trained classifier from any backend of model_training
+        X_test: Test features (preprocessed for the same backend), as a
+            DataFrame or a sparse CSR matrix
+        batch_size: Maximum number of rows predicted at once (all rows if
+            None), to bound memory use
 
     Returns:
         Series of predictions (0 or 1)
     """
-    predictions = model.predict(X_test)
+    predictions = _predict_in_batches(model.predict, X_test, batch_size)
     return predictions
 
 
+def generate_probabilities(
+    model: ClassifierMixin, X_test: pd.DataFrame, batch_size: Optional[int] = None
+) -> np.ndarray:
+    """
+    Generate survival probabilities using the trained model.
+
+    Args:
+        model: Trained classifier from any backend of model_training
+        X_test: Test features (preprocessed for the same backend)
+        batch_size: Maximum number of rows predicted at once (all rows if
+            None), to bound memory use
+
+    Returns:
+        Array with the probability of the positive class for each passenger
+    """
+    positive_index = list(model.classes_).index(1)
+    probabilities = _predict_in_batches(model.predict_proba, X_test, batch_size)
+    return probabilities[:, positive_index]
+
+
 def create_submission_file(
     test_data: pd.DataFrame, predictions: pd.Series, output_path: Path
 ) -> None:
@@ -0,0 +1,258 @@
+"""Registry of saved models for multi-model serving.
+
+Models are saved with save_model as <root>/<key>/<version>.joblib, where the
+key names a model variant (features and parameters) and versions are
+increasing integers. The active version of each key is recorded in an
+ACTIVE file next to its artifacts; it is re-read whenever the file changes,
+so a promotion made by another process is picked up on the next request.
+Registrations hold a per-key lock file (flock, where available) while
+choosing the version and saving the artifact, so concurrent processes never
+get the same version.
+
+Models are loaded on first use and kept in an in-memory LRU cache bounded
+in bytes (the size of the artifacts on disk). Promoting a version loads it
+before switching the active pointer under a lock: callers that already got
+the previous model keep scoring with it, new callers get the new one.
+"""
+
+import contextlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from model_evaluation import generate_predictions
+from model_training import load_model, save_model
+
+try:
+    import fcntl
+except ImportError:  # Windows: registrations are only locked within a process
+    fcntl = None
+
+ACTIVE_FILE = "ACTIVE"
+LOCK_FILE = "LOCK"
+ARTIFACT_SUFFIX = ".joblib"
+
+
+class ModelRegistry:
+    """Index of saved models with lazy loading and a bounded LRU cache."""
+
+    def __init__(self, root: Path, max_bytes: int = 512 * 1024 * 1024):
+        """
+        Create a registry over a directory of saved models.
+
+        Args:
+            root: Directory holding one subdirectory per model key
+            max_bytes: Maximum size of the models kept in memory
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._register_lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[Any, int]]" = OrderedDict()
+        # Active version of each key, with the identity of the ACTIVE file read
+        self._active: Dict[str, Tuple[Tuple[int, int], int]] = {}
+        self._resident_bytes = 0
+        self._stats = {"loads": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+    def _artifact_path(self, key: str, version: int) -> Path:
+        """Path of the artifact of a model version."""
+        return self.root / key / f"{version}{ARTIFACT_SUFFIX}"
+
+    def versions(self, key: str) -> List[int]:
+        """
+        List the saved versions of a model.
+
+        Args:
+            key: Model key
+
+        Returns:
+            Sorted list of versions (empty if the key is unknown)
+        """
+        return sorted(
+            int(path.stem)
+            for path in (self.root / key).glob(f"*{ARTIFACT_SUFFIX}")
+            if path.stem.isdigit()
+        )
+
+    @contextlib.contextmanager
+    def _registration_lock(self, key: str) -> Iterator[None]:
+        """Hold the registration lock of a key, across threads and processes."""
+        lock_path = self.root / key / LOCK_FILE
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._register_lock, open(lock_path, "a") as lock_file:
+            if fcntl is not None:
+                # Released when the file is closed
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def register(self, key: str, model: Any, version: Optional[int] = None) -> int:
+        """
+        Save a model as a new version of a key.
+
+        The first version of a key becomes its active version.
+
+        Args:
+            key: Model key
+            model: Trained model
+            version: Version number (defaults to the latest version + 1)
+
+        Returns:
+            The registered version
+
+        Raises:
+            FileExistsError: If the given version is already registered
+        """
+        with self._registration_lock(key):
+            first_version = self.active_version(key) is None
+            if version is None:
+                version = max(self.versions(key), default=0) + 1
+            elif self._artifact_path(key, version).exists():
+                raise FileExistsError(f"Model {key} version {version} exists")
+            save_model(model, self._artifact_path(key, version))
+            if first_version:
+                self._write_active(key, version)
+
+        return version
+
+    def active_version(self, key: str) -> Optional[int]:
+        """
+        Get the version served by default for a key.
+
+        Args:
+            key: Model key
+
+        Returns:
+            The promoted version, the latest version if none was promoted,
+            or None if the key has no versions
+        """
+        active_path = self.root / key / ACTIVE_FILE
+        try:
+            stat = active_path.stat()
+        except FileNotFoundError:
+            return max(self.versions(key), default=None)
+
+        # The file is replaced by a rename on every write: a new inode (or
+        # modification time) means another writer promoted a version
+        identity = (stat.st_ino, stat.st_mtime_ns)
+        with self._lock:
+            if key in self._active and self._active[key][0] == identity:
+                return self._active[key][1]
+
+        version = int(active_path.read_text().strip())
+        with self._lock:
+            self._active[key] = (identity, version)
+        return version
+
+    def _write_active(self, key: str, version: int) -> None:
+        """Record the active version of a key, atomically."""
+        active_path = self.root / key / ACTIVE_FILE
+        fd, temp_name = tempfile.mkstemp(
+            dir=active_path.parent, prefix=f"{ACTIVE_FILE}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w") as temp_file:
+            temp_file.write(f"{version}\n")
+        Path(temp_name).replace(active_path)
+
+    def get(self, key: str, version: Optional[int] = None) -> Any:
+        """
+        Get a model, loading it if it is not in memory.
+
+        Args:
+            key: Model key
+            version: Version to get (defaults to the active version)
+
+        Returns:
+            The trained model
+
+        Raises:
+            FileNotFoundError: If the model has no saved artifact
+        """
+        if version is None:
+            version = self.active_version(key)
+            if version is None:
+                raise FileNotFoundError(f"No saved model for key: {key}")
+
+        cache_key = (key, version)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                self._stats["hits"] += 1
+                return self._cache[cache_key][0]
+            self._stats["misses"] += 1
+
+        # Loaded outside the lock so that cached models stay available
+        path = self._artifact_path(key, version)
+        model = load_model(path)
+        size = path.stat().st_size
+
+        with self._lock:
+            self._stats["loads"] += 1
+            if cache_key not in self._cache:
+                self._cache[cache_key] = (model, size)
+                self._resident_bytes += size
+                self._evict()
+            return self._cache[cache_key][0]
+
+    def _evict(self) -> None:
+        """Drop the oldest models, but never the newest, to fit (lock held)."""
+        while self._resident_bytes > self.max_bytes and len(self._cache) > 1:
+            _, (_, size) = self._cache.popitem(last=False)
+            self._resident_bytes -= size
+            self._stats["evictions"] += 1
+
+    def promote(self, key: str, version: int) -> None:
+        """
+        Make a version the active version of a key (hot swap).
+
+        The new version is loaded before the switch, so no caller waits for
+        it; models already returned by get are not affected.
+
+        Args:
+            key: Model key
+            version: Version to serve
+
+        Raises:
+            FileNotFoundError: If the version has no saved artifact
+        """
+        self.get(key, version)
+        self._write_active(key, version)
+
+    def predict(
+        self, key: str, X_test: pd.DataFrame, version: Optional[int] = None
+    ) -> pd.Series:
+        """
+        Generate predictions with a registered model.
+
+        Args:
+            key: Model key
+            X_test: Test features (preprocessed as for this model)
+            version: Version to use (defaults to the active version)
+
+        Returns:
+            Series of predictions (0 or 1)
+        """
+        return generate_predictions(self.get(key, version), X_test)
+
+    def stats(self) -> dict:
+        """
+        Get the cache statistics of the registry.
+
+        Returns:
+            Dictionary with the number of loads, hits, misses and evictions,
+            the hit rate, the resident bytes and the resident models
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["resident_bytes"] = self._resident_bytes
+            stats["resident_models"] = [
+                f"{key}:{version}" for key, version in self._cache
+            ]
+
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / requests if requests else 0.0
+        return stats
@@ -1,9 +1,16 @@
 """Model training module for Titanic survival prediction."""
 
-from typing import Any, Dict
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
 
+import joblib
 import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+
+from data_preprocessing import encode_categorical_features, preprocess_features
+from tree_explanations import explain_predictions
 
 
 def train_random_forest(
@@ -13,7 +20,8 @@ def train_random_forest(
     Train a Random Forest Classifier model.
 
     Args:
-        X_train: Training features (preprocessed)
+        X_train: Training features (preprocessed DataFrame, or sparse CSR
+            matrix from preprocess_features_sparse)
         y_train: Training target variable
         model_params: Dictionary of Random Forest parameters
             - n_estimators: Number of trees
@@ -29,19 +37,216 @@ def train_random_forest(
     return model
 
 
-def get_model_info(model: RandomForestClassifier) -> dict:
+def train_hist_gradient_boosting(
+    X_train: pd.DataFrame, y_train: pd.Series, model_params: Dict[str, Any]
+) -> HistGradientBoostingClassifier:
+    """
+    Train a Histogram-based Gradient Boosting Classifier model.
+
+    Args:
+        X_train: Training features (preprocessed with
+            encode_categorical_features)
+        y_train: Training target variable
+        model_params: Dictionary of Gradient Boosting parameters
+            - max_iter: Number of boosting iterations
+            - max_depth: Maximum depth of trees
+            - random_state: Random seed for reproducibility
+            - categorical_features: Column names handled as categories
+
+    Returns:
+        Trained HistGradientBoostingClassifier model
+    """
+    params = dict(model_params)
+    categorical_features = params.pop("categorical_features", None)
+    if categorical_features is not None:
+        mask = [column in categorical_features for column in X_train.columns]
+        params["categorical_features"] = mask if any(mask) else None
+
+    model = HistGradientBoostingClassifier(**params)
+    model.fit(X_train, y_train)
+
+    return model
+
+
+def one_hot_features(
+    train_data: pd.DataFrame,
+    test_data: pd.DataFrame,
+    features: list,
+    target: str,
+    categorical_features: list,
+) -> Tuple[pd.DataFrame, pd.Series, pd.DataFrame]:
+    """
+    Preprocess features for backends without categorical support.
+
+    Every non-numeric feature is one-hot encoded with preprocess_features,
+    whatever categorical_features contains.
+
+    Args:
+        train_data: Training dataset
+        test_data: Test dataset
+        features: List of feature column names to use
+        target: Name of the target column
+        categorical_features: Ignored
+
+    Returns:
+        Tuple containing (X_train, y_train, X_test)
+    """
+    return preprocess_features(train_data, test_data, features, target)
+
+
+# Model backends, selected with config.MODEL_BACKEND. Each one registers:
+#   - train: function(X_train, y_train, model_params) returning the model
+#   - preprocess: function(train_data, test_data, features, target,
+#     categorical_features) returning (X_train, y_train, X_test)
+#   - explain: function(model, X) returning (contributions, base_value), or
+#     None if the model cannot be explained (see tree_explanations)
+#   - training_modes: values of config.TRAINING_MODE the backend supports
+#   - n_jobs: whether model_params accepts an n_jobs parameter
+MODEL_BACKENDS: Dict[str, Dict[str, Any]] = {
+    "random_forest": {
+        "train": train_random_forest,
+        "preprocess": one_hot_features,
+        "explain": explain_predictions,
+        "training_modes": ["in_memory", "distributed", "out_of_core"],
+        "n_jobs": True,
+    },
+    "hist_gradient_boosting": {
+        "train": train_hist_gradient_boosting,
+        "preprocess": encode_categorical_features,
+        "explain": None,
+        "training_modes": ["in_memory"],
+        "n_jobs": False,
+    },
+}
+
+
+def get_backend(backend: str) -> Dict[str, Any]:
+    """
+    Look up a model backend.
+
+    Args:
+        backend: Name of the backend (a key of MODEL_BACKENDS)
+
+    Returns:
+        Registered functions and capabilities of the backend
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend not in MODEL_BACKENDS:
+        raise ValueError(
+            f"Unknown model backend: {backend} "
+            f"(available: {', '.join(MODEL_BACKENDS)})"
+        )
+
+    return MODEL_BACKENDS[backend]
+
+
+def train_model(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    model_params: Dict[str, Any],
+    backend: str = "random_forest",
+) -> Union[RandomForestClassifier, HistGradientBoostingClassifier]:
+    """
+    Train a model with the given backend.
+
+    Args:
+        X_train: Training features (preprocessed)
+        y_train: Training target variable
+        model_params: Dictionary of parameters of the backend
+        backend: Name of the backend (a key of MODEL_BACKENDS)
+
+    Returns:
+        Trained model
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    return get_backend(backend)["train"](X_train, y_train, model_params)
+
+
+def get_model_info(
+    model: Union[RandomForestClassifier, HistGradientBoostingClassifier],
+) -> dict:
     """
     Get information about the trained model.
 
+    For gradient boosting models, n_estimators is the number of boosting
+    iterations actually run. If contribution importance was stored on the
+    model (see tree_explanations), it is included as well.
+
     Args:
-        model: Trained RandomForestClassifier
+        model: Trained RandomForestClassifier or HistGradientBoostingClassifier
 
     Returns:
         Dictionary containing model information
     """
-    return {
-        "n_estimators": model.n_estimators,
+    if isinstance(model, HistGradientBoostingClassifier):
+        n_estimators = model.n_iter_
+    else:
+        n_estimators = model.n_estimators
+
+    info = {
+        "n_estimators": n_estimators,
         "max_depth": model.max_depth,
         "n_features": model.n_features_in_,
         "random_state": model.random_state,
     }
+    importance = getattr(model, "contribution_importance_", None)
+    if importance is not None:
+        info["contribution_importance"] = importance
+
+    return info
+
+
+def save_model(model: Any, output_path: Path) -> Path:
+    """
+    Persist a trained model to disk.
+
+    The file is written next to its destination first, under a unique
+    name, and then renamed, so readers never observe a partially written
+    model and concurrent writers never write to the same file.
+
+    Args:
+        model: Trained model
+        output_path: Path where to save the model
+
+    Returns:
+        Path of the saved model
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f"{output_path.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    temp_path = Path(temp_name)
+    try:
+        joblib.dump(model, temp_path)
+        temp_path.replace(output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return output_path
+
+
+def load_model(model_path: Path) -> Any:
+    """
+    Load a model saved with save_model.
+
+    Args:
+        model_path: Path to the saved model
+
+    Returns:
+        The trained model
+
+    Raises:
+        FileNotFoundError: If the model file is not found
+    """
+    model_path = Path(model_path)
+    if not model_path.exists():
+        raise FileNotFoundError(f"Model file not found: {model_path}")
+
+    return joblib.load(model_path)
@@ -0,0 +1,305 @@
+"""Model quality evaluation: accuracy, log-loss and ROC AUC.
+
+Metrics are computed from out-of-bag predictions when the model provides
+them (Random Forest trained with bootstrap sampling, the default), which
+costs no extra training. Otherwise they are computed from cross-validation
+folds trained in a process pool; the encoded training matrix is written
+once to a memory-mapped file shared by every worker.
+
+Results are cached per model artifact and training data, in memory and
+optionally as JSON files on disk.
+"""
+
+import hashlib
+import json
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import ClassifierMixin, clone
+from sklearn.model_selection import StratifiedKFold
+
+from out_of_core_training import load_training_matrix, save_training_matrix
+
+# Metrics already computed in this process, by cache key
+_METRICS_CACHE: Dict[str, dict] = {}
+
+# Training matrix opened by each cross-validation worker
+_WORKER_MATRIX: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+
+def accuracy(y_true: np.ndarray, y_prob: np.ndarray) -> float:
+    """
+    Compute the accuracy of probabilities thresholded at 0.5.
+
+    Args:
+        y_true: True labels (0 or 1)
+        y_prob: Predicted probabilities of the positive class
+
+    Returns:
+        Fraction of correct predictions
+    """
+    y_true = np.asarray(y_true)
+    return float(np.mean((np.asarray(y_prob) >= 0.5) == (y_true == 1)))
+
+
+def log_loss(y_true: np.ndarray, y_prob: np.ndarray, eps: float = 1e-15) -> float:
+    """
+    Compute the binary cross-entropy of predicted probabilities.
+
+    Args:
+        y_true: True labels (0 or 1)
+        y_prob: Predicted probabilities of the positive class
+        eps: Probabilities are clipped to [eps, 1 - eps]
+
+    Returns:
+        Mean log-loss
+    """
+    y_true = np.asarray(y_true) == 1
+    y_prob = np.clip(np.asarray(y_prob, dtype=np.float64), eps, 1 - eps)
+    return float(-np.mean(np.where(y_true, np.log(y_prob), np.log1p(-y_prob))))
+
+
+def roc_auc(y_true: np.ndarray, y_prob: np.ndarray) -> float:
+    """
+    Compute the area under the ROC curve with the rank-sum statistic.
+
+    Tied probabilities get their average rank.
+
+    Args:
+        y_true: True labels (0 or 1)
+        y_prob: Predicted probabilities of the positive class
+
+    Returns:
+        ROC AUC, or NaN if only one class is present
+    """
+    y_true = np.asarray(y_true) == 1
+    n_positive = int(y_true.sum())
+    n_negative = len(y_true) - n_positive
+    if n_positive == 0 or n_negative == 0:
+        return float("nan")
+
+    _, inverse, counts = np.unique(y_prob, return_inverse=True, return_counts=True)
+    average_ranks = np.cumsum(counts) - (counts - 1) / 2.0
+    positive_rank_sum = average_ranks[inverse][y_true].sum()
+
+    return float(
+        (positive_rank_sum - n_positive * (n_positive + 1) / 2.0)
+        / (n_positive * n_negative)
+    )
+
+
+def compute_metrics(y_true: np.ndarray, y_prob: np.ndarray) -> dict:
+    """
+    Compute every quality metric of predicted probabilities.
+
+    Args:
+        y_true: True labels (0 or 1)
+        y_prob: Predicted probabilities of the positive class
+
+    Returns:
+        Dictionary with accuracy, log_loss and roc_auc
+    """
+    return {
+        "accuracy": accuracy(y_true, y_prob),
+        "log_loss": log_loss(y_true, y_prob),
+        "roc_auc": roc_auc(y_true, y_prob),
+    }
+
+
+def model_artifact_hash(model: ClassifierMixin) -> str:
+    """
+    Compute a hash identifying a trained model.
+
+    Args:
+        model: Trained model, or path to a model saved with save_model
+
+    Returns:
+        SHA-256 hex digest of the serialized model
+    """
+    if isinstance(model, (str, Path)):
+        return hashlib.sha256(Path(model).read_bytes()).hexdigest()
+    return hashlib.sha256(pickle.dumps(model)).hexdigest()
+
+
+def _data_hash(X_train: pd.DataFrame, y_train: pd.Series) -> str:
+    """Compute a hash identifying a training set."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(c) for c in X_train.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(X_train, index=False).to_numpy())
+    digest.update(pd.util.hash_pandas_object(y_train, index=False).to_numpy())
+    return digest.hexdigest()
+
+
+def oob_probabilities(
+    model: ClassifierMixin, X_train: Optional[pd.DataFrame] = None
+) -> Optional[np.ndarray]:
+    """
+    Get the out-of-bag probabilities of the positive class, if available.
+
+    They are read from oob_decision_function_ (oob_score=True), or else
+    computed from the rows each tree did not sample: any forest trained
+    with bootstrap=True provides them without refitting.
+
+    Args:
+        model: Trained model
+        X_train: Training features the model was trained on (needed when
+            the model has no oob_decision_function_)
+
+    Returns:
+        Array of probabilities (NaN for rows that were never out-of-bag),
+        or None if the model has no out-of-bag predictions
+    """
+    positive_index = list(model.classes_).index(1)
+    oob_decision = getattr(model, "oob_decision_function_", None)
+    if oob_decision is not None:
+        return oob_decision[:, positive_index]
+
+    # Sample indices are only valid for a forest fitted on exactly these rows
+    # (not for trees assembled by out_of_core_training or merged data shards)
+    if X_train is None or not getattr(model, "bootstrap", False):
+        return None
+    if getattr(model, "_n_samples", None) != X_train.shape[0]:
+        return None
+
+    X = X_train.to_numpy(dtype=np.float32) if hasattr(X_train, "columns") else X_train
+    sums = np.zeros(X.shape[0])
+    counts = np.zeros(X.shape[0])
+    for tree, in_bag in zip(model.estimators_, model.estimators_samples_):
+        out_of_bag = np.ones(X.shape[0], dtype=bool)
+        out_of_bag[in_bag] = False
+        sums[out_of_bag] += tree.predict_proba(X[out_of_bag])[:, positive_index]
+        counts[out_of_bag] += 1
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+
+def _init_worker(data_dir: str) -> None:
+    """Open the shared training matrix in a cross-validation worker."""
+    global _WORKER_MATRIX
+    X, y, _ = load_training_matrix(Path(data_dir))
+    _WORKER_MATRIX = (X, y)
+
+
+def _fit_fold(
+    task: Tuple[ClassifierMixin, np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fit a model on one fold and predict its held-out rows."""
+    model, train_rows, test_rows = task
+    X, y = _WORKER_MATRIX
+    model.fit(X[train_rows], y[train_rows])
+    positive_index = list(model.classes_).index(1)
+    return test_rows, model.predict_proba(X[test_rows])[:, positive_index]
+
+
+def cross_validation_probabilities(
+    model: ClassifierMixin,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    n_folds: int = 5,
+    n_jobs: Optional[int] = None,
+    random_state: int = 1,
+) -> np.ndarray:
+    """
+    Compute out-of-fold probabilities with folds trained in parallel.
+
+    Args:
+        model: Model whose parameters are used for every fold (not modified)
+        X_train: Training features (preprocessed)
+        y_train: Training target variable
+        n_folds: Number of stratified folds
+        n_jobs: Number of worker processes (defaults to n_folds)
+        random_state: Random seed of the fold split
+
+    Returns:
+        Array with one out-of-fold probability per training row
+    """
+    folds = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=random_state)
+    fold_model = clone(model)
+    if "n_jobs" in fold_model.get_params():
+        # Folds already run in parallel: one job per fold avoids oversubscription
+        fold_model.set_params(n_jobs=1)
+    tasks = [
+        (clone(fold_model), train_rows, test_rows)
+        for train_rows, test_rows in folds.split(np.zeros(len(y_train)), y_train)
+    ]
+
+    probabilities = np.empty(len(y_train), dtype=np.float64)
+    with tempfile.TemporaryDirectory() as data_dir:
+        save_training_matrix(X_train, y_train, Path(data_dir))
+        with ProcessPoolExecutor(
+            max_workers=n_jobs or n_folds,
+            initializer=_init_worker,
+            initargs=(data_dir,),
+        ) as executor:
+            for test_rows, fold_probabilities in executor.map(_fit_fold, tasks):
+                probabilities[test_rows] = fold_probabilities
+
+    return probabilities
+
+
+def evaluate_model(
+    model: ClassifierMixin,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    n_folds: int = 5,
+    n_jobs: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+) -> dict:
+    """
+    Evaluate the quality of a trained model.
+
+    Out-of-bag predictions are used when available, cross-validation
+    otherwise. Results are cached per model artifact hash and training data.
+
+    Args:
+        model: Trained model
+        X_train: Training features the model was trained on
+        y_train: Training target variable
+        n_folds: Number of cross-validation folds
+        n_jobs: Number of cross-validation worker processes
+        cache_dir: Optional directory where results are cached as JSON
+
+    Returns:
+        Dictionary with accuracy, log_loss, roc_auc, the method used
+        ("oob" or "cv") and the number of evaluated rows
+    """
+    cache_key = hashlib.sha256(
+        f"{model_artifact_hash(model)}:{_data_hash(X_train, y_train)}:"
+        f"{n_folds}".encode()
+    ).hexdigest()
+
+    if cache_key in _METRICS_CACHE:
+        return dict(_METRICS_CACHE[cache_key])
+    cache_path = Path(cache_dir) / f"{cache_key}.json" if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        metrics = json.loads(cache_path.read_text())
+        _METRICS_CACHE[cache_key] = metrics
+        return dict(metrics)
+
+    y_true = np.asarray(y_train)
+    probabilities = oob_probabilities(model, X_train)
+    if probabilities is not None:
+        method = "oob"
+        evaluated = ~np.isnan(probabilities)
+        y_true, probabilities = y_true[evaluated], probabilities[evaluated]
+    else:
+        method = "cv"
+        probabilities = cross_validation_probabilities(
+            model, X_train, y_train, n_folds, n_jobs
+        )
+
+    metrics = compute_metrics(y_true, probabilities)
+    metrics.update({"method": method, "n_samples": int(len(y_true))})
+
+    _METRICS_CACHE[cache_key] = metrics
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(metrics, indent=2))
+
+    return dict(metrics)
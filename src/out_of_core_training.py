@@ -0,0 +1,379 @@
+"""Out-of-core Random Forest training from a memory-mapped training matrix.
+
+The encoded training matrix is stored on disk as a NumPy .npy file and
+opened with a memory map. It is written one encoded chunk at a time (for
+example from the chunks of a CSV file), so the full dataset never has to fit
+in memory. Each tree only reads its own bootstrap sample of max_samples rows,
+so memory usage is bounded by the sample size (times n_jobs) rather than by
+the size of the dataset.
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.utils import check_random_state
+from sklearn.utils.class_weight import compute_class_weight
+
+from data_validation import iter_validated_csv
+
+MATRIX_FILE = "X.npy"
+TARGET_FILE = "y.npy"
+COLUMNS_FILE = "columns.json"
+
+# Size of the .npy headers, written before the number of rows is known and
+# rewritten at the end: large enough for any shape
+NPY_HEADER_BYTES = 128
+
+
+def _write_npy_header(file: Any, dtype: np.dtype, shape: Tuple[int, ...]) -> None:
+    """Write a .npy (version 1.0) header of NPY_HEADER_BYTES at the file start."""
+    header = repr(
+        {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+            "fortran_order": False,
+            "shape": shape,
+        }
+    )
+    header = header.ljust(NPY_HEADER_BYTES - 11) + "\n"
+    file.seek(0)
+    file.write(np.lib.format.magic(1, 0))
+    file.write(struct.pack("<H", len(header)))
+    file.write(header.encode("latin1"))
+
+
+def write_training_matrix(
+    chunks: Iterable[Tuple[pd.DataFrame, pd.Series]],
+    columns: List[str],
+    output_dir: Path,
+) -> Path:
+    """
+    Write encoded training chunks to disk for out-of-core training.
+
+    Chunks are appended as they come, so only one of them is in memory at a
+    time. The files are renamed into place once every chunk is written.
+
+    Args:
+        chunks: Tuples of (features, target) of consecutive rows, with the
+            features encoded in the given columns
+        columns: Encoded feature names, in order
+        output_dir: Directory where to save the matrix
+
+    Returns:
+        Path of the directory containing the matrix
+
+    Raises:
+        ValueError: If the columns of a chunk differ from columns, or if
+            there are no rows
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    matrix_path = output_dir / (MATRIX_FILE + ".tmp")
+    target_path = output_dir / (TARGET_FILE + ".tmp")
+
+    n_rows = 0
+    target_dtype = None
+    with open(matrix_path, "wb") as matrix_file, open(target_path, "wb") as target_file:
+        _write_npy_header(matrix_file, np.float32, (0, len(columns)))
+        _write_npy_header(target_file, np.int64, (0,))
+        for X_chunk, y_chunk in chunks:
+            if list(X_chunk.columns) != list(columns):
+                raise ValueError(
+                    f"Chunk columns {list(X_chunk.columns)} differ from {columns}"
+                )
+            y_chunk = np.asarray(y_chunk)
+            if target_dtype is None:
+                target_dtype = y_chunk.dtype
+            matrix_file.write(X_chunk.to_numpy(dtype=np.float32).tobytes())
+            target_file.write(y_chunk.astype(target_dtype).tobytes())
+            n_rows += len(X_chunk)
+
+        if n_rows == 0:
+            raise ValueError("No training rows to write")
+        _write_npy_header(matrix_file, np.float32, (n_rows, len(columns)))
+        _write_npy_header(target_file, target_dtype, (n_rows,))
+
+    matrix_path.replace(output_dir / MATRIX_FILE)
+    target_path.replace(output_dir / TARGET_FILE)
+    (output_dir / COLUMNS_FILE).write_text(json.dumps(list(columns)))
+
+    return output_dir
+
+
+def encode_chunk(
+    chunk: pd.DataFrame, features: list, columns: List[str]
+) -> pd.DataFrame:
+    """
+    One-hot encode a chunk of raw data into a fixed list of columns.
+
+    Categories absent from the chunk get a column of zeros, as for
+    preprocess_features applied to the full data.
+
+    Args:
+        chunk: Chunk of validated (and imputed) data
+        features: List of feature column names to use
+        columns: Encoded feature names, in order
+
+    Returns:
+        Encoded features of the chunk
+
+    Raises:
+        ValueError: If the chunk has a category without a column
+    """
+    encoded = pd.get_dummies(chunk[features])
+    unknown = [column for column in encoded.columns if column not in columns]
+    if unknown:
+        raise ValueError(f"Encoded columns not in the column list: {unknown}")
+
+    return encoded.reindex(columns=columns, fill_value=0)
+
+
+def build_training_matrix(
+    csv_path: Path,
+    schema: Dict[str, Dict[str, Any]],
+    features: list,
+    target: str,
+    columns: List[str],
+    output_dir: Path,
+    imputation: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 100_000,
+) -> Path:
+    """
+    Build the training matrix from a CSV file, one chunk at a time.
+
+    Args:
+        csv_path: Path to the training CSV file
+        schema: Expected columns and their constraints
+        features: List of feature column names to use
+        target: Name of the target column
+        columns: Encoded feature names, in order (every category must have
+            a column)
+        output_dir: Directory where to save the matrix
+        imputation: Fill values returned by fit_imputation (no imputation
+            if None)
+        chunk_size: Number of rows read, encoded and written at a time
+
+    Returns:
+        Path of the directory containing the matrix
+    """
+    chunks = (
+        (encode_chunk(chunk, features, columns), chunk[target])
+        for chunk, _ in iter_validated_csv(csv_path, schema, imputation, chunk_size)
+    )
+
+    return write_training_matrix(chunks, columns, output_dir)
+
+
+def save_training_matrix(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    output_dir: Path,
+    chunk_size: int = 100_000,
+) -> Path:
+    """
+    Save an in-memory training matrix to disk for out-of-core training.
+
+    Data too large for memory is written with build_training_matrix or
+    write_training_matrix instead.
+
+    Args:
+        X_train: Training features (preprocessed)
+        y_train: Training target variable
+        output_dir: Directory where to save the matrix
+        chunk_size: Number of rows converted and written at a time
+
+    Returns:
+        Path of the directory containing the matrix
+    """
+    rows = (
+        slice(start, start + chunk_size) for start in range(0, len(X_train), chunk_size)
+    )
+    chunks = ((X_train.iloc[row_slice], y_train.iloc[row_slice]) for row_slice in rows)
+
+    return write_training_matrix(chunks, list(X_train.columns), output_dir)
+
+
+def load_training_matrix(data_dir: Path) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Open a training matrix saved with save_training_matrix without reading it.
+
+    Args:
+        data_dir: Directory containing the matrix
+
+    Returns:
+        Tuple containing (X, y, columns) where X and y are memory-mapped
+
+    Raises:
+        FileNotFoundError: If the matrix files are not found
+    """
+    data_dir = Path(data_dir)
+    try:
+        X = np.load(data_dir / MATRIX_FILE, mmap_mode="r")
+        y = np.load(data_dir / TARGET_FILE, mmap_mode="r")
+        columns = json.loads((data_dir / COLUMNS_FILE).read_text())
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Training matrix not found: {e}")
+
+    return X, y, columns
+
+
+def _resolve_sample_size(max_samples: Union[int, float], n_rows: int) -> int:
+    """Convert a max_samples value (count or fraction) to a number of rows."""
+    if isinstance(max_samples, float):
+        if not 0.0 < max_samples <= 1.0:
+            raise ValueError("max_samples as a fraction must be in (0, 1]")
+        return max(1, int(round(max_samples * n_rows)))
+
+    if max_samples < 1:
+        raise ValueError("max_samples must be at least 1")
+    return min(int(max_samples), n_rows)
+
+
+def _draw_sample(
+    rng: np.random.RandomState, n_rows: int, n_samples: int, bootstrap: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw sorted row indices and their multiplicity for one tree."""
+    if bootstrap:
+        rows, counts = np.unique(
+            rng.randint(0, n_rows, size=n_samples), return_counts=True
+        )
+    else:
+        rows = np.sort(rng.choice(n_rows, size=n_samples, replace=False))
+        counts = np.ones(len(rows), dtype=np.int64)
+
+    return rows, counts.astype(np.float64)
+
+
+def _fit_tree(
+    X: np.ndarray,
+    y: np.ndarray,
+    classes: np.ndarray,
+    class_rows: np.ndarray,
+    tree_params: Dict[str, Any],
+    seed: int,
+    n_samples: int,
+    bootstrap: bool,
+    class_weight: Any,
+    class_weights: Optional[np.ndarray],
+) -> DecisionTreeClassifier:
+    """Fit one tree on its own sample of rows read from the memory map."""
+    rows, weights = _draw_sample(
+        np.random.RandomState(seed), len(y), n_samples, bootstrap
+    )
+
+    # Make sure every class is present, without giving it any weight
+    missing = np.setdiff1d(class_rows, rows)
+    missing = missing[~np.isin(y[missing], y[rows])]
+    if len(missing):
+        rows = np.concatenate([rows, missing])
+        weights = np.concatenate([weights, np.zeros(len(missing))])
+
+    X_sample = np.asarray(X[rows], dtype=np.float32)
+    y_sample = np.searchsorted(classes, y[rows])
+
+    if class_weight == "balanced_subsample":
+        # Balanced over the classes drawn for this tree, as in scikit-learn
+        counts = np.bincount(y_sample, weights=weights, minlength=len(classes))
+        drawn = counts > 0
+        scale = np.zeros(len(classes))
+        scale[drawn] = weights.sum() / (drawn.sum() * counts[drawn])
+        weights = weights * scale[y_sample]
+    elif class_weights is not None:
+        weights = weights * class_weights[y_sample]
+
+    tree = DecisionTreeClassifier(**tree_params, random_state=seed)
+    tree.fit(X_sample, y_sample, sample_weight=weights)
+
+    return tree
+
+
+def train_random_forest_out_of_core(
+    data_dir: Path,
+    model_params: Dict[str, Any],
+    max_samples: Optional[Union[int, float]] = None,
+) -> RandomForestClassifier:
+    """
+    Train a Random Forest from a memory-mapped training matrix.
+
+    Every tree is fitted on its own sample of max_samples rows, read from
+    disk in sorted order. Trees are fitted by model_params["n_jobs"]
+    threads, each holding one sample in memory. class_weight is applied as
+    in RandomForestClassifier; "balanced" weights are computed from the
+    full target. The returned model is a regular RandomForestClassifier
+    that can be used with generate_predictions.
+
+    Args:
+        data_dir: Directory written by save_training_matrix
+        model_params: Dictionary of Random Forest parameters
+        max_samples: Number (int) or fraction (float) of rows drawn for each
+            tree; defaults to model_params["max_samples"]
+
+    Returns:
+        Trained RandomForestClassifier model
+
+    Raises:
+        ValueError: If no sample size is given, or if oob_score is requested
+            (out-of-bag predictions would need a full pass over the data for
+            every tree; use model_validation cross-validation instead)
+    """
+    params = dict(model_params)
+    if max_samples is None:
+        max_samples = params.get("max_samples")
+    if max_samples is None:
+        raise ValueError("max_samples is required for out-of-core training")
+    if params.get("oob_score"):
+        raise ValueError("oob_score is not supported by out-of-core training")
+    params["max_samples"] = max_samples
+
+    X, y, columns = load_training_matrix(data_dir)
+    n_rows, n_features = X.shape
+    n_samples = _resolve_sample_size(max_samples, n_rows)
+
+    forest = RandomForestClassifier(**params)
+    tree_params = {
+        name: getattr(forest, name)
+        for name in forest.estimator_params
+        if name != "random_state"
+    }
+    rng = check_random_state(forest.random_state)
+
+    # Trees are fitted on encoded labels so that they all share the same
+    # classes, like in RandomForestClassifier.fit
+    classes = np.unique(y)
+    class_rows = np.array([np.flatnonzero(y == c)[0] for c in classes])
+    class_weights = None
+    if forest.class_weight not in (None, "balanced_subsample"):
+        class_weights = compute_class_weight(forest.class_weight, classes=classes, y=y)
+
+    seeds = rng.randint(np.iinfo(np.int32).max, size=forest.n_estimators)
+    estimators = Parallel(n_jobs=forest.n_jobs, prefer="threads")(
+        delayed(_fit_tree)(
+            X,
+            y,
+            classes,
+            class_rows,
+            tree_params,
+            seed,
+            n_samples,
+            forest.bootstrap,
+            forest.class_weight,
+            class_weights,
+        )
+        for seed in seeds
+    )
+
+    forest.estimator_ = DecisionTreeClassifier(**tree_params)
+    forest.estimators_ = estimators
+    forest.classes_ = classes
+    forest.n_classes_ = len(classes)
+    forest.n_outputs_ = 1
+    forest.n_features_in_ = n_features
+    forest.feature_names_in_ = np.asarray(columns, dtype=object)
+
+    return forest
@@ -0,0 +1,227 @@
+"""Container-aware sizing of parallelism, thread pools, batches and chunks.
+
+The CPU quota and memory limit are read from the cgroup filesystem (v2:
+cpu.max and memory.max, v1: cpu.cfs_quota_us/cpu.cfs_period_us and
+memory.limit_in_bytes), falling back to the host CPUs and memory outside a
+container. Settings derived from them can be overridden in config or with
+environment variables, which take precedence:
+
+    TITANIC_N_JOBS, TITANIC_THREADS, TITANIC_BATCH_SIZE, TITANIC_CHUNK_SIZE
+"""
+
+import math
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from threadpoolctl import threadpool_limits
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+ENV_PREFIX = "TITANIC_"
+SETTINGS = ["n_jobs", "threads", "batch_size", "chunk_size"]
+
+# Fraction of the memory limit that batches and chunks may use
+MEMORY_FRACTION = 0.25
+
+# Estimated peak memory per row while loading (raw CSV, strings, validation)
+# and while predicting (encoded features and per-tree probabilities)
+LOAD_ROW_BYTES = 4096
+PREDICTION_ROW_BYTES = 2048
+
+# Smallest batch and chunk sizes, whatever the memory limit
+MIN_ROWS = 1_000
+
+
+def _read_value(path: Path) -> Optional[str]:
+    """Read a cgroup file, or None if it does not exist."""
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(cgroup_root: Path = CGROUP_ROOT) -> Optional[float]:
+    """
+    Read the CPU quota of the cgroup, in CPUs.
+
+    Args:
+        cgroup_root: Mount point of the cgroup filesystem
+
+    Returns:
+        Number of CPUs allowed by the quota (may be fractional), or None if
+        there is no quota
+    """
+    cgroup_root = Path(cgroup_root)
+
+    cpu_max = _read_value(cgroup_root / "cpu.max")
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(" ")
+        if quota == "max":
+            return None
+        return int(quota) / int(period or 100_000)
+
+    for directory in ["cpu", "cpu,cpuacct"]:
+        quota = _read_value(cgroup_root / directory / "cpu.cfs_quota_us")
+        period = _read_value(cgroup_root / directory / "cpu.cfs_period_us")
+        if quota is not None and period is not None:
+            return int(quota) / int(period) if int(quota) > 0 else None
+
+    return None
+
+
+def cgroup_memory_limit(cgroup_root: Path = CGROUP_ROOT) -> Optional[int]:
+    """
+    Read the memory limit of the cgroup, in bytes.
+
+    Args:
+        cgroup_root: Mount point of the cgroup filesystem
+
+    Returns:
+        Memory limit, or None if the cgroup is not limited
+    """
+    cgroup_root = Path(cgroup_root)
+
+    memory_max = _read_value(cgroup_root / "memory.max")
+    if memory_max is not None:
+        return None if memory_max == "max" else int(memory_max)
+
+    limit = _read_value(cgroup_root / "memory" / "memory.limit_in_bytes")
+    if limit is None:
+        return None
+    # cgroup v1 reports "unlimited" as a huge number close to 2**63
+    return int(limit) if int(limit) < 2**62 else None
+
+
+def host_cpu_count() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def host_memory() -> Optional[int]:
+    """Physical memory of the host in bytes, or None if unknown."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def detect_resources(cgroup_root: Path = CGROUP_ROOT) -> Dict[str, Any]:
+    """
+    Detect the CPUs and memory available to the process.
+
+    Args:
+        cgroup_root: Mount point of the cgroup filesystem
+
+    Returns:
+        Dictionary with the number of usable CPUs, the usable memory in
+        bytes (None if unknown) and the cgroup CPU quota and memory limit
+        (None if not limited)
+    """
+    cpu_quota = cgroup_cpu_limit(cgroup_root)
+    memory_limit = cgroup_memory_limit(cgroup_root)
+
+    cpus = host_cpu_count()
+    if cpu_quota is not None:
+        cpus = max(1, min(cpus, math.ceil(cpu_quota)))
+
+    memory = host_memory()
+    if memory_limit is not None:
+        memory = min(memory, memory_limit) if memory else memory_limit
+
+    return {
+        "cpus": cpus,
+        "memory_bytes": memory,
+        "cgroup_cpu_quota": cpu_quota,
+        "cgroup_memory_limit": memory_limit,
+    }
+
+
+def _memory_rows(memory: Optional[int], row_bytes: int, max_rows: int) -> int:
+    """Number of rows fitting in the memory budget, within bounds."""
+    if memory is None:
+        return max_rows
+    return min(max_rows, max(MIN_ROWS, int(memory * MEMORY_FRACTION) // row_bytes))
+
+
+def tune_resources(
+    resources: Dict[str, Any],
+    overrides: Optional[Dict[str, Optional[int]]] = None,
+    max_batch_size: int = 100_000,
+    max_chunk_size: int = 100_000,
+) -> Dict[str, int]:
+    """
+    Size parallelism, thread pools, prediction batches and loading chunks.
+
+    Training jobs and threads match the usable CPUs. Batch and chunk sizes
+    are the maximum sizes, reduced so that they fit in a fraction of the
+    memory limit. Each setting can be overridden, first by an environment
+    variable (TITANIC_<SETTING>), then by a non-None value in overrides.
+
+    Args:
+        resources: Resources returned by detect_resources
+        overrides: Values replacing the derived ones, by setting name
+        max_batch_size: Largest number of rows predicted at once
+        max_chunk_size: Largest number of rows loaded at once
+
+    Returns:
+        Dictionary with n_jobs, threads, batch_size and chunk_size
+
+    Raises:
+        ValueError: If an override is not a positive integer
+    """
+    memory = resources["memory_bytes"]
+    settings = {
+        "n_jobs": resources["cpus"],
+        "threads": resources["cpus"],
+        "batch_size": _memory_rows(memory, PREDICTION_ROW_BYTES, max_batch_size),
+        "chunk_size": _memory_rows(memory, LOAD_ROW_BYTES, max_chunk_size),
+    }
+
+    overrides = overrides or {}
+    for name in SETTINGS:
+        value = os.environ.get(f"{ENV_PREFIX}{name.upper()}", overrides.get(name))
+        if value is None:
+            continue
+        if not str(value).isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid {name} override: {value!r}")
+        settings[name] = int(value)
+
+    return settings
+
+
+def apply_thread_limits(settings: Dict[str, int]) -> None:
+    """
+    Limit the OpenMP and BLAS thread pools of the process.
+
+    Worker processes started afterwards inherit the limit through the
+    OMP_NUM_THREADS environment variable.
+
+    Args:
+        settings: Settings returned by tune_resources
+    """
+    threadpool_limits(limits=settings["threads"])
+    os.environ["OMP_NUM_THREADS"] = str(settings["threads"])
+
+
+def print_resources(resources: Dict[str, Any], settings: Dict[str, int]) -> None:
+    """
+    Print the detected resources and the chosen settings.
+
+    Args:
+        resources: Resources returned by detect_resources
+        settings: Settings returned by tune_resources
+    """
+    quota = resources["cgroup_cpu_quota"]
+    limit = resources["cgroup_memory_limit"]
+    memory = resources["memory_bytes"]
+    memory_text = f"{memory / 2**30:.1f} GiB" if memory else "unknown"
+    limit_text = "none" if limit is None else f"{limit / 2**30:.1f} GiB"
+    print(f"  - CPUs: {resources['cpus']} (cgroup quota: {quota or 'none'})")
+    print(f"  - Memory: {memory_text} (cgroup limit: {limit_text})")
+    print(
+        f"  - Jobs: {settings['n_jobs']}, threads: {settings['threads']}, "
+        f"batch size: {settings['batch_size']}, "
+        f"chunk size: {settings['chunk_size']}"
+    )
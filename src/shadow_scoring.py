@@ -0,0 +1,317 @@
+"""Champion/challenger shadow scoring in a single pass.
+
+The test data is loaded and one-hot encoded once, for the union of the
+features of every model (once per set of feature engineering parameters
+and fill values of missing data when models carry them). Each model then
+scores its own columns of the shared encoded frame, and the predictions
+are compared with the champion in a compact per-row report with aggregate
+statistics.
+
+Models are either loaded from files saved with save_model:
+
+    python src/shadow_scoring.py champion=model_a.joblib challenger=model_b.joblib
+
+from the model registry in config.MODEL_REGISTRY_DIR, as key or key@version:
+
+    python src/shadow_scoring.py champion=rf_base challenger=rf_deep@3
+
+or, without arguments, trained from config.FEATURES/RANDOM_FOREST_PARAMS
+(the champion) and config.SHADOW_CHALLENGERS.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import ClassifierMixin
+
+import config
+from data_preprocessing import preprocess_features
+from data_validation import (
+    fit_imputation,
+    get_imputation,
+    impute_missing,
+    load_validated_csv,
+    store_imputation,
+)
+from feature_engineering import engineer_features, get_feature_params
+from model_evaluation import generate_probabilities
+from model_registry import ModelRegistry
+from model_training import load_model, train_random_forest
+
+
+def raw_feature_columns(feature_names: List[str], columns: List[str]) -> List[str]:
+    """
+    Find the raw data columns behind one-hot encoded feature names.
+
+    Args:
+        feature_names: Encoded feature names (e.g. "Pclass", "Sex_male")
+        columns: Columns of the raw data
+
+    Returns:
+        Raw columns needed to build the encoded features, in data order
+    """
+    needed = set()
+    for name in feature_names:
+        if name in columns:
+            needed.add(name)
+            continue
+        for column in columns:
+            if name.startswith(f"{column}_"):
+                needed.add(column)
+
+    return [column for column in columns if column in needed]
+
+
+def score_models(
+    models: Dict[str, ClassifierMixin], X_encoded: pd.DataFrame, columns: List[str]
+) -> pd.DataFrame:
+    """
+    Score a shared encoded frame with several models.
+
+    Each model reads the columns it was trained on. One-hot columns of a raw
+    column that is present, but whose category does not appear in the data,
+    are filled with 0.
+
+    Args:
+        models: Trained models by name, trained on one-hot encoded features
+        X_encoded: Encoded test features covering every model
+        columns: Columns of the raw data X_encoded was built from
+
+    Returns:
+        DataFrame with one column of survival probabilities per model
+
+    Raises:
+        ValueError: If a model feature cannot be built from the raw columns
+    """
+    probabilities = {}
+    for name, model in models.items():
+        untraced = [
+            feature
+            for feature in model.feature_names_in_
+            if feature not in X_encoded.columns
+            and not any(feature.startswith(f"{column}_") for column in columns)
+        ]
+        if untraced:
+            raise ValueError(f"Features of model {name} not found in data: {untraced}")
+
+        X_model = X_encoded.reindex(columns=model.feature_names_in_, fill_value=0)
+        probabilities[name] = generate_probabilities(model, X_model)
+
+    return pd.DataFrame(probabilities, index=X_encoded.index)
+
+
+def build_shadow_report(
+    passenger_ids: pd.Series, probabilities: pd.DataFrame, champion: str
+) -> Tuple[pd.DataFrame, dict]:
+    """
+    Compare the predictions of the challengers with the champion.
+
+    Args:
+        passenger_ids: PassengerId of each scored row
+        probabilities: Survival probabilities, one column per model
+        champion: Name of the reference model
+
+    Returns:
+        Tuple containing (report, summary):
+            - report: One row per passenger with each model's prediction,
+              each challenger's probability difference with the champion and
+              whether all models agree
+            - summary: Aggregate statistics per model and per challenger
+    """
+    challengers = [name for name in probabilities.columns if name != champion]
+    values = probabilities.to_numpy(dtype=np.float64)
+    predictions = (values >= 0.5).astype(np.int8)
+    champion_index = list(probabilities.columns).index(champion)
+    champion_values = values[:, [champion_index]]
+    champion_predictions = predictions[:, [champion_index]]
+
+    deltas = (values - champion_values).astype(np.float32)
+    agree_with_champion = predictions == champion_predictions
+
+    report = pd.DataFrame({"PassengerId": np.asarray(passenger_ids)})
+    for i, name in enumerate(probabilities.columns):
+        report[name] = predictions[:, i]
+    for i, name in enumerate(probabilities.columns):
+        if name != champion:
+            report[f"{name}_delta"] = deltas[:, i]
+    report["agree"] = agree_with_champion.all(axis=1)
+
+    summary = {
+        "champion": champion,
+        "n_rows": len(report),
+        "all_agree_rate": float(report["agree"].mean()),
+        "survival_rate": {
+            name: float(predictions[:, i].mean())
+            for i, name in enumerate(probabilities.columns)
+        },
+        "challengers": {},
+    }
+    for i, name in enumerate(probabilities.columns):
+        if name not in challengers:
+            continue
+        flips = predictions[:, i] - champion_predictions[:, 0]
+        summary["challengers"][name] = {
+            "agreement_rate": float(agree_with_champion[:, i].mean()),
+            "flips_to_survived": int(np.sum(flips == 1)),
+            "flips_to_died": int(np.sum(flips == -1)),
+            "mean_abs_delta": float(np.mean(np.abs(deltas[:, i]))),
+            "max_abs_delta": float(np.max(np.abs(deltas[:, i]), initial=0.0)),
+        }
+
+    return report, summary
+
+
+def run_shadow_scoring(
+    models: Dict[str, ClassifierMixin],
+    test_data: pd.DataFrame,
+    champion: str,
+    output_path: Path,
+) -> dict:
+    """
+    Encode the test data once, score it with every model and save the report.
+
+    Models trained on engineered features (see feature_engineering) are
+    scored on the test data engineered with their stored parameters, then
+    filled with their stored fill values (see data_validation), as in the
+    training pipeline; the data is encoded once per distinct set of
+    parameters and fill values.
+
+    Args:
+        models: Trained models by name, trained on one-hot encoded features
+        test_data: Validated test dataset, not imputed
+        champion: Name of the reference model
+        output_path: Path where to save the per-row report (CSV)
+
+    Returns:
+        Summary statistics of the comparison
+
+    Raises:
+        ValueError: If the champion is not one of the models, or a model
+            feature cannot be built from the test data
+    """
+    if champion not in models:
+        raise ValueError(f"Champion model not found: {champion}")
+
+    # Models carrying feature engineering parameters or fill values score
+    # the test data transformed with them; the others share the raw data
+    groups: Dict[str, List[str]] = {}
+    for name, model in models.items():
+        key = json.dumps(
+            [get_feature_params(model), get_imputation(model)], sort_keys=True
+        )
+        groups.setdefault(key, []).append(name)
+
+    group_probabilities = []
+    for key, names in groups.items():
+        feature_params, imputation = json.loads(key)
+        data = test_data
+        if feature_params is not None:
+            data = engineer_features(data, feature_params)
+        if imputation is not None:
+            data = impute_missing(data, imputation)
+        feature_names = [
+            feature for name in names for feature in models[name].feature_names_in_
+        ]
+        columns = raw_feature_columns(feature_names, list(data.columns))
+        X_encoded = pd.get_dummies(data[columns])
+        group_probabilities.append(
+            score_models(
+                {name: models[name] for name in names},
+                X_encoded,
+                list(data.columns),
+            )
+        )
+
+    probabilities = pd.concat(group_probabilities, axis=1)[list(models)]
+    report, summary = build_shadow_report(
+        test_data.PassengerId, probabilities, champion
+    )
+
+    report.to_csv(output_path, index=False)
+    print(f"Shadow report saved successfully to: {output_path}")
+
+    return summary
+
+
+def print_shadow_summary(summary: dict) -> None:
+    """
+    Print the aggregate statistics of a shadow scoring run.
+
+    Args:
+        summary: Summary returned by run_shadow_scoring
+    """
+    print("\n=== Shadow Scoring Summary ===")
+    print(f"Passengers scored: {summary['n_rows']}")
+    print(f"All models agree: {summary['all_agree_rate']:.1%}")
+    for name, rate in summary["survival_rate"].items():
+        print(f"Predicted survival rate ({name}): {rate:.1%}")
+    for name, stats in summary["challengers"].items():
+        print(
+            f"{name} vs {summary['champion']}: "
+            f"{stats['agreement_rate']:.1%} agreement, "
+            f"{stats['flips_to_survived']} flips to survived, "
+            f"{stats['flips_to_died']} flips to died, "
+            f"mean |delta| {stats['mean_abs_delta']:.4f}"
+        )
+    print("=" * 30)
+
+
+def _models_from_config(train_data: pd.DataFrame) -> Dict[str, ClassifierMixin]:
+    """Train the champion and the challengers described in config."""
+    imputation = fit_imputation(train_data)
+    train_data = impute_missing(train_data, imputation)
+    candidates = {
+        "champion": {
+            "features": config.FEATURES,
+            "params": config.RANDOM_FOREST_PARAMS,
+        }
+    }
+    candidates.update(config.SHADOW_CHALLENGERS)
+
+    models = {}
+    for name, candidate in candidates.items():
+        X_train, y_train, _ = preprocess_features(
+            train_data, train_data.head(0), candidate["features"], config.TARGET
+        )
+        models[name] = train_random_forest(X_train, y_train, candidate["params"])
+        store_imputation(models[name], imputation)
+
+    return models
+
+
+def main(arguments: List[str]) -> None:
+    """Run a shadow comparison of models given as name=source arguments."""
+    train_data, _ = load_validated_csv(
+        config.TRAIN_DATA_PATH, config.DATA_SCHEMA, chunk_size=config.LOAD_CHUNK_SIZE
+    )
+    test_data, _ = load_validated_csv(
+        config.TEST_DATA_PATH, config.DATA_SCHEMA, chunk_size=config.LOAD_CHUNK_SIZE
+    )
+
+    if arguments:
+        registry = ModelRegistry(
+            config.MODEL_REGISTRY_DIR, config.MODEL_REGISTRY_MAX_BYTES
+        )
+        models = {}
+        for argument in arguments:
+            name, _, source = argument.partition("=")
+            if source.endswith(".joblib"):
+                models[name] = load_model(Path(source))
+            else:
+                key, _, version = source.partition("@")
+                models[name] = registry.get(key, int(version) if version else None)
+        champion = next(iter(models))
+    else:
+        models = _models_from_config(train_data)
+        champion = "champion"
+
+    summary = run_shadow_scoring(models, test_data, champion, config.SHADOW_REPORT_PATH)
+    print_shadow_summary(summary)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,312 @@
+"""Per-passenger explanations of Random Forest predictions.
+
+Contributions are exact path-dependent TreeSHAP values: for every row, the
+survival probability equals the base value (average training prediction)
+plus the sum of the feature contributions.
+
+Each leaf of the forest is described by the unique features on its path:
+the interval of values leading to the leaf, whether missing values (NaN)
+are routed to the leaf, and the fraction of training samples (cover)
+following the path. The Shapley value of a feature in a leaf is an
+integral of a polynomial over [0, 1], computed exactly with Gauss-Legendre
+quadrature, so every row, leaf and tree is handled by the same NumPy
+operations instead of a recursion per row.
+
+Identical encoded rows are explained once, and contributions are cached per
+model and unique feature vector.
+"""
+
+import hashlib
+import math
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import ClassifierMixin
+
+# Maximum number of unique rows kept in the contribution cache
+CACHE_MAX_ROWS = 100_000
+
+# Number of (row, leaf, path feature) values computed at once
+CHUNK_ELEMENTS = 2**22
+
+_CONTRIBUTION_CACHE: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+
+
+def _model_key(model: ClassifierMixin) -> str:
+    """Compute a hash identifying the trees of a model."""
+    return hashlib.sha256(pickle.dumps((model.classes_, model.estimators_))).hexdigest()
+
+
+def _base_value(model: ClassifierMixin) -> float:
+    """Compute the average positive class fraction at the roots of the trees."""
+    positive_index = list(model.classes_).index(1)
+    roots = np.array([tree.tree_.value[0, 0] for tree in model.estimators_])
+    return float(np.mean(roots[:, positive_index] / roots.sum(axis=1)))
+
+
+def _leaf_paths(tree: Any, positive_index: int) -> Tuple[list, np.ndarray]:
+    """List the path conditions and positive class fraction of each leaf."""
+    tree_ = tree.tree_
+    fractions = tree_.value[:, 0, :] / tree_.value[:, 0, :].sum(axis=1, keepdims=True)
+    weights = tree_.weighted_n_node_samples
+    # Absent before scikit-learn 1.3, which does not accept missing values
+    missing_go_to_left = getattr(tree_, "missing_go_to_left", None)
+
+    paths = []
+    leaf_values = []
+    stack = [(0, {})]
+    while stack:
+        node, conditions = stack.pop()
+        left, right = tree_.children_left[node], tree_.children_right[node]
+        if left == right:
+            paths.append(conditions)
+            leaf_values.append(fractions[node, positive_index])
+            continue
+
+        feature = int(tree_.feature[node])
+        threshold = float(tree_.threshold[node])
+        lower, upper, missing, cover = conditions.get(
+            feature, (-np.inf, np.inf, True, 1.0)
+        )
+        missing_left = missing_go_to_left is not None and missing_go_to_left[node]
+        for child, child_lower, child_upper, child_missing in [
+            (left, lower, min(upper, threshold), missing and missing_left),
+            (right, max(lower, threshold), upper, missing and not missing_left),
+        ]:
+            child_conditions = dict(conditions)
+            child_conditions[feature] = (
+                child_lower,
+                child_upper,
+                child_missing,
+                cover * weights[child] / weights[node],
+            )
+            stack.append((child, child_conditions))
+
+    return paths, np.array(leaf_values)
+
+
+def build_leaf_table(model: ClassifierMixin) -> Dict[str, Any]:
+    """
+    Describe every leaf of a forest as padded arrays.
+
+    Leaves with fewer unique path features than the longest path are padded
+    with conditions that every row satisfies and a cover of 1; such
+    features do not change any Shapley value.
+
+    Args:
+        model: Trained RandomForestClassifier (binary target)
+
+    Returns:
+        Dictionary with, per leaf and path feature slot, the feature index,
+        lower and upper bounds, whether missing values satisfy the
+        conditions and the cover, plus the leaf values (divided by the
+        number of trees) and the base value
+
+    Raises:
+        ValueError: If the model is not a forest of decision trees
+    """
+    if getattr(model, "estimators_", None) is None:
+        raise ValueError("Tree explanations require a trained Random Forest model")
+    if getattr(model, "n_outputs_", 1) != 1:
+        raise ValueError("Tree explanations require a single target")
+
+    positive_index = list(model.classes_).index(1)
+    n_trees = len(model.estimators_)
+
+    paths = []
+    values = []
+    for tree in model.estimators_:
+        tree_paths, tree_values = _leaf_paths(tree, positive_index)
+        paths.extend(tree_paths)
+        values.append(tree_values / n_trees)
+
+    n_slots = max(1, max(len(conditions) for conditions in paths))
+    features = np.zeros((len(paths), n_slots), dtype=np.intp)
+    lower = np.full((len(paths), n_slots), -np.inf)
+    upper = np.full((len(paths), n_slots), np.inf)
+    missing = np.ones((len(paths), n_slots), dtype=bool)
+    cover = np.ones((len(paths), n_slots))
+    used = np.zeros((len(paths), n_slots), dtype=bool)
+    for leaf, conditions in enumerate(paths):
+        for slot, (feature, bounds) in enumerate(conditions.items()):
+            features[leaf, slot] = feature
+            (
+                lower[leaf, slot],
+                upper[leaf, slot],
+                missing[leaf, slot],
+                cover[leaf, slot],
+            ) = bounds
+            used[leaf, slot] = True
+
+    return {
+        "features": features,
+        "lower": lower,
+        "upper": upper,
+        "missing": missing,
+        "cover": cover,
+        "used": used,
+        "values": np.concatenate(values),
+        "base_value": _base_value(model),
+        "n_features": int(model.n_features_in_),
+    }
+
+
+def leaf_table_contributions(table: Dict[str, Any], X: np.ndarray) -> np.ndarray:
+    """
+    Compute the feature contributions of rows from a leaf table.
+
+    For a leaf with value v, unique path features j, cover z_j and
+    indicator o_j (the row satisfies the conditions on j, or is missing
+    and missing values of j are routed to the leaf), the Shapley
+    value of feature i is
+
+        v * (o_i - z_i) * integral over [0, 1] of prod_{j != i} g_j(u) du
+
+    with g_j(u) = o_j * u + z_j * (1 - u). The integrand is a polynomial of
+    degree (slots - 1), integrated exactly with ceil(slots / 2) nodes.
+
+    Args:
+        table: Leaf table returned by build_leaf_table
+        X: Matrix of rows to explain (float32, as used by the trees)
+
+    Returns:
+        Matrix of contributions of shape (rows, features)
+    """
+    n_leaves, n_slots = table["features"].shape
+    nodes, weights = np.polynomial.legendre.leggauss(math.ceil(n_slots / 2))
+    nodes = (nodes + 1) / 2
+    weights = weights / 2
+
+    # Sums the (leaf, slot) contributions into their feature columns
+    used = table["used"].ravel()
+    assignment = sparse.csr_matrix(
+        (
+            np.ones(used.sum()),
+            (np.flatnonzero(used), table["features"].ravel()[used]),
+        ),
+        shape=(n_leaves * n_slots, table["n_features"]),
+    )
+
+    cover = table["cover"]
+    outside_factors = cover[..., None] * (1 - nodes)
+    inside_factors = outside_factors + nodes
+
+    contributions = np.empty((len(X), table["n_features"]))
+    chunk_size = max(1, CHUNK_ELEMENTS // (n_leaves * n_slots))
+    for start in range(0, len(X), chunk_size):
+        stop = start + chunk_size
+        values = X[start:stop][:, table["features"]]
+        inside = (values > table["lower"]) & (values <= table["upper"])
+        inside |= np.isnan(values) & table["missing"]
+
+        integrals = np.zeros(inside.shape)
+        for q, weight in enumerate(weights):
+            factors = np.where(inside, inside_factors[..., q], outside_factors[..., q])
+            products = factors.prod(axis=2, keepdims=True)
+            integrals += weight * (products / factors)
+
+        slot_values = table["values"][:, None] * (inside - cover) * integrals
+        contributions[start:stop] = slot_values.reshape(len(values), -1) @ assignment
+
+    return contributions
+
+
+def explain_predictions(
+    model: ClassifierMixin, X_test: pd.DataFrame
+) -> Tuple[pd.DataFrame, float]:
+    """
+    Explain the survival probabilities of a Random Forest, row by row.
+
+    Identical rows are explained once; contributions of rows already seen
+    with the same model are read from an in-memory cache.
+
+    Args:
+        model: Trained RandomForestClassifier
+        X_test: Features encoded as for training
+
+    Returns:
+        Tuple containing (contributions, base_value):
+            - contributions: One column per feature, one row per passenger;
+              base_value + the row sum is the survival probability
+            - base_value: Average survival probability of the training data
+
+    Raises:
+        ValueError: If the model is not a forest of decision trees, or if
+            X_test has missing values and the trees do not route them
+    """
+    if getattr(model, "estimators_", None) is None:
+        raise ValueError("Tree explanations require a trained Random Forest model")
+
+    X = np.ascontiguousarray(np.asarray(X_test, dtype=np.float32))
+    if np.isnan(X).any() and not hasattr(
+        model.estimators_[0].tree_, "missing_go_to_left"
+    ):
+        raise ValueError("Missing values are not supported by these trees")
+    # Rows are compared as raw bytes, which is exact and hashes in O(n)
+    row_bytes = X.view(np.dtype((np.void, X.dtype.itemsize * X.shape[1]))).ravel()
+    inverse, _ = pd.factorize(row_bytes)
+    unique_rows = X[np.unique(inverse, return_index=True)[1]]
+    model_key = _model_key(model)
+
+    unique_contributions = np.empty((len(unique_rows), model.n_features_in_))
+    missing = []
+    for i, row in enumerate(unique_rows):
+        key = (model_key, row.tobytes())
+        if key in _CONTRIBUTION_CACHE:
+            _CONTRIBUTION_CACHE.move_to_end(key)
+            unique_contributions[i] = _CONTRIBUTION_CACHE[key]
+        else:
+            missing.append(i)
+
+    if missing:
+        computed = leaf_table_contributions(
+            build_leaf_table(model), unique_rows[missing]
+        )
+        unique_contributions[missing] = computed
+        for i, row_contributions in zip(missing, computed):
+            _CONTRIBUTION_CACHE[(model_key, unique_rows[i].tobytes())] = (
+                row_contributions
+            )
+        while len(_CONTRIBUTION_CACHE) > CACHE_MAX_ROWS:
+            _CONTRIBUTION_CACHE.popitem(last=False)
+
+    columns = getattr(model, "feature_names_in_", None)
+    if columns is None:
+        columns = [f"feature_{j}" for j in range(model.n_features_in_)]
+    index = X_test.index if isinstance(X_test, pd.DataFrame) else None
+    contributions = pd.DataFrame(
+        unique_contributions[inverse], columns=list(columns), index=index
+    )
+
+    return contributions, _base_value(model)
+
+
+def contribution_importance(contributions: pd.DataFrame) -> Dict[str, float]:
+    """
+    Aggregate contributions into a global feature importance.
+
+    Args:
+        contributions: Contributions returned by explain_predictions
+
+    Returns:
+        Mean absolute contribution of each feature, in decreasing order
+    """
+    importance = contributions.abs().mean().sort_values(ascending=False)
+    return {str(name): float(value) for name, value in importance.items()}
+
+
+def store_contribution_importance(model: Any, importance: Dict[str, float]) -> None:
+    """
+    Store the aggregated contribution importance on a trained model.
+
+    It is reported by get_model_info and saved with the model by save_model.
+
+    Args:
+        model: Trained model
+        importance: Importance returned by contribution_importance
+    """
+    model.contribution_importance_ = importance
@@ -0,0 +1,192 @@
+"""Unit tests for arrow_io module."""
+
+import os
+import socket
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pa = pytest.importorskip("pyarrow")
+
+from arrow_io import (
+    column_to_numpy,
+    encode_record_batch,
+    predictions_to_record_batch,
+    read_arrow,
+    score_arrow,
+    write_arrow,
+)
+from data_validation import store_imputation
+from model_evaluation import generate_predictions
+from model_training import train_random_forest
+
+
+@pytest.fixture
+def passengers():
+    """Create raw passenger data as a pandas DataFrame."""
+    return pd.DataFrame(
+        {
+            "PassengerId": [892, 893, 894, 895],
+            "Pclass": [3, 1, 2, 3],
+            "Sex": ["male", "female", None, "female"],
+            "SibSp": [0, 1, 0, 2],
+        }
+    )
+
+
+@pytest.fixture
+def model():
+    """Train a model on one-hot encoded features."""
+    train_data = pd.DataFrame(
+        {
+            "Pclass": [3, 1, 3, 2] * 5,
+            "Sex": ["male", "female", "female", "male"] * 5,
+            "SibSp": [1, 0, 0, 1] * 5,
+        }
+    )
+    X_train = pd.get_dummies(train_data)
+    y_train = pd.Series([0, 1, 1, 0] * 5)
+
+    return train_random_forest(X_train, y_train, {"n_estimators": 5})
+
+
+class TestEncodeRecordBatch:
+    """Tests for encode_record_batch and column_to_numpy functions."""
+
+    def test_column_to_numpy_zero_copy(self):
+        """Test that numeric columns without nulls are not copied."""
+        column = pa.array(np.arange(5, dtype=np.int64))
+
+        values = column_to_numpy(column)
+
+        assert not values.flags.writeable
+        assert list(values) == [0, 1, 2, 3, 4]
+
+    def test_encode_record_batch_matches_get_dummies(self, passengers):
+        """Test that the matrix matches pandas one-hot encoding."""
+        batch = pa.RecordBatch.from_pandas(passengers, preserve_index=False)
+        feature_names = ["Pclass", "SibSp", "Sex_female", "Sex_male", "Sex_other"]
+
+        X = encode_record_batch(batch, feature_names)
+
+        expected = pd.get_dummies(passengers[["Pclass", "SibSp", "Sex"]])
+        expected = expected.reindex(columns=feature_names, fill_value=0)
+        np.testing.assert_array_equal(X, expected.to_numpy(dtype=np.float32))
+
+    def test_encode_record_batch_dictionary_column(self, passengers):
+        """Test that dictionary-encoded columns are used directly."""
+        table = pa.Table.from_pandas(passengers, preserve_index=False)
+        table = table.set_column(
+            2, "Sex", pa.compute.dictionary_encode(table.column("Sex"))
+        )
+
+        X = encode_record_batch(table.to_batches()[0], ["Sex_female"])
+
+        assert list(X[:, 0]) == [0, 1, 0, 1]
+
+    def test_encode_record_batch_imputation(self, passengers):
+        """Test that nulls are filled like impute_missing."""
+        passengers["SibSp"] = passengers["SibSp"].astype(float)
+        passengers.loc[0, "SibSp"] = None
+        batch = pa.RecordBatch.from_pandas(passengers, preserve_index=False)
+        imputation = {"Sex": "female", "SibSp": 1.0}
+        feature_names = ["SibSp", "Sex_female", "Sex_male"]
+
+        X = encode_record_batch(batch, feature_names, imputation)
+
+        expected = pd.get_dummies(passengers.fillna(imputation)[["SibSp", "Sex"]])
+        expected = expected.reindex(columns=feature_names, fill_value=0)
+        np.testing.assert_array_equal(X, expected.to_numpy(dtype=np.float32))
+
+    def test_encode_record_batch_missing_column(self, passengers):
+        """Test that features without a source column are rejected."""
+        batch = pa.RecordBatch.from_pandas(passengers, preserve_index=False)
+
+        with pytest.raises(ValueError, match="Title_Mr"):
+            encode_record_batch(batch, ["Pclass", "Title_Mr"])
+
+
+class TestArrowScoring:
+    """Tests for reading, scoring and writing Arrow data."""
+
+    def test_predictions_to_record_batch(self):
+        """Test the schema of the prediction batch."""
+        batch = predictions_to_record_batch(pa.array([1, 2]), np.array([0, 1]))
+
+        assert batch.schema.names == ["PassengerId", "Survived"]
+        assert batch.column(1).to_pylist() == [0, 1]
+
+    @pytest.mark.parametrize("input_format", ["file", "stream"])
+    def test_score_arrow_files(self, model, passengers, tmp_path, input_format):
+        """Test scoring from an Arrow file or stream to an Arrow file."""
+        table = pa.Table.from_pandas(passengers, preserve_index=False)
+        input_path = tmp_path / "passengers.arrow"
+        output_path = tmp_path / "predictions.arrow"
+        new_writer = pa.ipc.new_file if input_format == "file" else pa.ipc.new_stream
+        with new_writer(str(input_path), table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=3):
+                writer.write_batch(batch)
+
+        n_scored = score_arrow(model, input_path, output_path)
+        result = pa.ipc.open_file(str(output_path)).read_all().to_pandas()
+
+        X_test = pd.get_dummies(passengers[["Pclass", "Sex", "SibSp"]])
+        X_test = X_test.reindex(columns=model.feature_names_in_, fill_value=0)
+        assert n_scored == 4
+        assert list(result["PassengerId"]) == [892, 893, 894, 895]
+        assert list(result["Survived"]) == list(generate_predictions(model, X_test))
+
+    def test_score_arrow_applies_stored_imputation(self, model, passengers, tmp_path):
+        """Test that the fill values stored on the model are used."""
+        store_imputation(model, {"Sex": "female"})
+        input_path = tmp_path / "passengers.arrow"
+        output_path = tmp_path / "predictions.arrow"
+        write_arrow(
+            pa.Table.from_pandas(passengers, preserve_index=False).to_batches(),
+            input_path,
+        )
+
+        score_arrow(model, input_path, output_path)
+        result = pa.ipc.open_file(str(output_path)).read_all().to_pandas()
+
+        X_test = pd.get_dummies(
+            passengers.fillna({"Sex": "female"})[["Pclass", "Sex", "SibSp"]]
+        )
+        X_test = X_test.reindex(columns=model.feature_names_in_, fill_value=0)
+        assert list(result["Survived"]) == list(generate_predictions(model, X_test))
+
+    def test_read_arrow_file_not_found(self, tmp_path):
+        """Test that FileNotFoundError is raised for missing files."""
+        with pytest.raises(FileNotFoundError):
+            list(read_arrow(tmp_path / "missing.arrow"))
+
+    def test_read_arrow_from_socket(self, passengers):
+        """Test reading a stream from a local socket."""
+        table = pa.Table.from_pandas(passengers, preserve_index=False)
+        socket_path = os.path.join(tempfile.mkdtemp(), "scoring.sock")
+        server = socket.socket(socket.AF_UNIX)
+        server.bind(socket_path)
+        server.listen(1)
+
+        def serve():
+            connection, _ = server.accept()
+            with connection, connection.makefile("wb") as stream:
+                write_arrow(table.to_batches(), stream)
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        try:
+            batches = list(read_arrow(f"unix:{socket_path}"))
+        finally:
+            thread.join()
+            server.close()
+
+        assert sum(batch.num_rows for batch in batches) == 4
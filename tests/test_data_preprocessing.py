@@ -1,5 +1,6 @@
 """Unit tests for data_preprocessing module."""
 
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -11,6 +12,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from data_preprocessing import (
     load_data,
     preprocess_features,
+    encode_categorical_features,
+    fit_sparse_encoder,
+    transform_sparse,
+    preprocess_features_sparse,
     calculate_survival_rates,
 )
 
@@ -128,6 +133,139 @@ class TestPreprocessFeatures:
         assert isinstance(y_train, pd.Series)
 
 
+class TestEncodeCategoricalFeatures:
+    """Tests for encode_categorical_features function."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample data for testing."""
+        train_data = pd.DataFrame(
+            {
+                "Survived": [0, 1, 1],
+                "Pclass": [3, 1, 3],
+                "Sex": ["male", "female", "female"],
+                "Embarked": ["S", None, "C"],
+            }
+        )
+
+        test_data = pd.DataFrame(
+            {
+                "Pclass": [1, 2],
+                "Sex": ["female", "male"],
+                "Embarked": ["Q", "S"],
+            }
+        )
+
+        return train_data, test_data
+
+    def test_encode_categorical_features_codes(self, sample_data):
+        """Test that categories become one column of codes fitted on train."""
+        train_data, test_data = sample_data
+        features = ["Pclass", "Sex", "Embarked"]
+
+        X_train, y_train, X_test = encode_categorical_features(
+            train_data, test_data, features, "Survived", ["Sex", "Embarked"]
+        )
+
+        assert list(X_train.columns) == features
+        assert list(X_train["Sex"]) == [1, 0, 0]
+        assert list(X_test["Sex"]) == [0, 1]
+        assert list(X_train["Pclass"]) == [3, 1, 3]
+        assert list(y_train) == [0, 1, 1]
+
+    def test_encode_categorical_features_missing_and_unseen(self, sample_data):
+        """Test that missing and unseen categories are encoded as NaN."""
+        train_data, test_data = sample_data
+
+        X_train, _, X_test = encode_categorical_features(
+            train_data, test_data, ["Embarked"], "Survived", ["Embarked"]
+        )
+
+        assert pd.isna(X_train["Embarked"][1])
+        assert pd.isna(X_test["Embarked"][0])
+        assert X_test["Embarked"][1] == X_train["Embarked"][0]
+
+
+class TestSparseEncoding:
+    """Tests for the sparse one-hot encoding functions."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample data with a high-cardinality column."""
+        train_data = pd.DataFrame(
+            {
+                "Survived": [0, 1, 1, 0, 1],
+                "Pclass": [3, 1, 0, 2, 1],
+                "Ticket": ["A", "A", "B", "C", None],
+            }
+        )
+
+        test_data = pd.DataFrame({"Pclass": [1, 2], "Ticket": ["A", "Z"]})
+
+        return train_data, test_data
+
+    def test_fit_sparse_encoder_feature_names(self, sample_data):
+        """Test that rare categories go to hashed columns."""
+        train_data, _ = sample_data
+
+        encoder = fit_sparse_encoder(
+            train_data, ["Pclass", "Ticket"], min_frequency=2, n_hash_buckets=2
+        )
+
+        assert encoder["feature_names"] == [
+            "Pclass",
+            "Ticket_A",
+            "Ticket_hash0",
+            "Ticket_hash1",
+        ]
+
+    def test_transform_sparse_values(self, sample_data):
+        """Test the encoded values of known, rare and missing categories."""
+        train_data, _ = sample_data
+        encoder = fit_sparse_encoder(
+            train_data, ["Pclass", "Ticket"], min_frequency=2, n_hash_buckets=2
+        )
+
+        X = transform_sparse(train_data, encoder)
+        dense = X.toarray()
+
+        assert X.format == "csr"
+        assert list(dense[:, 0]) == [3, 1, 0, 2, 1]
+        assert list(dense[:, 1]) == [1, 1, 0, 0, 0]
+        assert list(dense[:, 2:].sum(axis=1)) == [0, 0, 1, 1, 0]
+        assert X.nnz == 8
+
+    def test_transform_sparse_without_hashing(self, sample_data):
+        """Test that unseen categories are ignored without hash buckets."""
+        train_data, test_data = sample_data
+        encoder = fit_sparse_encoder(train_data, ["Ticket"])
+
+        X = transform_sparse(test_data, encoder)
+
+        assert encoder["feature_names"] == ["Ticket_A", "Ticket_B", "Ticket_C"]
+        assert X.toarray().tolist() == [[1, 0, 0], [0, 0, 0]]
+
+    def test_transform_sparse_missing_numeric_value(self, sample_data):
+        """Test that ValueError names the numeric column with missing values."""
+        train_data, test_data = sample_data
+        encoder = fit_sparse_encoder(train_data, ["Pclass", "Ticket"])
+
+        with pytest.raises(ValueError, match="Pclass"):
+            transform_sparse(test_data.assign(Pclass=[1.0, np.nan]), encoder)
+
+    def test_preprocess_features_sparse(self, sample_data):
+        """Test that train and test get the same columns."""
+        train_data, test_data = sample_data
+
+        X_train, y_train, X_test, encoder = preprocess_features_sparse(
+            train_data, test_data, ["Pclass", "Ticket"], "Survived", 1, 4
+        )
+
+        assert X_train.shape == (5, len(encoder["feature_names"]))
+        assert X_test.shape == (2, len(encoder["feature_names"]))
+        assert list(y_train) == [0, 1, 1, 0, 1]
+
+
 class TestCalculateSurvivalRates:
     """Tests for calculate_survival_rates function."""
 
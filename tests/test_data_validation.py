@@ -0,0 +1,176 @@
+"""Unit tests for data_validation module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data_validation import (
+    UNKNOWN_CABIN,
+    fit_imputation,
+    get_imputation,
+    impute_missing,
+    load_validated_csv,
+    store_imputation,
+    validate_chunk,
+    validation_overhead,
+)
+from feature_engineering import engineer_features
+from model_training import load_model, save_model, train_random_forest
+
+SCHEMA = {
+    "Pclass": {"type": "numeric", "allowed": [1, 2, 3]},
+    "Sex": {"type": "category", "allowed": ["male", "female"]},
+    "Age": {"type": "numeric", "min": 0, "max": 100},
+    "Survived": {"type": "numeric", "allowed": [0, 1], "required": False},
+}
+
+
+@pytest.fixture
+def raw_data():
+    """Create raw data with missing and invalid values."""
+    return pd.DataFrame(
+        {
+            "Pclass": [1, 4, 3, 2],
+            "Sex": ["male", "female", "unknown", None],
+            "Age": ["22", "abc", "-1", None],
+            "Fare": [7.25, np.nan, 8.05, 10.0],
+            "Embarked": ["S", "C", None, "S"],
+            "Cabin": ["C85", None, None, "E46"],
+        }
+    )
+
+
+class TestValidateChunk:
+    """Tests for validate_chunk function."""
+
+    def test_validate_chunk_counts(self, raw_data):
+        """Test that missing and invalid values are counted per column."""
+        _, counts = validate_chunk(raw_data, SCHEMA)
+
+        assert counts["Pclass_invalid"] == 1
+        assert counts["Sex_missing"] == 1
+        assert counts["Sex_invalid"] == 1
+        assert counts["Age_missing"] == 1
+        assert counts["Age_invalid"] == 2
+        assert "Survived_missing" not in counts
+
+    def test_validate_chunk_replaces_invalid(self, raw_data):
+        """Test that invalid values become NaN and numbers are converted."""
+        chunk, _ = validate_chunk(raw_data, SCHEMA)
+
+        assert list(chunk["Age"].isna()) == [False, True, True, True]
+        assert chunk["Age"][0] == 22.0
+        assert pd.isna(chunk["Pclass"][1])
+        assert pd.isna(chunk["Sex"][2])
+        assert raw_data["Sex"][2] == "unknown"
+
+    def test_validate_chunk_missing_required_column(self, raw_data):
+        """Test that ValueError is raised for an absent required column."""
+        with pytest.raises(ValueError):
+            validate_chunk(raw_data.drop(columns="Sex"), SCHEMA)
+
+
+class TestImputation:
+    """Tests for fit_imputation and impute_missing functions."""
+
+    def test_fit_and_impute(self, raw_data):
+        """Test that missing values are filled with train statistics."""
+        train_data = pd.DataFrame(
+            {
+                "Age": [20.0, 30.0, np.nan],
+                "Fare": [5.0, 15.0, 100.0],
+                "Embarked": ["S", "S", "C"],
+            }
+        )
+
+        imputation = fit_imputation(train_data)
+        data = impute_missing(raw_data, imputation)
+
+        assert imputation["Age"] == 25.0
+        assert imputation["Fare"] == 15.0
+        assert imputation["Embarked"] == "S"
+        assert data["Fare"][1] == 15.0
+        assert data["Embarked"][2] == "S"
+        assert list(data["Cabin"]) == ["C85", UNKNOWN_CABIN, UNKNOWN_CABIN, "E46"]
+
+    def test_imputed_cabin_has_unknown_deck(self):
+        """Test that an imputed cabin gives the same deck as a missing one."""
+        data = pd.DataFrame(
+            {
+                "Name": ["X, Mr. A", "X, Mrs. B"],
+                "Cabin": ["C85", None],
+                "Age": [22.0, 30.0],
+                "Fare": [7.25, 8.05],
+                "SibSp": [0, 1],
+                "Parch": [0, 0],
+            }
+        )
+        params = {"titles": ["Rare"], "decks": ["C", "U"]}
+        params.update({"age_bins": [], "fare_bins": []})
+
+        raw_decks = engineer_features(data, params)["Deck"]
+        imputed = data.fillna({"Cabin": UNKNOWN_CABIN})
+        imputed_decks = engineer_features(imputed, params)["Deck"]
+
+        assert list(raw_decks) == ["C", "U"]
+        assert list(imputed_decks) == ["C", "U"]
+
+    def test_fit_imputation_empty_column(self):
+        """Test that ValueError is raised for a column without any value."""
+        train_data = pd.DataFrame(
+            {"Age": [20.0, 30.0], "Fare": [5.0, 15.0], "Embarked": [None, None]}
+        )
+
+        with pytest.raises(ValueError, match="Embarked"):
+            fit_imputation(train_data)
+
+    def test_imputation_saved_with_model(self, tmp_path):
+        """Test that fill values are saved and loaded with the model."""
+        model = train_random_forest(
+            pd.DataFrame({"Age": [20.0, 30.0]}), pd.Series([0, 1]), {}
+        )
+        imputation = {"Age": 25.0, "Embarked": "S"}
+
+        assert get_imputation(model) is None
+        store_imputation(model, imputation)
+        loaded = load_model(save_model(model, tmp_path / "model.joblib"))
+
+        assert get_imputation(loaded) == imputation
+
+
+class TestLoadValidatedCsv:
+    """Tests for load_validated_csv function."""
+
+    def test_load_validated_csv_report(self, raw_data, tmp_path):
+        """Test that one report row is written per chunk."""
+        csv_path = tmp_path / "data.csv"
+        raw_data.to_csv(csv_path, index=False)
+
+        data, report = load_validated_csv(csv_path, SCHEMA, chunk_size=3)
+
+        assert len(data) == 4
+        assert list(report["rows"]) == [3, 1]
+        assert report["Age_invalid"].sum() == 2
+        assert (report["load_seconds"] > 0).all()
+        assert validation_overhead(report) > 0
+
+    def test_load_validated_csv_imputes(self, raw_data, tmp_path):
+        """Test that chunks are imputed when fill values are given."""
+        csv_path = tmp_path / "data.csv"
+        raw_data.to_csv(csv_path, index=False)
+        imputation = {"Age": 30.0, "Fare": 9.0, "Embarked": "S", "Cabin": "U"}
+
+        data, _ = load_validated_csv(csv_path, SCHEMA, imputation, chunk_size=2)
+
+        assert list(data["Age"]) == [22.0, 30.0, 30.0, 30.0]
+        assert data["Cabin"].notna().all()
+
+    def test_load_validated_csv_file_not_found(self, tmp_path):
+        """Test that FileNotFoundError is raised for missing files."""
+        with pytest.raises(FileNotFoundError):
+            load_validated_csv(tmp_path / "missing.csv", SCHEMA)
@@ -0,0 +1,188 @@
+"""Unit tests for distributed_training module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from distributed_training import (
+    collect_shard_models,
+    merge_forests,
+    prepare_shard_tasks,
+    run_shard_task,
+    split_estimators,
+    train_random_forest_distributed,
+    wait_for_shard_models,
+)
+from model_evaluation import generate_predictions
+from model_training import get_model_info, train_random_forest
+from sklearn.ensemble import RandomForestClassifier
+
+
+@pytest.fixture
+def training_data():
+    """Create a small but learnable training set."""
+    rng = np.random.RandomState(0)
+    X_train = pd.DataFrame(
+        {
+            "Pclass": rng.randint(1, 4, size=60),
+            "SibSp": rng.randint(0, 3, size=60),
+            "Sex_female": rng.randint(0, 2, size=60),
+        }
+    )
+    y_train = pd.Series((X_train["Sex_female"] == 1).astype(int))
+
+    return X_train, y_train
+
+
+class TestSplitEstimators:
+    """Tests for split_estimators function."""
+
+    def test_split_estimators_even(self):
+        """Test an even split of trees."""
+        assert split_estimators(100, 4) == [25, 25, 25, 25]
+
+    def test_split_estimators_remainder(self):
+        """Test that the remainder is spread over the first workers."""
+        split = split_estimators(10, 3)
+
+        assert split == [4, 3, 3]
+        assert sum(split) == 10
+
+    def test_split_estimators_too_many_workers(self):
+        """Test that ValueError is raised with fewer trees than workers."""
+        with pytest.raises(ValueError):
+            split_estimators(2, 3)
+
+
+class TestShardTasks:
+    """Tests for prepare_shard_tasks and run_shard_task functions."""
+
+    def test_prepare_shard_tasks_creates_files(self, training_data, tmp_path):
+        """Test that one task file is written per worker."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 10, "max_depth": 3, "random_state": 1}
+
+        task_paths = prepare_shard_tasks(
+            X_train, y_train, params, 3, tmp_path, shard_data=True
+        )
+
+        assert len(task_paths) == 3
+        assert all(path.exists() for path in task_paths)
+        assert len(list(tmp_path.glob("shard_*.pkl"))) == 3
+
+    def test_run_shard_task_trains_sub_forest(self, training_data, tmp_path):
+        """Test that a worker trains the number of trees of its task."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 10, "max_depth": 3, "random_state": 1}
+        task_paths = prepare_shard_tasks(X_train, y_train, params, 2, tmp_path)
+
+        for task_path in task_paths:
+            run_shard_task(task_path)
+        forests = collect_shard_models(task_paths)
+
+        assert [len(forest.estimators_) for forest in forests] == [5, 5]
+        assert forests[0].random_state != forests[1].random_state
+
+    def test_collect_shard_models_missing_output(self, training_data, tmp_path):
+        """Test that FileNotFoundError is raised for unfinished workers."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 4, "random_state": 1}
+        task_paths = prepare_shard_tasks(X_train, y_train, params, 2, tmp_path)
+
+        with pytest.raises(FileNotFoundError):
+            collect_shard_models(task_paths)
+
+    def test_prepare_shard_tasks_removes_previous_outputs(
+        self, training_data, tmp_path
+    ):
+        """Test that sub-forests of a previous run are not reused."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 4, "random_state": 1}
+        for task_path in prepare_shard_tasks(X_train, y_train, params, 2, tmp_path):
+            run_shard_task(task_path)
+
+        task_paths = prepare_shard_tasks(X_train, y_train, params, 2, tmp_path)
+
+        with pytest.raises(FileNotFoundError):
+            collect_shard_models(task_paths)
+
+    def test_wait_for_shard_models(self, training_data, tmp_path):
+        """Test that finished sub-forests are loaded."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 4, "random_state": 1}
+        task_paths = prepare_shard_tasks(X_train, y_train, params, 2, tmp_path)
+        for task_path in task_paths:
+            run_shard_task(task_path)
+
+        forests = wait_for_shard_models(task_paths, timeout=0)
+
+        assert [len(forest.estimators_) for forest in forests] == [2, 2]
+
+    def test_wait_for_shard_models_timeout(self, training_data, tmp_path):
+        """Test that TimeoutError is raised for unfinished workers."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 4, "random_state": 1}
+        task_paths = prepare_shard_tasks(X_train, y_train, params, 2, tmp_path)
+        run_shard_task(task_paths[0])
+
+        with pytest.raises(TimeoutError, match="forest_1"):
+            wait_for_shard_models(task_paths, timeout=0.2, poll_interval=0.05)
+
+
+class TestMergeForests:
+    """Tests for merge_forests function."""
+
+    def test_merge_forests_combines_estimators(self, training_data):
+        """Test that the merged forest holds every tree."""
+        X_train, y_train = training_data
+        forest1 = train_random_forest(
+            X_train, y_train, {"n_estimators": 3, "random_state": 1}
+        )
+        forest2 = train_random_forest(
+            X_train, y_train, {"n_estimators": 4, "random_state": 2}
+        )
+
+        merged = merge_forests([forest1, forest2], random_state=1)
+
+        assert merged.n_estimators == 7
+        assert len(merged.estimators_) == 7
+        assert len(forest1.estimators_) == 3
+
+    def test_merge_forests_different_features(self, training_data):
+        """Test that ValueError is raised for incompatible forests."""
+        X_train, y_train = training_data
+        forest1 = train_random_forest(X_train, y_train, {"n_estimators": 2})
+        forest2 = train_random_forest(
+            X_train[["Pclass", "SibSp"]], y_train, {"n_estimators": 2}
+        )
+
+        with pytest.raises(ValueError):
+            merge_forests([forest1, forest2])
+
+
+class TestTrainRandomForestDistributed:
+    """Tests for train_random_forest_distributed function."""
+
+    @pytest.mark.parametrize("shard_data", [False, True])
+    def test_distributed_model_is_usable(self, training_data, tmp_path, shard_data):
+        """Test that the merged model works with the rest of the pipeline."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 12, "max_depth": 3, "random_state": 1}
+
+        model = train_random_forest_distributed(
+            X_train, y_train, params, 3, tmp_path, shard_data=shard_data
+        )
+        predictions = generate_predictions(model, X_train)
+        info = get_model_info(model)
+
+        assert isinstance(model, RandomForestClassifier)
+        assert info["n_estimators"] == 12
+        assert info["max_depth"] == 3
+        assert info["n_features"] == 3
+        assert info["random_state"] == 1
+        assert (predictions == y_train).mean() > 0.9
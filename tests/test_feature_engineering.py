@@ -0,0 +1,159 @@
+"""Unit tests for feature_engineering module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import feature_engineering
+from feature_engineering import (
+    engineer_features,
+    fit_feature_engineering,
+    get_feature_params,
+    store_feature_params,
+)
+from model_training import load_model, save_model, train_random_forest
+
+
+@pytest.fixture
+def train_data():
+    """Create raw training data with missing values."""
+    return pd.DataFrame(
+        {
+            "Name": [
+                "Braund, Mr. Owen Harris",
+                "Cumings, Mrs. John Bradley",
+                "Heikkinen, Miss. Laina",
+                "Allen, Mr. William Henry",
+                "Moran, Mr. James",
+                "Aubart, Mme. Leontine",
+                "Rothes, the Countess. of",
+            ],
+            "Cabin": ["C85", "C123", None, "E46", None, "B35", "B77"],
+            "Age": [22.0, 38.0, 26.0, 35.0, np.nan, 24.0, 33.0],
+            "Fare": [7.25, 71.28, 7.92, 8.05, 8.46, 69.3, 86.5],
+            "SibSp": [1, 1, 0, 0, 0, 0, 0],
+            "Parch": [0, 0, 0, 0, 0, 0, 0],
+        }
+    )
+
+
+class TestFitFeatureEngineering:
+    """Tests for fit_feature_engineering function."""
+
+    def test_fit_feature_engineering_vocabularies(self, train_data):
+        """Test that frequent titles and decks are kept, others grouped."""
+        params = fit_feature_engineering(train_data, min_category_count=2)
+
+        assert params["titles"] == ["Mr", "Mrs", "Rare"]
+        assert params["decks"] == ["B", "C", "U"]
+
+    def test_fit_feature_engineering_bins(self, train_data):
+        """Test that bin edges are increasing quantiles."""
+        params = fit_feature_engineering(train_data, n_age_bins=3, n_fare_bins=2)
+
+        assert len(params["age_bins"]) == 2
+        assert params["age_bins"] == sorted(params["age_bins"])
+        assert len(params["fare_bins"]) == 1
+
+
+class TestEngineerFeatures:
+    """Tests for engineer_features function."""
+
+    def test_engineer_features_columns(self, train_data):
+        """Test the values of every engineered column."""
+        params = fit_feature_engineering(train_data, min_category_count=2)
+
+        data = engineer_features(train_data, params)
+
+        assert list(data["Title"]) == ["Mr", "Mrs", "Rare", "Mr", "Mr", "Mrs", "Rare"]
+        assert list(data["Deck"]) == ["C", "C", "U", "U", "U", "B", "B"]
+        assert data["AgeBin"][4] == -1
+        assert list(data["FamilySize"]) == [2, 2, 1, 1, 1, 1, 1]
+        assert list(data["IsAlone"]) == [0, 0, 1, 1, 1, 1, 1]
+        assert "Title" not in train_data.columns
+
+    def test_engineer_features_consistent_dummies(self, train_data):
+        """Test that one-hot encoding gives the same columns on any subset."""
+        params = fit_feature_engineering(train_data, min_category_count=2)
+
+        full = pd.get_dummies(engineer_features(train_data, params)[["Title"]])
+        subset = pd.get_dummies(engineer_features(train_data[:1], params)[["Title"]])
+
+        assert list(full.columns) == list(subset.columns)
+
+    def test_engineer_features_chunk_without_cabins(self, train_data):
+        """Test a chunk whose Cabin column is read as all-NaN floats."""
+        params = fit_feature_engineering(train_data, min_category_count=2)
+        chunk = train_data.iloc[2:5].copy()
+        chunk["Cabin"] = np.nan
+
+        data = engineer_features(chunk, params)
+
+        assert chunk["Cabin"].dtype == np.float64
+        assert list(data["Deck"]) == ["U", "U", "U"]
+        assert list(data["Title"]) == ["Rare", "Mr", "Mr"]
+
+    def test_engineer_features_cached(self, train_data, tmp_path, monkeypatch):
+        """Test that derived columns are reused instead of recomputed."""
+        params = fit_feature_engineering(train_data, min_category_count=2)
+        feature_engineering._COLUMN_CACHE.clear()
+        engineer_features(train_data, params, cache_dir=tmp_path)
+        feature_engineering._COLUMN_CACHE.clear()
+
+        def fail(data, params):
+            raise AssertionError("column recomputed")
+
+        monkeypatch.setitem(
+            feature_engineering.ENGINEERED_COLUMNS, "Title", (["Name"], fail)
+        )
+        data = engineer_features(train_data, params, cache_dir=tmp_path)
+
+        assert len(list(tmp_path.glob("Title-*.npy"))) == 1
+        assert data["Title"][0] == "Mr"
+
+    def test_engineer_features_caches_string_columns_only(self, train_data, tmp_path):
+        """Test that numeric derived columns are not written to the cache."""
+        params = fit_feature_engineering(train_data, min_category_count=2)
+        feature_engineering._COLUMN_CACHE.clear()
+
+        engineer_features(train_data, params, cache_dir=tmp_path)
+
+        prefixes = {path.name.split("-")[0] for path in tmp_path.glob("*.npy")}
+        assert prefixes == {"Title", "Deck"}
+
+    def test_engineer_features_cache_size_limits(
+        self, train_data, tmp_path, monkeypatch
+    ):
+        """Test that both caches evict columns above their size limit."""
+        params = fit_feature_engineering(train_data, min_category_count=2)
+        feature_engineering._COLUMN_CACHE.clear()
+        monkeypatch.setattr(feature_engineering, "CACHE_MAX_BYTES", 0)
+        monkeypatch.setattr(feature_engineering, "DISK_CACHE_MAX_BYTES", 0)
+
+        data = engineer_features(train_data, params, cache_dir=tmp_path)
+
+        assert len(feature_engineering._COLUMN_CACHE) == 0
+        assert list(tmp_path.glob("*.npy")) == []
+        assert data["Title"][0] == "Mr"
+
+
+class TestFeatureParams:
+    """Tests for store_feature_params and get_feature_params functions."""
+
+    def test_feature_params_saved_with_model(self, train_data, tmp_path):
+        """Test that the parameters are saved and loaded with the model."""
+        params = fit_feature_engineering(train_data)
+        model = train_random_forest(
+            train_data[["SibSp", "Parch"]], pd.Series([0, 1] * 3 + [0]), {}
+        )
+
+        assert get_feature_params(model) is None
+        store_feature_params(model, params)
+        loaded = load_model(save_model(model, tmp_path / "model.joblib"))
+
+        assert get_feature_params(loaded) == params
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from model_evaluation import (
     generate_predictions,
+    generate_probabilities,
     create_submission_file,
     print_prediction_summary,
 )
@@ -77,6 +78,47 @@ class TestGeneratePredictions:
         # All predictions should be 0 or 1
         assert all(pred in [0, 1] for pred in predictions)
 
+    def test_generate_predictions_in_batches(self, trained_model):
+        """Test that batched predictions match a single call."""
+        X_test = pd.DataFrame(
+            {
+                "feature1": [1, 5, 2, 8, 3],
+                "feature2": [9, 6, 11, 5, 7],
+            }
+        )
+
+        predictions = generate_predictions(trained_model, X_test, batch_size=2)
+
+        assert list(predictions) == list(generate_predictions(trained_model, X_test))
+
+
+class TestGenerateProbabilities:
+    """Tests for generate_probabilities function."""
+
+    def test_generate_probabilities_range(self):
+        """Test that one probability in [0, 1] is returned per passenger."""
+        X_train = pd.DataFrame({"feature1": [1, 2, 3, 4]})
+        y_train = pd.Series([0, 0, 1, 1])
+        model = RandomForestClassifier(n_estimators=10, random_state=42)
+        model.fit(X_train, y_train)
+
+        probabilities = generate_probabilities(model, X_train)
+
+        assert probabilities.shape == (4,)
+        assert all(0 <= p <= 1 for p in probabilities)
+        assert probabilities[3] > probabilities[0]
+
+    def test_generate_probabilities_in_batches(self):
+        """Test that batched probabilities match a single call."""
+        X_train = pd.DataFrame({"feature1": [1, 2, 3, 4]})
+        y_train = pd.Series([0, 0, 1, 1])
+        model = RandomForestClassifier(n_estimators=10, random_state=42)
+        model.fit(X_train, y_train)
+
+        probabilities = generate_probabilities(model, X_train, batch_size=3)
+
+        assert list(probabilities) == list(generate_probabilities(model, X_train))
+
 
 class TestCreateSubmissionFile:
     """Tests for create_submission_file function."""
@@ -0,0 +1,220 @@
+"""Unit tests for model_registry module."""
+
+import multiprocessing
+import threading
+
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from model_registry import ModelRegistry
+from model_training import train_random_forest
+
+
+def _register_in_process(root, model):
+    """Register a model from a separate process."""
+    ModelRegistry(root).register("rf", model)
+
+
+@pytest.fixture
+def training_data():
+    """Create sample training data."""
+    X_train = pd.DataFrame(
+        {
+            "Pclass": [3, 1, 3, 2] * 5,
+            "Sex_female": [0, 1, 1, 0] * 5,
+        }
+    )
+    y_train = pd.Series([0, 1, 1, 0] * 5)
+
+    return X_train, y_train
+
+
+@pytest.fixture
+def models(training_data):
+    """Train two model variants."""
+    X_train, y_train = training_data
+    return [
+        train_random_forest(X_train, y_train, {"n_estimators": n, "random_state": 1})
+        for n in (3, 5)
+    ]
+
+
+class TestModelRegistry:
+    """Tests for the ModelRegistry class."""
+
+    def test_register_versions(self, tmp_path, models):
+        """Test that versions are numbered and the first one is active."""
+        registry = ModelRegistry(tmp_path)
+
+        assert registry.register("rf", models[0]) == 1
+        assert registry.register("rf", models[1]) == 2
+
+        assert registry.versions("rf") == [1, 2]
+        assert registry.active_version("rf") == 1
+        assert (tmp_path / "rf" / "2.joblib").exists()
+
+    def test_lazy_load_and_hits(self, tmp_path, models):
+        """Test that models are loaded once, then served from memory."""
+        ModelRegistry(tmp_path).register("rf", models[0])
+        registry = ModelRegistry(tmp_path)
+        assert registry.stats()["loads"] == 0
+
+        first = registry.get("rf")
+        second = registry.get("rf")
+
+        stats = registry.stats()
+        assert first is second
+        assert first.n_estimators == 3
+        assert stats["loads"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["resident_bytes"] == (tmp_path / "rf" / "1.joblib").stat().st_size
+
+    def test_lru_eviction(self, tmp_path, models):
+        """Test that the least recently used model is evicted first."""
+        writer = ModelRegistry(tmp_path)
+        for key in ["a", "b", "c"]:
+            writer.register(key, models[0])
+        size = (tmp_path / "a" / "1.joblib").stat().st_size
+        registry = ModelRegistry(tmp_path, max_bytes=2 * size)
+
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")
+        registry.get("c")
+
+        stats = registry.stats()
+        assert stats["evictions"] == 1
+        assert stats["resident_models"] == ["a:1", "c:1"]
+        assert stats["resident_bytes"] == 2 * size
+
+    def test_model_larger_than_limit_is_kept(self, tmp_path, models):
+        """Test that the last loaded model stays even if over the limit."""
+        registry = ModelRegistry(tmp_path, max_bytes=1)
+        registry.register("rf", models[0])
+
+        registry.get("rf")
+        registry.get("rf")
+
+        assert registry.stats()["loads"] == 1
+
+    def test_promote_hot_swap(self, tmp_path, models, training_data):
+        """Test that promotion does not affect models already in use."""
+        X_train, _ = training_data
+        registry = ModelRegistry(tmp_path)
+        registry.register("rf", models[0])
+        registry.register("rf", models[1])
+        in_flight = registry.get("rf")
+
+        registry.promote("rf", 2)
+
+        assert in_flight.n_estimators == 3
+        assert len(in_flight.predict(X_train)) == len(X_train)
+        assert registry.get("rf").n_estimators == 5
+        assert ModelRegistry(tmp_path).active_version("rf") == 2
+
+    def test_concurrent_gets_during_promote(self, tmp_path, models):
+        """Test that readers always get a complete model during a swap."""
+        registry = ModelRegistry(tmp_path)
+        registry.register("rf", models[0])
+        registry.register("rf", models[1])
+        results = []
+
+        def read():
+            for _ in range(20):
+                results.append(registry.get("rf").n_estimators)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        registry.promote("rf", 2)
+        for thread in threads:
+            thread.join()
+
+        assert set(results) <= {3, 5}
+        assert registry.get("rf").n_estimators == 5
+
+    def test_promote_seen_by_other_registry(self, tmp_path, models):
+        """Test that a promotion written by another registry is picked up."""
+        serving = ModelRegistry(tmp_path)
+        serving.register("rf", models[0])
+        serving.register("rf", models[1])
+        assert serving.get("rf").n_estimators == 3
+
+        ModelRegistry(tmp_path).promote("rf", 2)
+
+        assert serving.active_version("rf") == 2
+        assert serving.get("rf").n_estimators == 5
+
+    def test_concurrent_registers(self, tmp_path, models):
+        """Test that concurrent registrations get distinct versions."""
+        registry = ModelRegistry(tmp_path)
+        versions = []
+
+        def register(model):
+            versions.append(registry.register("rf", model))
+
+        threads = [
+            threading.Thread(target=register, args=(models[i % 2],)) for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(versions) == list(range(1, 9))
+        assert registry.versions("rf") == list(range(1, 9))
+        assert registry.active_version("rf") == 1
+        assert list((tmp_path / "rf").glob("*.tmp")) == []
+
+    def test_concurrent_registers_across_processes(self, tmp_path, models):
+        """Test that registrations from several processes never collide."""
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_register_in_process, args=(tmp_path, models[0]))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        registry = ModelRegistry(tmp_path)
+        assert [process.exitcode for process in processes] == [0] * 4
+        assert registry.versions("rf") == [1, 2, 3, 4]
+        for version in registry.versions("rf"):
+            assert registry.get("rf", version).n_estimators == 3
+
+    def test_register_existing_version_raises(self, tmp_path, models):
+        """Test that an explicit version is never overwritten."""
+        registry = ModelRegistry(tmp_path)
+        registry.register("rf", models[0], version=3)
+
+        with pytest.raises(FileExistsError):
+            registry.register("rf", models[1], version=3)
+        assert registry.get("rf", 3).n_estimators == 3
+
+    def test_predict(self, tmp_path, models, training_data):
+        """Test predictions with the active version."""
+        X_train, y_train = training_data
+        registry = ModelRegistry(tmp_path)
+        registry.register("rf", models[0])
+
+        predictions = registry.predict("rf", X_train)
+
+        assert list(predictions) == list(models[0].predict(X_train))
+
+    def test_unknown_model_raises(self, tmp_path):
+        """Test that FileNotFoundError is raised for unknown models."""
+        registry = ModelRegistry(tmp_path)
+
+        with pytest.raises(FileNotFoundError):
+            registry.get("missing")
+        with pytest.raises(FileNotFoundError):
+            registry.get("missing", 3)
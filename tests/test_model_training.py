@@ -8,8 +8,18 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from model_training import train_random_forest, get_model_info
-from sklearn.ensemble import RandomForestClassifier
+from model_training import (
+    MODEL_BACKENDS,
+    get_backend,
+    get_model_info,
+    load_model,
+    save_model,
+    train_hist_gradient_boosting,
+    train_model,
+    train_random_forest,
+)
+from scipy import sparse
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
 
 
 class TestTrainRandomForest:
@@ -63,6 +73,16 @@ class TestTrainRandomForest:
         predictions = model.predict(X_train)
         assert len(predictions) == len(y_train)
 
+    def test_train_random_forest_sparse(self, sample_training_data):
+        """Test that a sparse CSR matrix is accepted without densifying."""
+        X_train, y_train = sample_training_data
+        X_sparse = sparse.csr_matrix(X_train.to_numpy(dtype=float))
+        model_params = {"n_estimators": 10, "max_depth": 3, "random_state": 42}
+
+        model = train_random_forest(X_sparse, y_train, model_params)
+
+        assert list(model.predict(X_sparse)) == list(y_train)
+
     def test_train_random_forest_custom_params(self, sample_training_data):
         """Test training with different parameter sets."""
         X_train, y_train = sample_training_data
@@ -78,6 +98,98 @@ class TestTrainRandomForest:
         assert model1.max_depth != model2.max_depth
 
 
+class TestTrainHistGradientBoosting:
+    """Tests for train_hist_gradient_boosting and train_model functions."""
+
+    @pytest.fixture
+    def sample_training_data(self):
+        """Create sample training data with a categorical column."""
+        X_train = pd.DataFrame(
+            {
+                "Pclass": [3, 1, 3, 2] * 5,
+                "Sex": [1.0, 0.0, 0.0, 1.0] * 5,
+            }
+        )
+
+        y_train = pd.Series([0, 1, 1, 0] * 5)
+
+        return X_train, y_train
+
+    def test_train_hist_gradient_boosting_categorical(self, sample_training_data):
+        """Test that categorical column names are turned into a mask."""
+        X_train, y_train = sample_training_data
+        model_params = {
+            "max_iter": 10,
+            "min_samples_leaf": 1,
+            "random_state": 1,
+            "categorical_features": ["Sex", "Embarked"],
+        }
+
+        model = train_hist_gradient_boosting(X_train, y_train, model_params)
+
+        assert isinstance(model, HistGradientBoostingClassifier)
+        assert list(model.is_categorical_) == [False, True]
+        assert list(model.predict(X_train)) == list(y_train)
+
+    def test_train_model_backends(self, sample_training_data):
+        """Test that train_model dispatches to the selected backend."""
+        X_train, y_train = sample_training_data
+
+        forest = train_model(X_train, y_train, {"n_estimators": 5}, "random_forest")
+        boosting = train_model(
+            X_train, y_train, {"max_iter": 5}, "hist_gradient_boosting"
+        )
+
+        assert isinstance(forest, RandomForestClassifier)
+        assert isinstance(boosting, HistGradientBoostingClassifier)
+
+    def test_train_model_unknown_backend(self, sample_training_data):
+        """Test that ValueError is raised for an unknown backend."""
+        X_train, y_train = sample_training_data
+
+        with pytest.raises(ValueError):
+            train_model(X_train, y_train, {}, "unknown")
+
+    @pytest.mark.parametrize("backend", list(MODEL_BACKENDS))
+    def test_backend_preprocess_and_train(self, backend):
+        """Test that each backend preprocesses raw data it can train on."""
+        raw_data = pd.DataFrame(
+            {
+                "Pclass": [3, 1, 3, 2] * 15,
+                "Sex": ["male", "female", "female", "male"] * 15,
+                "Survived": [0, 1, 1, 0] * 15,
+            }
+        )
+        registered = get_backend(backend)
+
+        X_train, y_train, X_test = registered["preprocess"](
+            raw_data, raw_data, ["Pclass", "Sex"], "Survived", ["Sex"]
+        )
+        model = registered["train"](X_train, y_train, {"random_state": 1})
+
+        assert list(model.predict(X_test)) == list(y_train)
+        assert "in_memory" in registered["training_modes"]
+
+    def test_get_backend_unknown(self):
+        """Test that ValueError lists the available backends."""
+        with pytest.raises(ValueError, match="random_forest"):
+            get_backend("unknown")
+
+    def test_get_model_info_hist_gradient_boosting(self, sample_training_data):
+        """Test model information of a gradient boosting model."""
+        X_train, y_train = sample_training_data
+        model = train_hist_gradient_boosting(
+            X_train, y_train, {"max_iter": 7, "max_depth": 3, "random_state": 2}
+        )
+
+        info = get_model_info(model)
+
+        assert info["n_estimators"] == 7
+        assert info["max_depth"] == 3
+        assert info["n_features"] == 2
+        assert info["random_state"] == 2
+
+
 class TestGetModelInfo:
     """Tests for get_model_info function."""
 
@@ -131,3 +243,26 @@ class TestGetModelInfo:
         assert isinstance(info["max_depth"], int)
         assert isinstance(info["n_features"], int)
         assert isinstance(info["random_state"], int)
+
+
+class TestSaveLoadModel:
+    """Tests for save_model and load_model functions."""
+
+    def test_save_and_load_model(self, tmp_path):
+        """Test that a saved model can be loaded back."""
+        X_train = pd.DataFrame({"feature1": [1, 2, 3, 4]})
+        y_train = pd.Series([0, 1, 0, 1])
+        model = train_random_forest(
+            X_train, y_train, {"n_estimators": 5, "random_state": 42}
+        )
+
+        model_path = save_model(model, tmp_path / "models" / "forest.joblib")
+        loaded = load_model(model_path)
+
+        assert model_path.exists()
+        assert list(loaded.predict(X_train)) == list(model.predict(X_train))
+
+    def test_load_model_file_not_found(self, tmp_path):
+        """Test that FileNotFoundError is raised for missing models."""
+        with pytest.raises(FileNotFoundError):
+            load_model(tmp_path / "missing.joblib")
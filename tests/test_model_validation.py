@@ -0,0 +1,164 @@
+"""Unit tests for model_validation module."""
+
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from model_training import save_model, train_random_forest
+from model_validation import (
+    accuracy,
+    compute_metrics,
+    cross_validation_probabilities,
+    evaluate_model,
+    log_loss,
+    model_artifact_hash,
+    oob_probabilities,
+    roc_auc,
+)
+
+
+@pytest.fixture
+def training_data():
+    """Create a small, noisy but learnable training set."""
+    rng = np.random.RandomState(0)
+    X_train = pd.DataFrame(
+        {
+            "Pclass": rng.randint(1, 4, size=80),
+            "Sex_female": rng.randint(0, 2, size=80),
+        }
+    )
+    noise = rng.rand(80) < 0.1
+    y_train = pd.Series(((X_train["Sex_female"] == 1) ^ noise).astype(int))
+
+    return X_train, y_train
+
+
+class TestMetrics:
+    """Tests for the metric functions."""
+
+    def test_accuracy(self):
+        """Test accuracy with a 0.5 threshold."""
+        assert accuracy([0, 1, 1, 0], [0.2, 0.7, 0.4, 0.5]) == 0.5
+
+    def test_log_loss(self):
+        """Test log-loss against its definition."""
+        expected = -(math.log(0.8) + math.log(0.6)) / 2
+
+        assert log_loss([0, 1], [0.2, 0.6]) == pytest.approx(expected)
+
+    def test_log_loss_clipped(self):
+        """Test that certain but wrong predictions stay finite."""
+        assert np.isfinite(log_loss([1, 0], [0.0, 1.0]))
+
+    def test_roc_auc_with_ties(self):
+        """Test ROC AUC with tied probabilities."""
+        y_true = [0, 0, 1, 1]
+        y_prob = [0.1, 0.5, 0.5, 0.9]
+
+        assert roc_auc(y_true, y_prob) == pytest.approx(0.875)
+
+    def test_roc_auc_single_class(self):
+        """Test that ROC AUC is NaN when only one class is present."""
+        assert math.isnan(roc_auc([1, 1], [0.2, 0.8]))
+
+    def test_compute_metrics_keys(self):
+        """Test that every metric is returned."""
+        metrics = compute_metrics([0, 1], [0.3, 0.8])
+
+        assert set(metrics) == {"accuracy", "log_loss", "roc_auc"}
+
+
+class TestModelArtifactHash:
+    """Tests for model_artifact_hash function."""
+
+    def test_model_artifact_hash_changes_with_model(self, training_data, tmp_path):
+        """Test that different models have different hashes."""
+        X_train, y_train = training_data
+        model1 = train_random_forest(X_train, y_train, {"n_estimators": 3})
+        model2 = train_random_forest(X_train, y_train, {"n_estimators": 4})
+        model_path = save_model(model1, tmp_path / "model.joblib")
+
+        assert model_artifact_hash(model1) == model_artifact_hash(model1)
+        assert model_artifact_hash(model1) != model_artifact_hash(model2)
+        assert len(model_artifact_hash(model_path)) == 64
+
+
+class TestEvaluateModel:
+    """Tests for evaluate_model and its prediction sources."""
+
+    def test_oob_probabilities_absent(self, training_data):
+        """Test that OOB predictions need bootstrap samples of these rows."""
+        X_train, y_train = training_data
+        model = train_random_forest(X_train, y_train, {"n_estimators": 5})
+        no_bootstrap = train_random_forest(
+            X_train, y_train, {"n_estimators": 5, "bootstrap": False}
+        )
+
+        assert oob_probabilities(model) is None
+        assert oob_probabilities(no_bootstrap, X_train) is None
+        assert oob_probabilities(model, X_train.head(40)) is None
+
+    def test_oob_probabilities_from_samples(self, training_data):
+        """Test that OOB predictions are rebuilt without oob_score."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 20, "random_state": 1}
+        model = train_random_forest(X_train, y_train, params)
+        reference = train_random_forest(X_train, y_train, {**params, "oob_score": True})
+
+        np.testing.assert_allclose(
+            oob_probabilities(model, X_train), oob_probabilities(reference)
+        )
+        assert evaluate_model(model, X_train, y_train)["method"] == "oob"
+
+    def test_evaluate_model_uses_oob(self, training_data):
+        """Test that OOB predictions are used when available."""
+        X_train, y_train = training_data
+        params = {"n_estimators": 30, "oob_score": True, "random_state": 1}
+        model = train_random_forest(X_train, y_train, params)
+
+        metrics = evaluate_model(model, X_train, y_train)
+
+        assert metrics["method"] == "oob"
+        assert metrics["accuracy"] == pytest.approx(model.oob_score_)
+
+    def test_cross_validation_probabilities(self, training_data):
+        """Test that every row gets one out-of-fold probability."""
+        X_train, y_train = training_data
+        model = train_random_forest(
+            X_train, y_train, {"n_estimators": 10, "random_state": 1}
+        )
+
+        probabilities = cross_validation_probabilities(
+            model, X_train, y_train, n_folds=3, n_jobs=2
+        )
+
+        assert probabilities.shape == (80,)
+        assert np.all((probabilities >= 0) & (probabilities <= 1))
+        assert len(model.estimators_) == 10
+
+    def test_evaluate_model_cv_cached(self, training_data, tmp_path):
+        """Test that cross-validation results are cached on disk."""
+        X_train, y_train = training_data
+        model = train_random_forest(
+            X_train, y_train, {"n_estimators": 10, "bootstrap": False}
+        )
+
+        metrics = evaluate_model(
+            model, X_train, y_train, n_folds=3, n_jobs=2, cache_dir=tmp_path
+        )
+        cached = list(tmp_path.glob("*.json"))
+
+        assert metrics["method"] == "cv"
+        assert metrics["n_samples"] == 80
+        assert metrics["accuracy"] > 0.7
+        assert len(cached) == 1
+        assert json.loads(cached[0].read_text()) == metrics
+        assert evaluate_model(model, X_train, y_train, n_folds=3) == metrics
@@ -0,0 +1,217 @@
+"""Unit tests for out_of_core_training module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from model_evaluation import generate_predictions
+from model_training import get_model_info
+from out_of_core_training import (
+    build_training_matrix,
+    encode_chunk,
+    load_training_matrix,
+    save_training_matrix,
+    train_random_forest_out_of_core,
+    write_training_matrix,
+)
+from sklearn.ensemble import RandomForestClassifier
+
+
+@pytest.fixture
+def training_data():
+    """Create a small but learnable training set."""
+    rng = np.random.RandomState(0)
+    X_train = pd.DataFrame(
+        {
+            "Pclass": rng.randint(1, 4, size=50),
+            "SibSp": rng.randint(0, 3, size=50),
+            "Sex_female": rng.randint(0, 2, size=50),
+        }
+    )
+    y_train = pd.Series((X_train["Sex_female"] == 1).astype(int))
+
+    return X_train, y_train
+
+
+class TestTrainingMatrix:
+    """Tests for save_training_matrix and load_training_matrix functions."""
+
+    def test_save_and_load_training_matrix(self, training_data, tmp_path):
+        """Test that the matrix round-trips through a memory map."""
+        X_train, y_train = training_data
+
+        save_training_matrix(X_train, y_train, tmp_path, chunk_size=7)
+        X, y, columns = load_training_matrix(tmp_path)
+
+        assert isinstance(X, np.memmap)
+        assert X.dtype == np.float32
+        assert columns == list(X_train.columns)
+        np.testing.assert_array_equal(X, X_train.to_numpy())
+        np.testing.assert_array_equal(y, y_train.to_numpy())
+
+    def test_write_training_matrix_chunks(self, training_data, tmp_path):
+        """Test that chunks are appended in order."""
+        X_train, y_train = training_data
+        chunks = [(X_train.iloc[:20], y_train.iloc[:20])]
+        chunks.append((X_train.iloc[20:], y_train.iloc[20:]))
+
+        write_training_matrix(iter(chunks), list(X_train.columns), tmp_path)
+        X, y, _ = load_training_matrix(tmp_path)
+
+        np.testing.assert_array_equal(X, X_train.to_numpy())
+        np.testing.assert_array_equal(y, y_train.to_numpy())
+
+    def test_write_training_matrix_column_mismatch(self, training_data, tmp_path):
+        """Test that ValueError is raised for a chunk with other columns."""
+        X_train, y_train = training_data
+
+        with pytest.raises(ValueError):
+            write_training_matrix(
+                [(X_train[["SibSp", "Pclass"]], y_train)],
+                ["Pclass", "SibSp"],
+                tmp_path,
+            )
+
+    def test_build_training_matrix_from_csv(self, tmp_path):
+        """Test that CSV chunks match the encoding of the full data."""
+        data = pd.DataFrame(
+            {
+                "Survived": [0, 1, 1, 0, 1],
+                "Pclass": [3, 1, 2, 3, 1],
+                "Sex": ["male", "male", "female", "male", "female"],
+            }
+        )
+        csv_path = tmp_path / "train.csv"
+        data.to_csv(csv_path, index=False)
+        schema = {"Sex": {"type": "category", "allowed": ["male", "female"]}}
+        columns = ["Pclass", "Sex_female", "Sex_male"]
+
+        build_training_matrix(
+            csv_path,
+            schema,
+            ["Pclass", "Sex"],
+            "Survived",
+            columns,
+            tmp_path / "matrix",
+            chunk_size=2,
+        )
+        X, y, _ = load_training_matrix(tmp_path / "matrix")
+
+        expected = pd.get_dummies(data[["Pclass", "Sex"]])[columns]
+        np.testing.assert_array_equal(X, expected.to_numpy(dtype=np.float32))
+        np.testing.assert_array_equal(y, data["Survived"].to_numpy())
+
+    def test_encode_chunk_unknown_category(self):
+        """Test that ValueError is raised for a category without a column."""
+        chunk = pd.DataFrame({"Sex": ["male", "other"]})
+
+        with pytest.raises(ValueError, match="Sex_other"):
+            encode_chunk(chunk, ["Sex"], ["Sex_female", "Sex_male"])
+
+    def test_load_training_matrix_not_found(self, tmp_path):
+        """Test that FileNotFoundError is raised for a missing matrix."""
+        with pytest.raises(FileNotFoundError):
+            load_training_matrix(tmp_path / "missing")
+
+
+class TestTrainRandomForestOutOfCore:
+    """Tests for train_random_forest_out_of_core function."""
+
+    def test_out_of_core_model_is_usable(self, training_data, tmp_path):
+        """Test that the model works with the rest of the pipeline."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+        params = {"n_estimators": 15, "max_depth": 3, "random_state": 1}
+
+        model = train_random_forest_out_of_core(tmp_path, params, max_samples=0.5)
+        predictions = generate_predictions(model, X_train)
+        info = get_model_info(model)
+
+        assert isinstance(model, RandomForestClassifier)
+        assert len(model.estimators_) == 15
+        assert info["n_features"] == 3
+        assert info["max_depth"] == 3
+        assert (predictions == y_train).mean() > 0.9
+
+    def test_out_of_core_small_samples(self, training_data, tmp_path):
+        """Test that trees drawn without every class still agree on classes."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+        params = {"n_estimators": 20, "random_state": 0}
+
+        model = train_random_forest_out_of_core(tmp_path, params, max_samples=2)
+        probabilities = model.predict_proba(X_train)
+
+        assert probabilities.shape == (50, 2)
+        np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+
+    def test_out_of_core_reproducible(self, training_data, tmp_path):
+        """Test that a fixed random_state gives the same model."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+        params = {"n_estimators": 5, "random_state": 3, "max_samples": 20}
+
+        model1 = train_random_forest_out_of_core(tmp_path, params)
+        model2 = train_random_forest_out_of_core(tmp_path, params)
+
+        np.testing.assert_array_equal(
+            model1.predict_proba(X_train), model2.predict_proba(X_train)
+        )
+
+    def test_out_of_core_parallel_same_model(self, training_data, tmp_path):
+        """Test that fitting trees in parallel gives the same model."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+        params = {"n_estimators": 6, "random_state": 3, "max_samples": 20}
+
+        model1 = train_random_forest_out_of_core(tmp_path, params)
+        model2 = train_random_forest_out_of_core(tmp_path, dict(params, n_jobs=2))
+
+        np.testing.assert_array_equal(
+            model1.predict_proba(X_train), model2.predict_proba(X_train)
+        )
+
+    @pytest.mark.parametrize("class_weight", ["balanced", "balanced_subsample"])
+    def test_out_of_core_balanced_class_weight(
+        self, training_data, tmp_path, class_weight
+    ):
+        """Test that balanced class weights are supported."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+        params = {"n_estimators": 5, "random_state": 0, "class_weight": class_weight}
+
+        model = train_random_forest_out_of_core(tmp_path, params, max_samples=0.5)
+
+        assert (generate_predictions(model, X_train) == y_train).mean() > 0.9
+
+    def test_out_of_core_class_weight_dict(self, training_data, tmp_path):
+        """Test that a class without weight is never predicted."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+        params = {"n_estimators": 5, "random_state": 0, "class_weight": {0: 1, 1: 0}}
+
+        model = train_random_forest_out_of_core(tmp_path, params, max_samples=0.5)
+
+        np.testing.assert_array_equal(model.predict_proba(X_train)[:, 1], 0)
+
+    def test_out_of_core_rejects_oob_score(self, training_data, tmp_path):
+        """Test that ValueError is raised when oob_score is requested."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+        params = {"n_estimators": 5, "oob_score": True, "max_samples": 20}
+
+        with pytest.raises(ValueError, match="oob_score"):
+            train_random_forest_out_of_core(tmp_path, params)
+
+    def test_out_of_core_requires_max_samples(self, training_data, tmp_path):
+        """Test that ValueError is raised without a sample size."""
+        X_train, y_train = training_data
+        save_training_matrix(X_train, y_train, tmp_path)
+
+        with pytest.raises(ValueError):
+            train_random_forest_out_of_core(tmp_path, {"n_estimators": 5})
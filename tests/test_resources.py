@@ -0,0 +1,155 @@
+"""Unit tests for resources module."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import resources
+from resources import (
+    cgroup_cpu_limit,
+    cgroup_memory_limit,
+    detect_resources,
+    tune_resources,
+)
+
+
+def _write(path, text):
+    """Write a fake cgroup file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture(autouse=True)
+def clear_environment(monkeypatch):
+    """Remove resource overrides from the environment."""
+    for name in resources.SETTINGS:
+        monkeypatch.delenv(f"{resources.ENV_PREFIX}{name.upper()}", raising=False)
+
+
+class TestCgroupLimits:
+    """Tests for cgroup_cpu_limit and cgroup_memory_limit functions."""
+
+    def test_cgroup_v2_limits(self, tmp_path):
+        """Test reading cpu.max and memory.max."""
+        _write(tmp_path / "cpu.max", "150000 100000\n")
+        _write(tmp_path / "memory.max", "536870912\n")
+
+        assert cgroup_cpu_limit(tmp_path) == 1.5
+        assert cgroup_memory_limit(tmp_path) == 512 * 1024 * 1024
+
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        """Test that "max" means no limit."""
+        _write(tmp_path / "cpu.max", "max 100000\n")
+        _write(tmp_path / "memory.max", "max\n")
+
+        assert cgroup_cpu_limit(tmp_path) is None
+        assert cgroup_memory_limit(tmp_path) is None
+
+    def test_cgroup_v1_limits(self, tmp_path):
+        """Test reading the CFS quota and the memory limit."""
+        _write(tmp_path / "cpu,cpuacct" / "cpu.cfs_quota_us", "200000\n")
+        _write(tmp_path / "cpu,cpuacct" / "cpu.cfs_period_us", "100000\n")
+        _write(tmp_path / "memory" / "memory.limit_in_bytes", "1073741824\n")
+
+        assert cgroup_cpu_limit(tmp_path) == 2.0
+        assert cgroup_memory_limit(tmp_path) == 1024**3
+
+    def test_cgroup_v1_unlimited(self, tmp_path):
+        """Test that a negative quota and a huge limit mean no limit."""
+        _write(tmp_path / "cpu" / "cpu.cfs_quota_us", "-1\n")
+        _write(tmp_path / "cpu" / "cpu.cfs_period_us", "100000\n")
+        _write(tmp_path / "memory" / "memory.limit_in_bytes", "9223372036854771712")
+
+        assert cgroup_cpu_limit(tmp_path) is None
+        assert cgroup_memory_limit(tmp_path) is None
+
+    def test_no_cgroup(self, tmp_path):
+        """Test that missing files mean no limit."""
+        assert cgroup_cpu_limit(tmp_path) is None
+        assert cgroup_memory_limit(tmp_path) is None
+
+
+class TestDetectResources:
+    """Tests for detect_resources function."""
+
+    def test_detect_resources_uses_limits(self, tmp_path, monkeypatch):
+        """Test that the quota and memory limit cap the host resources."""
+        monkeypatch.setattr(resources, "host_cpu_count", lambda: 8)
+        monkeypatch.setattr(resources, "host_memory", lambda: 16 * 1024**3)
+        _write(tmp_path / "cpu.max", "250000 100000\n")
+        _write(tmp_path / "memory.max", str(2 * 1024**3))
+
+        detected = detect_resources(tmp_path)
+
+        assert detected["cpus"] == 3
+        assert detected["memory_bytes"] == 2 * 1024**3
+
+    def test_detect_resources_small_quota(self, tmp_path, monkeypatch):
+        """Test that a fractional quota still allows one CPU."""
+        monkeypatch.setattr(resources, "host_cpu_count", lambda: 8)
+        _write(tmp_path / "cpu.max", "50000 100000\n")
+
+        assert detect_resources(tmp_path)["cpus"] == 1
+
+    def test_detect_resources_without_cgroup(self, tmp_path, monkeypatch):
+        """Test that host resources are used outside a container."""
+        monkeypatch.setattr(resources, "host_cpu_count", lambda: 4)
+        monkeypatch.setattr(resources, "host_memory", lambda: 1024**3)
+
+        detected = detect_resources(tmp_path)
+
+        assert detected["cpus"] == 4
+        assert detected["memory_bytes"] == 1024**3
+        assert detected["cgroup_cpu_quota"] is None
+
+
+class TestTuneResources:
+    """Tests for tune_resources function."""
+
+    @pytest.fixture
+    def detected(self):
+        """Create resources of a small container."""
+        return {
+            "cpus": 2,
+            "memory_bytes": 256 * 1024**2,
+            "cgroup_cpu_quota": 2.0,
+            "cgroup_memory_limit": 256 * 1024**2,
+        }
+
+    def test_tune_resources_from_limits(self, detected):
+        """Test that settings follow the CPU and memory limits."""
+        settings = tune_resources(detected, max_batch_size=10**6)
+
+        assert settings["n_jobs"] == 2
+        assert settings["threads"] == 2
+        budget = 256 * 1024**2 * resources.MEMORY_FRACTION
+        assert settings["batch_size"] == budget // resources.PREDICTION_ROW_BYTES
+        assert settings["chunk_size"] == budget // resources.LOAD_ROW_BYTES
+
+    def test_tune_resources_upper_bounds(self, detected):
+        """Test that batch and chunk sizes never exceed their maximum."""
+        settings = tune_resources(detected, max_batch_size=500, max_chunk_size=700)
+
+        assert settings["batch_size"] == 500
+        assert settings["chunk_size"] == 700
+
+    def test_tune_resources_overrides(self, detected, monkeypatch):
+        """Test that environment variables take precedence over config."""
+        monkeypatch.setenv("TITANIC_N_JOBS", "6")
+
+        settings = tune_resources(detected, {"n_jobs": 3, "chunk_size": 5000})
+
+        assert settings["n_jobs"] == 6
+        assert settings["chunk_size"] == 5000
+
+    def test_tune_resources_invalid_override(self, detected, monkeypatch):
+        """Test that ValueError is raised for invalid overrides."""
+        monkeypatch.setenv("TITANIC_THREADS", "many")
+
+        with pytest.raises(ValueError):
+            tune_resources(detected)
+        with pytest.raises(ValueError):
+            tune_resources(detected, {"batch_size": 0})
@@ -0,0 +1,197 @@
+"""Unit tests for shadow_scoring module."""
+
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from data_validation import store_imputation
+from feature_engineering import engineer_features, store_feature_params
+from model_evaluation import generate_probabilities
+from model_training import train_random_forest
+from shadow_scoring import (
+    build_shadow_report,
+    raw_feature_columns,
+    run_shadow_scoring,
+    score_models,
+)
+
+
+@pytest.fixture
+def models():
+    """Train two models on different feature sets."""
+    train_data = pd.DataFrame(
+        {
+            "Pclass": [3, 1, 3, 2, 1, 2] * 3,
+            "Sex": ["male", "female", "female", "male", "male", "female"] * 3,
+            "Embarked": ["S", "C", "Q", "S", "C", "S"] * 3,
+            "Survived": [0, 1, 1, 0, 0, 1] * 3,
+        }
+    )
+    params = {"n_estimators": 10, "random_state": 1}
+    X_a = pd.get_dummies(train_data[["Pclass", "Sex"]])
+    X_b = pd.get_dummies(train_data[["Pclass", "Sex", "Embarked"]])
+
+    return {
+        "champion": train_random_forest(X_a, train_data.Survived, params),
+        "challenger": train_random_forest(X_b, train_data.Survived, params),
+    }
+
+
+@pytest.fixture
+def test_data():
+    """Create raw test data without any passenger embarked at Q."""
+    return pd.DataFrame(
+        {
+            "PassengerId": [892, 893, 894],
+            "Pclass": [3, 1, 2],
+            "Name": ["A", "B", "C"],
+            "Sex": ["male", "female", "male"],
+            "Embarked": ["S", "C", "S"],
+        }
+    )
+
+
+class TestRawFeatureColumns:
+    """Tests for raw_feature_columns function."""
+
+    def test_raw_feature_columns(self):
+        """Test that encoded names are mapped back to raw columns."""
+        columns = ["PassengerId", "Pclass", "Sex", "Embarked"]
+        feature_names = ["Pclass", "Sex_female", "Sex_male", "Embarked_S"]
+
+        assert raw_feature_columns(feature_names, columns) == [
+            "Pclass",
+            "Sex",
+            "Embarked",
+        ]
+
+
+class TestScoreModels:
+    """Tests for score_models function."""
+
+    def test_score_models_fills_missing_columns(self, models, test_data):
+        """Test that each model gets its own columns, missing ones as 0."""
+        X_encoded = pd.get_dummies(test_data[["Pclass", "Sex", "Embarked"]])
+
+        probabilities = score_models(models, X_encoded, list(test_data.columns))
+
+        assert list(probabilities.columns) == ["champion", "challenger"]
+        assert len(probabilities) == 3
+        assert ((probabilities >= 0) & (probabilities <= 1)).all().all()
+
+    def test_score_models_missing_source_column(self, models, test_data):
+        """Test that ValueError is raised for features without a raw column."""
+        columns = ["Pclass", "Sex"]
+        X_encoded = pd.get_dummies(test_data[columns])
+
+        with pytest.raises(ValueError, match="Embarked"):
+            score_models(models, X_encoded, columns)
+
+
+class TestBuildShadowReport:
+    """Tests for build_shadow_report function."""
+
+    def test_build_shadow_report(self):
+        """Test the per-row report and the aggregate statistics."""
+        probabilities = pd.DataFrame(
+            {"champion": [0.2, 0.6, 0.9], "challenger": [0.3, 0.4, 0.95]}
+        )
+
+        report, summary = build_shadow_report(
+            pd.Series([1, 2, 3]), probabilities, "champion"
+        )
+
+        assert list(report.columns) == [
+            "PassengerId",
+            "champion",
+            "challenger",
+            "challenger_delta",
+            "agree",
+        ]
+        assert list(report["agree"]) == [True, False, True]
+        assert report["challenger_delta"][1] == pytest.approx(-0.2)
+        stats = summary["challengers"]["challenger"]
+        assert stats["agreement_rate"] == pytest.approx(2 / 3)
+        assert stats["flips_to_died"] == 1
+        assert stats["flips_to_survived"] == 0
+        assert stats["max_abs_delta"] == pytest.approx(0.2)
+        assert summary["survival_rate"]["champion"] == pytest.approx(2 / 3)
+
+
+class TestRunShadowScoring:
+    """Tests for run_shadow_scoring function."""
+
+    def test_run_shadow_scoring_writes_report(self, models, test_data, tmp_path):
+        """Test that the report is saved with one row per passenger."""
+        output_path = tmp_path / "shadow.csv"
+
+        summary = run_shadow_scoring(models, test_data, "champion", output_path)
+        report = pd.read_csv(output_path)
+
+        assert summary["n_rows"] == 3
+        assert list(report["PassengerId"]) == [892, 893, 894]
+        assert "challenger_delta" in report.columns
+
+    def test_run_shadow_scoring_unknown_champion(self, models, test_data, tmp_path):
+        """Test that ValueError is raised for an unknown champion."""
+        with pytest.raises(ValueError):
+            run_shadow_scoring(models, test_data, "missing", tmp_path / "out.csv")
+
+    def test_run_shadow_scoring_engineered_features(self, tmp_path):
+        """Test that stored feature parameters are applied before scoring."""
+        data = pd.DataFrame(
+            {
+                "PassengerId": range(1, 9),
+                "Name": ["X, Mr. A", "X, Mrs. B", "X, Miss. C", "X, Dr. D"] * 2,
+                "Sex": ["male", "female"] * 4,
+                "Cabin": [None] * 8,
+                "Age": [30.0] * 8,
+                "Fare": [10.0] * 8,
+                "SibSp": [0] * 8,
+                "Parch": [0] * 8,
+                "Survived": [0, 1, 1, 0, 0, 1, 1, 1],
+            }
+        )
+        params = {
+            "titles": ["Miss", "Mr", "Mrs", "Rare"],
+            "decks": ["U"],
+            "age_bins": [],
+            "fare_bins": [],
+        }
+        X_train = pd.get_dummies(engineer_features(data, params)[["Sex", "Title"]])
+        model = train_random_forest(
+            X_train, data.Survived, {"n_estimators": 10, "random_state": 1}
+        )
+        store_feature_params(model, params)
+        output_path = tmp_path / "shadow.csv"
+
+        run_shadow_scoring({"champion": model}, data, "champion", output_path)
+        report = pd.read_csv(output_path)
+
+        expected = generate_probabilities(model, X_train) >= 0.5
+        assert list(report["champion"]) == list(expected.astype(int))
+
+    def test_run_shadow_scoring_imputation(self, models, test_data, tmp_path):
+        """Test that stored fill values are applied before scoring."""
+        store_imputation(models["challenger"], {"Embarked": "Q"})
+        test_data.loc[0, "Embarked"] = None
+        output_path = tmp_path / "shadow.csv"
+
+        run_shadow_scoring(models, test_data, "champion", output_path)
+        report = pd.read_csv(output_path)
+
+        X_test = pd.get_dummies(test_data.fillna({"Embarked": "Q"}))
+        X_champion = X_test.reindex(
+            columns=models["champion"].feature_names_in_, fill_value=0
+        )
+        X_challenger = X_test.reindex(
+            columns=models["challenger"].feature_names_in_, fill_value=0
+        )
+        expected = generate_probabilities(
+            models["challenger"], X_challenger
+        ) - generate_probabilities(models["champion"], X_champion)
+        assert list(report["challenger_delta"]) == pytest.approx(list(expected))
@@ -0,0 +1,229 @@
+"""Unit tests for tree_explanations module."""
+
+import itertools
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import tree_explanations
+from model_training import get_model_info, train_hist_gradient_boosting
+from tree_explanations import (
+    build_leaf_table,
+    contribution_importance,
+    explain_predictions,
+    store_contribution_importance,
+)
+from sklearn.ensemble import RandomForestClassifier
+
+
+@pytest.fixture
+def training_data():
+    """Create encoded training data with an unused feature."""
+    rng = np.random.default_rng(0)
+    X_train = pd.DataFrame(
+        {
+            "Pclass": rng.integers(1, 4, 200),
+            "SibSp": rng.integers(0, 3, 200),
+            "Sex_female": rng.integers(0, 2, 200),
+            "Constant": np.zeros(200),
+        }
+    )
+    noise = rng.random(200)
+    y_train = (X_train["Sex_female"] + noise - X_train["Pclass"] / 4) > 0.5
+
+    return X_train, y_train.astype(int)
+
+
+@pytest.fixture
+def model(training_data):
+    """Train a small Random Forest."""
+    X_train, y_train = training_data
+    return RandomForestClassifier(n_estimators=10, max_depth=4, random_state=1).fit(
+        X_train, y_train
+    )
+
+
+def _expected_value(tree, x, known, node=0):
+    """Path-dependent expectation of a tree given the known features."""
+    tree_ = tree.tree_
+    left, right = tree_.children_left[node], tree_.children_right[node]
+    if left == right:
+        value = tree_.value[node, 0]
+        return value[1] / value.sum()
+    feature = tree_.feature[node]
+    if feature in known:
+        if np.isnan(x[feature]):
+            child = left if tree_.missing_go_to_left[node] else right
+        else:
+            child = left if x[feature] <= tree_.threshold[node] else right
+        return _expected_value(tree, x, known, child)
+    weights = tree_.weighted_n_node_samples
+    return (
+        weights[left] * _expected_value(tree, x, known, left)
+        + weights[right] * _expected_value(tree, x, known, right)
+    ) / weights[node]
+
+
+def _brute_force_shapley(model, x):
+    """Compute Shapley values by enumerating every feature subset."""
+    n_features = len(x)
+    shapley = np.zeros(n_features)
+    for tree in model.estimators_:
+        for i in range(n_features):
+            others = [j for j in range(n_features) if j != i]
+            for size in range(n_features):
+                weight = (
+                    math.factorial(size)
+                    * math.factorial(n_features - size - 1)
+                    / math.factorial(n_features)
+                )
+                for subset in itertools.combinations(others, size):
+                    shapley[i] += weight * (
+                        _expected_value(tree, x, set(subset) | {i})
+                        - _expected_value(tree, x, set(subset))
+                    )
+
+    return shapley / len(model.estimators_)
+
+
+class TestExplainPredictions:
+    """Tests for explain_predictions function."""
+
+    def test_contributions_add_up_to_probabilities(self, model, training_data):
+        """Test that base value plus contributions gives the probability."""
+        X_train, _ = training_data
+
+        contributions, base_value = explain_predictions(model, X_train)
+
+        np.testing.assert_allclose(
+            contributions.sum(axis=1) + base_value,
+            model.predict_proba(X_train)[:, 1],
+            atol=1e-10,
+        )
+        assert list(contributions.columns) == list(X_train.columns)
+
+    def test_contributions_match_brute_force(self, model, training_data):
+        """Test that contributions are exact Shapley values."""
+        X_train, _ = training_data
+        X = X_train.head(3)
+
+        contributions, _ = explain_predictions(model, X)
+
+        for row in range(len(X)):
+            np.testing.assert_allclose(
+                contributions.iloc[row],
+                _brute_force_shapley(model, X.to_numpy(np.float32)[row]),
+                atol=1e-10,
+            )
+
+    def test_rows_with_missing_values(self, training_data):
+        """Test additivity and exactness on rows with missing values."""
+        X_train, y_train = training_data
+        X_train = X_train.astype(float)
+        X_train.loc[::4, "Pclass"] = np.nan
+        X_train.loc[1::5, "SibSp"] = np.nan
+        model = RandomForestClassifier(
+            n_estimators=10, max_depth=4, random_state=1
+        ).fit(X_train, y_train)
+        X = X_train[X_train.isna().any(axis=1)]
+
+        contributions, base_value = explain_predictions(model, X)
+
+        np.testing.assert_allclose(
+            contributions.sum(axis=1) + base_value,
+            model.predict_proba(X)[:, 1],
+            atol=1e-10,
+        )
+        for row in range(3):
+            np.testing.assert_allclose(
+                contributions.iloc[row],
+                _brute_force_shapley(model, X.to_numpy(np.float32)[row]),
+                atol=1e-10,
+            )
+
+    def test_missing_values_unseen_in_training(self, model, training_data):
+        """Test additivity when missing values only occur in scored rows."""
+        X_train, _ = training_data
+        X = X_train.head(20).astype(float)
+        X.iloc[::2, 0] = np.nan
+
+        contributions, base_value = explain_predictions(model, X)
+
+        np.testing.assert_allclose(
+            contributions.sum(axis=1) + base_value,
+            model.predict_proba(X)[:, 1],
+            atol=1e-10,
+        )
+
+    def test_unused_feature_has_no_contribution(self, model, training_data):
+        """Test that a feature never used for splitting contributes 0."""
+        X_train, _ = training_data
+
+        contributions, _ = explain_predictions(model, X_train)
+
+        assert (contributions["Constant"] == 0).all()
+
+    def test_duplicated_rows_are_explained_once(self, model, training_data):
+        """Test that identical rows share one cached explanation."""
+        X_train, _ = training_data
+        tree_explanations._CONTRIBUTION_CACHE.clear()
+        X = pd.concat([X_train] * 5, ignore_index=True)
+
+        contributions, _ = explain_predictions(model, X)
+
+        n_unique = len(X_train.drop_duplicates())
+        assert len(tree_explanations._CONTRIBUTION_CACHE) == n_unique
+        copies = contributions.to_numpy().reshape(5, len(X_train), -1)
+        assert (copies == copies[0]).all()
+
+    def test_cached_contributions_are_reused(self, model, training_data):
+        """Test that a second call does not recompute contributions."""
+        X_train, _ = training_data
+        first, _ = explain_predictions(model, X_train)
+
+        tree_explanations.build_leaf_table = None
+        try:
+            second, _ = explain_predictions(model, X_train)
+        finally:
+            tree_explanations.build_leaf_table = build_leaf_table
+
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_non_forest_model_raises(self, training_data):
+        """Test that models without decision trees are rejected."""
+        X_train, y_train = training_data
+        model = train_hist_gradient_boosting(X_train, y_train, {"max_iter": 5})
+
+        with pytest.raises(ValueError):
+            explain_predictions(model, X_train)
+
+
+class TestContributionImportance:
+    """Tests for contribution importance functions."""
+
+    def test_contribution_importance_order(self):
+        """Test that importance is the mean absolute contribution."""
+        contributions = pd.DataFrame({"a": [0.1, -0.1], "b": [-0.3, 0.5]})
+
+        importance = contribution_importance(contributions)
+
+        assert list(importance) == ["b", "a"]
+        assert importance["b"] == pytest.approx(0.4)
+
+    def test_get_model_info_includes_importance(self, model, training_data):
+        """Test that stored importance is reported by get_model_info."""
+        X_train, _ = training_data
+        assert "contribution_importance" not in get_model_info(model)
+
+        contributions, _ = explain_predictions(model, X_train)
+        store_contribution_importance(model, contribution_importance(contributions))
+
+        info = get_model_info(model)
+        assert set(info["contribution_importance"]) == set(X_train.columns)